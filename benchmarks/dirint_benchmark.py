@@ -0,0 +1,95 @@
+# coding=utf-8
+"""Benchmark the DIRINT model over a full year of hourly weather data.
+
+The previous implementation rebuilt the nested 6x6x7x5 list of coefficients
+on every call and binned the inputs with about 23 passes over the hours. The
+current one looks up a flat module-level table after binning all four inputs
+in a single pass.
+
+Usage from the root of the repository:
+
+.. code-block:: shell
+
+    PYTHONPATH=. python benchmarks/dirint_benchmark.py
+"""
+from __future__ import division, print_function
+
+import os
+import timeit
+
+from ladybug.epw import EPW
+from ladybug.sunpath import Sunpath
+from ladybug.skymodel import dirint, _get_dirint_coeffs, _dirint_coeff_indices, \
+    _DIRINT_COEFFS
+
+EPW_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures',
+                        'epw', 'chicago.epw')
+
+
+def _lookup_before(ktp, alt, w, dktp):
+    """The previous multi-pass binning and nested lookup of the coefficients."""
+    it = range(len(ktp))
+    ktp_bin = [-1] * len(ktp)
+    for b, (lo, hi) in enumerate(((0, 0.24), (0.24, 0.4), (0.4, 0.56),
+                                  (0.56, 0.7), (0.7, 0.8))):
+        ktp_bin = [b if lo <= ktp[i] < hi else ktp_bin[i] for i in it]
+    ktp_bin = [5 if 0.8 <= ktp[i] <= 1 else ktp_bin[i] for i in it]
+    alt_bin = [-1] * len(alt)
+    for b, (hi, lo) in enumerate(((90, 65), (65, 50), (50, 35), (35, 20), (20, 10))):
+        alt_bin = [b if lo < alt[i] <= hi else alt_bin[i] for i in it]
+    alt_bin = [5 if alt[i] <= 10 else alt_bin[i] for i in it]
+    w_bin = [-1] * len(w)
+    for b, (lo, hi) in enumerate(((0, 1), (1, 2), (2, 3))):
+        w_bin = [b if lo <= w[i] < hi else w_bin[i] for i in it]
+    w_bin = [3 if w[i] >= 3 else w_bin[i] for i in it]
+    w_bin = [4 if w[i] == -1 else w_bin[i] for i in it]
+    dktp_bin = [-1] * len(dktp)
+    for b, (lo, hi) in enumerate(((0, 0.015), (0.015, 0.035), (0.035, 0.07),
+                                  (0.07, 0.15), (0.15, 0.3))):
+        dktp_bin = [b if lo <= dktp[i] < hi else dktp_bin[i] for i in it]
+    dktp_bin = [5 if 0.3 <= dktp[i] <= 1 else dktp_bin[i] for i in it]
+    dktp_bin = [6 if dktp[i] == -1 else dktp_bin[i] for i in it]
+    coeffs = _get_dirint_coeffs()
+    return [coeffs[ktp_bin[i]][alt_bin[i]][dktp_bin[i]][w_bin[i]] for i in it]
+
+
+def _lookup_after(ktp, alt, w, dktp):
+    """The current single-pass binning and flat lookup of the coefficients."""
+    return [_DIRINT_COEFFS[i] for i in _dirint_coeff_indices(ktp, alt, w, dktp)]
+
+
+def main(repeat=5):
+    epw = EPW(EPW_PATH)
+    sp = Sunpath.from_location(epw.location)
+    datetimes = epw.global_horizontal_radiation.datetimes
+    altitudes = [sp.calculate_sun_from_hoy(dt.hoy).altitude for dt in datetimes]
+    doys = [dt.doy for dt in datetimes]
+    ghi = list(epw.global_horizontal_radiation.values)
+    pressures = list(epw.atmospheric_station_pressure.values)
+    temp_dew = list(epw.dew_point_temperature.values)
+
+    # synthetic inputs that cover every bin of the coefficient table
+    count = len(ghi)
+    ktp = [(i % 110) / 100 for i in range(count)]
+    alt = [(i % 100) - 5 for i in range(count)]
+    w = [-1 if i % 9 == 0 else (i % 40) / 10 for i in range(count)]
+    dktp = [-1 if i % 11 == 0 else (i % 35) / 30 for i in range(count)]
+    assert _lookup_before(ktp, alt, w, dktp) == _lookup_after(ktp, alt, w, dktp)
+
+    before = min(timeit.repeat(
+        lambda: _lookup_before(ktp, alt, w, dktp), number=1, repeat=repeat))
+    after = min(timeit.repeat(
+        lambda: _lookup_after(ktp, alt, w, dktp), number=1, repeat=repeat))
+    total = min(timeit.repeat(
+        lambda: dirint(ghi, altitudes, doys, pressures, temp_dew=temp_dew),
+        number=1, repeat=repeat))
+
+    print('hours: {}'.format(count))
+    print('coefficient lookup before: {:.4f} s'.format(before))
+    print('coefficient lookup after:  {:.4f} s'.format(after))
+    print('lookup speedup: {:.1f}x'.format(before / after))
+    print('full-year dirint: {:.4f} s'.format(total))
+
+
+if __name__ == '__main__':
+    main()
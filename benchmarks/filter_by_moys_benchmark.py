@@ -0,0 +1,61 @@
+# coding=utf-8
+"""Benchmark filtering a half-year discontinuous collection by analysis period.
+
+The previous implementation tested each datetime against the tuple of moys
+(O(n*m)). The current one tests each datetime against a hash set (O(n+m)).
+
+Usage from the root of the repository:
+
+.. code-block:: shell
+
+    PYTHONPATH=. python benchmarks/filter_by_moys_benchmark.py
+"""
+from __future__ import division, print_function
+
+import timeit
+
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.header import Header
+from ladybug.datacollection import HourlyContinuousCollection
+from ladybug.datatype.temperature import Temperature
+
+
+def _filter_by_moys_before(collection, moys):
+    """The previous O(n*m) filter that tested membership against a sequence."""
+    _filt_values = []
+    _filt_datetimes = []
+    for i, d in enumerate(collection.datetimes):
+        if d.moy in moys:
+            _filt_datetimes.append(d)
+            _filt_values.append(collection._values[i])
+    return _filt_values, _filt_datetimes
+
+
+def main(repeat=3):
+    # build a discontinuous collection over the first half of the year
+    half_year = AnalysisPeriod(1, 1, 0, 6, 30, 23, timestep=4)
+    header = Header(Temperature(), 'C', half_year)
+    values = [i % 40 for i in range(len(half_year.moys))]
+    coll = HourlyContinuousCollection(header, values)
+    coll = coll.filter_by_pattern([True, True, False])
+    filter_period = AnalysisPeriod(3, 1, 8, 5, 31, 18, timestep=4)
+    moys = filter_period.moys
+    coll.datetimes  # make sure that datetimes are cached before timing
+
+    before = min(timeit.repeat(
+        lambda: _filter_by_moys_before(coll, moys), number=1, repeat=repeat))
+    after = min(timeit.repeat(
+        lambda: coll.filter_by_analysis_period(filter_period),
+        number=1, repeat=repeat))
+    assert tuple(_filter_by_moys_before(coll, moys)[0]) == \
+        coll.filter_by_analysis_period(filter_period).values
+
+    print('values in collection: {}'.format(len(coll)))
+    print('moys in filter period: {}'.format(len(moys)))
+    print('before: {:.3f} s'.format(before))
+    print('after:  {:.3f} s'.format(after))
+    print('speedup: {:.0f}x'.format(before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# coding=utf-8
+"""Measure the memory used by many instances of the core value objects.
+
+The objects measured here use __slots__ instead of a per-instance __dict__.
+Run this script on revisions before and after that change to compare them.
+
+Usage from the root of the repository (Python 3):
+
+.. code-block:: shell
+
+    PYTHONPATH=. python benchmarks/slots_memory_benchmark.py
+"""
+from __future__ import division, print_function
+
+import tracemalloc
+
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.header import Header
+from ladybug.datacollection import HourlyContinuousCollection, DailyCollection
+from ladybug.color import Color, ColorRange
+from ladybug.location import Location
+from ladybug.legend import LegendParameters
+from ladybug.datatype.temperature import Temperature
+
+
+def _measure(name, factory, count):
+    """Print the average number of bytes allocated for each object of a factory."""
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    objs = [factory(i) for i in range(count)]
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in end.compare_to(start, 'filename'))
+    print('{:<30} {:>8.0f} bytes per object'.format(name, total / count))
+    return objs
+
+
+def main(count=20000):
+    a_per = AnalysisPeriod(1, 1, 0, 1, 1, 23)
+    header = Header(Temperature(), 'C', a_per)
+    values = list(range(24))
+    colors = [Color(0, 0, 0), Color(255, 255, 255)]
+
+    _measure('AnalysisPeriod', lambda i: AnalysisPeriod(1, 1, 0, 1, 1, 23), count)
+    _measure('HourlyContinuousCollection',
+             lambda i: HourlyContinuousCollection(header, values), count)
+    _measure('DailyCollection', lambda i: DailyCollection(header, [i], [1]), count)
+    _measure('Color', lambda i: Color(i % 255, 0, 0), count)
+    _measure('ColorRange', lambda i: ColorRange(colors, [0, i]), count)
+    _measure('Location', lambda i: Location(), count)
+    _measure('LegendParameters', lambda i: LegendParameters(0, i), count)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,12 +5,15 @@ from __future__ import division
 
 from .header import Header
 from .datatype.base import DataTypeBase
+from .collectionexpression import CollectionExpression
 
 try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
     from collections import Iterable  # python >= 3.8
 from string import ascii_lowercase
+from array import array
+import base64
 import math
 import sys
 try:
@@ -33,6 +36,8 @@ class BaseCollection(object):
     _collection_type = None
     _mutable = True
     _enumeration = None
+    _VALUESFORMATS = {'int32': 'i', 'float64': 'd', 'mixed64': 'm'}
+    _VALUESFORMAT_NAMES = {'i': 'int32', 'd': 'float64', 'm': 'mixed64'}
 
     def __init__(self, header, values, datetimes):
         """Initialize base collection.
@@ -64,11 +69,16 @@ class BaseCollection(object):
             "validated_a_period": True  # Boolean for whether header analysis_period
                                         # is valid
             }
+
+        Note that the values can also be a base64 string of packed binary values
+        produced by to_dict(compact=True), in which case the dictionary also has a
+        "values_format" key.
         """
         assert 'header' in data, 'Required keyword "header" is missing!'
         assert 'values' in data, 'Required keyword "values" is missing!'
         assert 'datetimes' in data, 'Required keyword "datetimes" is missing!'
-        coll = cls(Header.from_dict(data['header']), data['values'], data['datetimes'])
+        coll = cls(Header.from_dict(data['header']), cls._values_from_dict(data),
+                   data['datetimes'])
         if 'validated_a_period' in data:
             coll._validated_a_period = data['validated_a_period']
         return coll
@@ -372,15 +382,42 @@ class BaseCollection(object):
         collection._validated_a_period = self._validated_a_period
         return collection
 
-    def to_dict(self):
-        """Convert Data Collection to a dictionary."""
-        return {
+    def lazy(self):
+        """Get a CollectionExpression to perform lazy arithmetic with this collection.
+
+        Arithmetic operators used with the expression only build an expression
+        tree, which is evaluated in a single pass once values are requested
+        or the evaluate() method is called. The result is identical to that of
+        the same arithmetic with the Data Collections but it avoids the creation
+        of an intermediate collection for each operator.
+
+        Usage:
+
+        .. code-block:: python
+
+            far_minus_dpt = (dbt.lazy() * 1.8 + 32 - dpt) / rh
+            result = far_minus_dpt.evaluate()
+        """
+        return CollectionExpression(self)
+
+    def to_dict(self, compact=False):
+        """Convert Data Collection to a dictionary.
+
+        Args:
+            compact: Boolean to note whether the numerical values should be
+                encoded as a base64 string of packed binary values, which is
+                much smaller when serialized to JSON. (Default: False).
+        """
+        base = {
             'header': self.header.to_dict(),
             'values': self._values,
             'datetimes': self.datetimes,
             'validated_a_period': self._validated_a_period,
             'type': 'BaseCollection'
         }
+        if compact:
+            self._compact_values(base)
+        return base
 
     @staticmethod
     def filter_collections_by_statement(data_collections, statement):
@@ -560,6 +597,86 @@ class BaseCollection(object):
                     )
         return correct_var
 
+    @staticmethod
+    def _pack_array(values, typecode):
+        """Pack a list of numbers into bytes of little-endian binary values.
+
+        Args:
+            values: A list of numbers.
+            typecode: Text for the array typecode of the values ('i' or 'd').
+                This can also be 'm' for a mix of 32-bit integers and floats, which
+                are packed as 'd' followed by one bit per value that is set for
+                the integers.
+        """
+        if typecode == 'm':
+            int_mask = bytearray((len(values) + 7) // 8)
+            for i, v in enumerate(values):
+                if type(v) is int:
+                    int_mask[i >> 3] |= 1 << (i & 7)
+            return BaseCollection._pack_array(values, 'd') + bytes(int_mask)
+        arr = array(typecode, values)
+        if sys.byteorder == 'big':
+            arr.byteswap()
+        try:
+            return arr.tobytes()  # python 3
+        except AttributeError:
+            return arr.tostring()  # python 2
+
+    @staticmethod
+    def _unpack_array(raw, typecode):
+        """Unpack a list of numbers from bytes produced by _pack_array.
+
+        Args:
+            raw: Bytes of little-endian binary values.
+            typecode: Text for the array typecode of the values ('i', 'd' or 'm').
+        """
+        if typecode == 'm':
+            count = 8 * len(raw) // 65  # 8 bytes and 1 bit for each value
+            values = BaseCollection._unpack_array(raw[:8 * count], 'd')
+            int_mask = bytearray(raw[8 * count:])
+            return [int(v) if int_mask[i >> 3] >> (i & 7) & 1 else v
+                    for i, v in enumerate(values)]
+        arr = array(typecode)
+        try:
+            arr.frombytes(raw)  # python 3
+        except AttributeError:
+            arr.fromstring(raw)  # python 2
+        if sys.byteorder == 'big':
+            arr.byteswap()
+        return arr.tolist()
+
+    @staticmethod
+    def _encode_array(values, typecode):
+        """Encode a list of numbers as a base64 string of little-endian binary values.
+
+        Args:
+            values: A list of numbers.
+            typecode: Text for the array typecode of the values ('i' or 'd').
+        """
+        raw = BaseCollection._pack_array(values, typecode)
+        return base64.b64encode(raw).decode('ascii')
+
+    @staticmethod
+    def _decode_array(string, typecode):
+        """Decode a list of numbers from a string produced by _encode_array.
+
+        Args:
+            string: A base64 string of little-endian binary values.
+            typecode: Text for the array typecode of the values ('i' or 'd').
+        """
+        return BaseCollection._unpack_array(base64.b64decode(string), typecode)
+
+    @staticmethod
+    def _values_from_dict(data):
+        """Get a list of values from a Data Collection dictionary.
+
+        This decodes the values if they were encoded with to_dict(compact=True).
+        """
+        if 'values_format' not in data:
+            return data['values']
+        typecode = BaseCollection._VALUESFORMATS[data['values_format']]
+        return BaseCollection._decode_array(data['values'], typecode)
+
     @staticmethod
     def _remove_operators(statement):
         """Remove logical operators from a statement."""
@@ -822,6 +939,47 @@ class BaseCollection(object):
         d1 = key(vals[int(c)]) * (k - f)
         return d0 + d1
 
+    def _values_typecode(self):
+        """Get the array typecode that can store the values of this collection.
+
+        This is 'i' if all values are integers that fit into 32 bits, 'd' if all
+        values are floats, 'm' if the values are a mix of floats and integers that
+        fit into 32 bits (all of which are exact as floats) and None otherwise,
+        in which case the values cannot be packed without changing them.
+        """
+        vals = self._values
+        types = set(type(v) for v in vals)
+        if types <= {float}:
+            return 'd'
+        if not types <= {int, float}:
+            return None
+        ints = [v for v in vals if type(v) is int]
+        if not -2147483648 <= min(ints) or not max(ints) <= 2147483647:
+            return None
+        return 'i' if types == {int} else 'm'
+
+    def _compact_values(self, base):
+        """Encode the values of a Data Collection dictionary as packed binary values.
+
+        The values are left as they are if they cannot be packed.
+        """
+        typecode = self._values_typecode()
+        if typecode is not None:
+            base['values'] = self._encode_array(self._values, typecode)
+            base['values_format'] = self._VALUESFORMAT_NAMES[typecode]
+
+    def _new_from_values(self, values):
+        """Get a collection like this one with the same header but new values."""
+        return self.__class__(self.header, values, self.datetimes)
+
+    def _broadcast_values(self, other):
+        """Get values of a coarser collection aligned with the values of this one.
+
+        This returns None by default, meaning that the other collection must be
+        aligned with this one for arithmetic operations.
+        """
+        return None
+
     def _average(self, vals):
         return sum(vals) / len(vals)
 
@@ -834,17 +992,39 @@ class BaseCollection(object):
         return percentile_function
 
     def _get_mutable_enumeration(self):
-        self._enumeration = {'mutable': {}, 'immutable': {}}
+        # stored on the class since collection instances do not have a __dict__
+        enumeration = {'mutable': {}, 'immutable': {}}
         for clss in self._all_subclasses(BaseCollection):
             if clss._mutable:
-                self._enumeration['mutable'][clss._collection_type] = clss
+                enumeration['mutable'][clss._collection_type] = clss
             else:
-                self._enumeration['immutable'][clss._collection_type] = clss
+                enumeration['immutable'][clss._collection_type] = clss
+        BaseCollection._enumeration = enumeration
 
     def _all_subclasses(self, clss):
         return set(clss.__subclasses__()).union(
             [s for c in clss.__subclasses__() for s in self._all_subclasses(c)])
 
+    def _reduced_datetimes(self):
+        """Get a compact version of the datetimes of this collection for pickling."""
+        return self._datetimes
+
+    @staticmethod
+    def _restored_datetimes(datetimes):
+        """Get the datetimes of a collection from the output of _reduced_datetimes."""
+        return datetimes
+
+    def __reduce__(self):
+        # pickle packed values and compact datetimes instead of the full objects
+        typecode = self._values_typecode()
+        values = self._pack_array(self._values, typecode) \
+            if typecode is not None else self._values
+        args = (self.__class__, self._header, typecode, values,
+                self._reduced_datetimes(), self._validated_a_period)
+        state = getattr(self, '__dict__', None)
+        return (_rebuild_collection, args, state) if state else \
+            (_rebuild_collection, args)
+
     def __len__(self):
         return len(self._values)
 
@@ -861,71 +1041,131 @@ class BaseCollection(object):
         return item in self._values
 
     def __add__(self, other):
-        new_vals = self._add_values(other)
-        return self.__class__(self.header, new_vals, self.datetimes)
+        if isinstance(other, CollectionExpression):
+            return NotImplemented
+        return self._new_from_values(self._add_values(other))
 
     def __sub__(self, other):
-        new_vals = self._sub_values(other)
-        return self.__class__(self.header, new_vals, self.datetimes)
+        if isinstance(other, CollectionExpression):
+            return NotImplemented
+        return self._new_from_values(self._sub_values(other))
 
     def __mul__(self, other):
-        new_vals = self._mul_values(other)
-        return self.__class__(self.header, new_vals, self.datetimes)
+        if isinstance(other, CollectionExpression):
+            return NotImplemented
+        return self._new_from_values(self._mul_values(other))
 
     def __div__(self, other):
-        new_vals = self._div_values(other)
-        return self.__class__(self.header, new_vals, self.datetimes)
+        if isinstance(other, CollectionExpression):
+            return NotImplemented
+        return self._new_from_values(self._div_values(other))
 
     def __truediv__(self, other):
-        new_vals = self._div_values(other)
-        return self.__class__(self.header, new_vals, self.datetimes)
+        if isinstance(other, CollectionExpression):
+            return NotImplemented
+        return self._new_from_values(self._div_values(other))
 
     def __neg__(self):
-        new_vals = [-v_1 for v_1 in self._values]
-        return self.__class__(self.header, new_vals, self.datetimes)
+        return self._new_from_values([-v_1 for v_1 in self._values])
+
+    def __iadd__(self, other):
+        if not self._mutable:
+            return self.__add__(other)
+        if isinstance(other, CollectionExpression):
+            other = other.evaluate()
+        self._values = self._add_values(other)
+        return self
+
+    def __isub__(self, other):
+        if not self._mutable:
+            return self.__sub__(other)
+        if isinstance(other, CollectionExpression):
+            other = other.evaluate()
+        self._values = self._sub_values(other)
+        return self
+
+    def __imul__(self, other):
+        if not self._mutable:
+            return self.__mul__(other)
+        if isinstance(other, CollectionExpression):
+            other = other.evaluate()
+        self._values = self._mul_values(other)
+        return self
+
+    def __idiv__(self, other):
+        if not self._mutable:
+            return self.__div__(other)
+        if isinstance(other, CollectionExpression):
+            other = other.evaluate()
+        self._values = self._div_values(other)
+        return self
+
+    def __itruediv__(self, other):
+        if not self._mutable:
+            return self.__truediv__(other)
+        if isinstance(other, CollectionExpression):
+            other = other.evaluate()
+        self._values = self._div_values(other)
+        return self
 
     def _add_values(self, other):
         if isinstance(other, (int, float)):
             new_vals = [v_1 + other for v_1 in self._values]
         else:
-            assert self._collection_type == other._collection_type, \
-                '{} cannot be added to {}'.format(self.__class__, other.__class__)
-            assert len(self) == len(other), 'Length of DataCollections must match in ' \
-                'order to add them together. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 + v_2 for v_1, v_2 in zip(self._values, other._values)]
+            other_vals = self._broadcast_values(other)
+            if other_vals is None:
+                assert self._collection_type == other._collection_type, \
+                    '{} cannot be added to {}'.format(self.__class__, other.__class__)
+                assert len(self) == len(other), 'Length of DataCollections must ' \
+                    'match in order to add them together. {} != {}'.format(
+                        len(self), len(other))
+                other_vals = other._values
+            new_vals = [v_1 + v_2 for v_1, v_2 in zip(self._values, other_vals)]
         return new_vals
 
     def _sub_values(self, other):
         if isinstance(other, (int, float)):
             new_vals = [v_1 - other for v_1 in self._values]
         else:
-            assert self._collection_type == other._collection_type, \
-                '{} cannot be subtrated from {}'.format(other.__class__, self.__class__)
-            assert len(self) == len(other), 'Length of DataCollections must match ' \
-                'to subtract one from the other. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 - v_2 for v_1, v_2 in zip(self._values, other._values)]
+            other_vals = self._broadcast_values(other)
+            if other_vals is None:
+                assert self._collection_type == other._collection_type, \
+                    '{} cannot be subtrated from {}'.format(
+                        other.__class__, self.__class__)
+                assert len(self) == len(other), 'Length of DataCollections must ' \
+                    'match to subtract one from the other. {} != {}'.format(
+                        len(self), len(other))
+                other_vals = other._values
+            new_vals = [v_1 - v_2 for v_1, v_2 in zip(self._values, other_vals)]
         return new_vals
 
     def _mul_values(self, other):
         if isinstance(other, (int, float)):
             new_vals = [v_1 * other for v_1 in self._values]
         else:
-            assert self._collection_type == other._collection_type, \
-                '{} cannot be multiplied by {}'.format(other.__class__, self.__class__)
-            assert len(self) == len(other), 'Length of DataCollections must match ' \
-                'to multiply them together. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 * v_2 for v_1, v_2 in zip(self._values, other._values)]
+            other_vals = self._broadcast_values(other)
+            if other_vals is None:
+                assert self._collection_type == other._collection_type, \
+                    '{} cannot be multiplied by {}'.format(
+                        other.__class__, self.__class__)
+                assert len(self) == len(other), 'Length of DataCollections must match ' \
+                    'to multiply them together. {} != {}'.format(len(self), len(other))
+                other_vals = other._values
+            new_vals = [v_1 * v_2 for v_1, v_2 in zip(self._values, other_vals)]
         return new_vals
 
     def _div_values(self, other):
         if isinstance(other, (int, float)):
             new_vals = [v_1 / other for v_1 in self._values]
         else:
-            assert self._collection_type == other._collection_type, \
-                '{} cannot be divided by {}'.format(other.__class__, self.__class__)
-            assert len(self) == len(other), 'Length of DataCollections must match ' \
-                'to divide them. {} != {}'.format(len(self), len(other))
-            new_vals = [v_1 / v_2 for v_1, v_2 in zip(self._values, other._values)]
+            other_vals = self._broadcast_values(other)
+            if other_vals is None:
+                assert self._collection_type == other._collection_type, \
+                    '{} cannot be divided by {}'.format(other.__class__, self.__class__)
+                assert len(self) == len(other), 'Length of DataCollections must match ' \
+                    'to divide them. {} != {}'.format(len(self), len(other))
+                other_vals = other._values
+            new_vals = [v_1 / v_2 for v_1, v_2 in zip(self._values, other_vals)]
         return new_vals
 
     @property
@@ -946,3 +1186,15 @@ class BaseCollection(object):
         """Discontinuous Collection representation."""
         return "Discontinuous Data Collection\n{} ({})\n...{} values...".format(
             self.header.data_type, self.header.unit, len(self._values))
+
+
+def _rebuild_collection(cls, header, typecode, values, datetimes, validated_a_period):
+    """Rebuild a Data Collection from the output of its __reduce__ method."""
+    if typecode is not None:
+        values = BaseCollection._unpack_array(values, typecode)
+    collection = cls.__new__(cls)
+    collection._header = header
+    collection._values = list(values) if cls._mutable else tuple(values)
+    collection._datetimes = cls._restored_datetimes(datetimes)
+    collection._validated_a_period = validated_a_period
+    return collection
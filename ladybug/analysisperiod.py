@@ -52,6 +52,12 @@ class AnalysisPeriod(object):
         * is_reversed
     """
 
+    __slots__ = ('_st_time', '_end_time', '_timestep', '_is_leap_year',
+                 '_num_of_days_each_month', '_is_overnight', '_is_reversed',
+                 '_minute_intervals', '_timestamps_data', '_key', '_hash')
+    _INTERNED = {}  # shared instances by their input parameters
+    _TIMESTAMPS = {}  # shared tuples of moys by analysis period key
+
     VALIDTIMESTEPS = {1: 60, 2: 30, 3: 20, 4: 15, 5: 12,
                       6: 10, 10: 6, 12: 5, 15: 4, 20: 3, 30: 2, 60: 1}
     NUMOFDAYSEACHMONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
@@ -107,10 +113,15 @@ class AnalysisPeriod(object):
         self._timestep = timestep
         self._minute_intervals = timedelta(1 / (24.0 * self.timestep))
 
-        # _timestamps_data is a dictionary for datetimes.
-        # key values will be minute of year
+        # _timestamps_data is a tuple of the minutes of the year in the period.
         self._timestamps_data = None  # set to None for now and calculate upon request
 
+        # the analysis period is immutable so its key and hash can be computed once
+        self._key = (self._st_time.month, self._st_time.day, self._st_time.hour,
+                     self._end_time.month, self._end_time.day, self._end_time.hour,
+                     self._timestep, self._is_leap_year)
+        self._hash = hash(self._key)
+
     @classmethod
     def from_dict(cls, data):
         """Create an analysis period from a dictionary.
@@ -144,6 +155,39 @@ class AnalysisPeriod(object):
             data['end_day'], data['end_hour'], data['timestep'],
             data['is_leap_year'])
 
+    @classmethod
+    def interned(cls, st_month=1, st_day=1, st_hour=0, end_month=12,
+                 end_day=31, end_hour=23, timestep=1, is_leap_year=False):
+        """Get a shared AnalysisPeriod instance for a set of parameters.
+
+        The same instance is returned every time this method is called with
+        equivalent parameters. This saves the creation of new objects for the
+        analysis periods that are used over and over again (eg. the annual
+        period) and makes the comparison of such periods an identity check.
+        Since AnalysisPeriods are immutable, the shared instance can be used
+        anywhere that a new AnalysisPeriod would be used.
+
+        Args:
+            st_month: An integer between 1-12 for starting month (default = 1)
+            st_day: An integer between 1-31 for starting day (default = 1).
+            st_hour: An integer between 0-23 for starting hour (default = 0)
+            end_month: An integer between 1-12 for ending month (default = 12)
+            end_day: An integer between 1-31 for ending day (default = 31)
+            end_hour: An integer between 0-23 for ending hour (default = 23)
+            timestep: An integer number from 1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30, 60
+            is_leap_year: A boolean to indicate whether the AnalysisPeriod
+                represents a leap year.
+        """
+        params = (cls, st_month, st_day, st_hour, end_month, end_day, end_hour,
+                  timestep, is_leap_year)
+        try:
+            return cls._INTERNED[params]
+        except KeyError:  # first time that these parameters are requested
+            a_per = cls(*params[1:])
+            a_per = cls._INTERNED.setdefault((cls,) + a_per._key, a_per)
+            cls._INTERNED[params] = a_per
+            return a_per
+
     @classmethod
     def from_analysis_period(cls, analysis_period=None):
         """Create and AnalysisPeriod from an analysis period.
@@ -246,7 +290,10 @@ class AnalysisPeriod(object):
 
     @property
     def moys(self):
-        """A sorted list of hourly minutes of year in this analysis period as integers.
+        """A sorted tuple of minutes of year in this analysis period as integers.
+
+        The tuple is computed once per process for each distinct analysis period
+        and shared between all equal instances.
         """
         if self._timestamps_data is None:
             self._calculate_timestamps()
@@ -407,13 +454,20 @@ class AnalysisPeriod(object):
                 self._timestamps_data.append(time.moy)
 
     def _calculate_timestamps(self):
-        """Return a list of Ladybug DateTime in this analysis period."""
+        """Set the tuple of minutes of the year in this analysis period."""
+        try:  # check if an equal analysis period has already computed them
+            self._timestamps_data = AnalysisPeriod._TIMESTAMPS[self._key]
+            return
+        except KeyError:
+            pass
         self._timestamps_data = []
         if not self._is_reversed:
             self._calc_timestamps(self.st_time, self.end_time)
         else:
             self._calc_timestamps(self.st_time, DateTime.from_hoy(8759))
             self._calc_timestamps(DateTime.from_hoy(0), self.end_time)
+        self._timestamps_data = tuple(self._timestamps_data)
+        AnalysisPeriod._TIMESTAMPS[self._key] = self._timestamps_data
 
     def _calc_daystamps(self, st_time, end_time):
         """Calculate days of the year between start time and end time.
@@ -424,6 +478,12 @@ class AnalysisPeriod(object):
         end_doy = sum(self._num_of_days_each_month[:end_time.month-1]) + end_time.day + 1
         return list(range(start_doy, end_doy))
 
+    def __reduce__(self):
+        # pickle only the parameters and not the cached timestamps
+        return (AnalysisPeriod, (self.st_month, self.st_day, self.st_hour,
+                                 self.end_month, self.end_day, self.end_hour,
+                                 self.timestep, self.is_leap_year))
+
     def __len__(self):
         """Number of hours of the year.
 
@@ -451,15 +511,12 @@ class AnalysisPeriod(object):
              self.st_time.hour, self.end_time.hour,
              self.timestep)
 
-    def __key(self):
-        return(self.st_time, self.end_time, self.timestep, self.is_leap_year)
-
-    
     def __hash__(self):
-        return hash(self.__key())
-    
+        return self._hash
+
     def __eq__(self, other):
-        return isinstance(other, AnalysisPeriod) and self.__key() == other.__key()
-    
+        return self is other or \
+            (isinstance(other, AnalysisPeriod) and self._key == other._key)
+
     def __ne__(self, other):
-        return not self.__eq__(other)
\ No newline at end of file
+        return not self.__eq__(other)
@@ -0,0 +1,223 @@
+# coding=utf-8
+"""Lazy arithmetic expressions of Ladybug Data Collections.
+
+A CollectionExpression is obtained from the lazy() method of any Data Collection.
+Arithmetic with the expression does not compute any values but instead records
+an expression tree. All of the operations of the tree are fused into a single
+loop over the values, which runs only once the values are requested. This avoids
+the creation of a full intermediate collection for each operator of a formula.
+"""
+from __future__ import division
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    pass  # python 3
+
+
+class CollectionExpression(object):
+    """A lazy arithmetic expression over one or more Data Collections.
+
+    The result of the expression is identical to that of the same arithmetic
+    performed with the Data Collections themselves. It is a Data Collection of
+    the same class and with the same header as the first collection in the
+    expression that is on the left side of an operator.
+
+    Note that the values of the collections are read when the expression is
+    evaluated and not when it is created.
+
+    Args:
+        collection: A Data Collection to be used as the start of the expression.
+
+    Properties:
+        * header
+        * datetimes
+        * values
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.epw import EPW
+
+        epw = EPW('./epws/denver.epw')
+        dbt, dpt = epw.dry_bulb_temperature, epw.dew_point_temperature
+        expression = (dbt.lazy() * 1.8 + 32 - dpt) / epw.relative_humidity
+        result = expression.evaluate()  # all operators are computed in one pass
+    """
+    __slots__ = ('_anchor', '_tree', '_result')
+
+    def __init__(self, collection, _tree=None):
+        """Initialize collection expression."""
+        assert hasattr(collection, '_collection_type'), 'Expected Data Collection ' \
+            'for CollectionExpression. Got {}.'.format(type(collection))
+        self._anchor = collection
+        self._tree = ('col', collection) if _tree is None else _tree
+        self._result = None
+
+    @property
+    def header(self):
+        """The Ladybug Header of the result of the expression."""
+        return self._anchor.header
+
+    @property
+    def datetimes(self):
+        """The datetimes of the result of the expression."""
+        return self._anchor.datetimes
+
+    @property
+    def values(self):
+        """The values that result from the expression."""
+        return self._evaluated().values
+
+    def evaluate(self):
+        """Compute the values of the expression in one pass.
+
+        Return:
+            A new Data Collection with the result of the expression.
+        """
+        names, args = {}, {}
+        body = self._source(self._tree, names, args)
+        seqs = sorted(names.values())
+        items = ['_v{}'.format(name[2:]) for name in seqs]
+        if len(seqs) == 1:
+            code = '[{} for {} in {}]'.format(body, items[0], seqs[0])
+        else:
+            code = '[{} for {} in zip({})]'.format(
+                body, ', '.join(items), ', '.join(seqs))
+        args['zip'] = zip
+        values = eval(code, args)
+
+        self._result = self._anchor._new_from_values(values)
+        return self._result
+
+    def _evaluated(self):
+        """Get the result of the expression, evaluating it only if not yet done."""
+        return self._result if self._result is not None else self.evaluate()
+
+    def _combine(self, other, operator, reflected=False):
+        """Get a new expression that combines this one with another operand."""
+        if isinstance(other, (int, float)):
+            o_anchor, o_tree = None, ('num', other)
+        elif isinstance(other, CollectionExpression):
+            o_anchor, o_tree = other._anchor, other._tree
+        elif hasattr(other, '_collection_type'):
+            o_anchor, o_tree = other, ('col', other)
+        else:
+            return NotImplemented
+
+        l_anchor, l_tree, r_anchor, r_tree = self._anchor, self._tree, o_anchor, o_tree
+        if reflected:
+            l_anchor, l_tree, r_anchor, r_tree = r_anchor, r_tree, l_anchor, l_tree
+        if l_anchor is None:
+            return CollectionExpression(r_anchor, (operator, l_tree, r_tree))
+        if r_anchor is not None:
+            r_tree = self._aligned_tree(l_anchor, r_anchor, r_tree, operator)
+        return CollectionExpression(l_anchor, (operator, l_tree, r_tree))
+
+    @staticmethod
+    def _aligned_tree(anchor, other, tree, operator):
+        """Check that an operand can be combined with a collection.
+
+        Operands of a coarser collection type are evaluated and broadcast to
+        the datetimes of the anchor collection, just as they would be without
+        the lazy expression.
+        """
+        if anchor._collection_type == other._collection_type:
+            assert len(anchor) == len(other), 'Length of DataCollections must ' \
+                'match for the "{}" operator. {} != {}'.format(
+                    operator, len(anchor), len(other))
+            return tree
+        other_coll = tree[1] if tree[0] == 'col' \
+            else CollectionExpression(other, tree).evaluate()
+        values = anchor._broadcast_values(other_coll)
+        assert values is not None, 'The "{}" operator cannot be used with {} and ' \
+            '{}'.format(operator, anchor.__class__, other.__class__)
+        return ('vals', values)
+
+    @staticmethod
+    def _source(tree, names, args):
+        """Get the Python source code to compute one value of an expression tree.
+
+        Args:
+            tree: The expression tree to be translated.
+            names: A dictionary to be populated with the name of the argument
+                for each sequence of values used in the tree.
+            args: A dictionary to be populated with the arguments needed to
+                evaluate the source code.
+        """
+        kind = tree[0]
+        if kind == 'col' or kind == 'vals':
+            seq = tree[1]._values if kind == 'col' else tree[1]
+            try:
+                name = names[id(seq)]
+            except KeyError:
+                name = names[id(seq)] = '_s{}'.format(len(names))
+                args[name] = seq
+            return '_v{}'.format(name[2:])
+        elif kind == 'num':
+            name = '_k{}'.format(len(args))
+            args[name] = tree[1]
+            return name
+        elif kind == 'neg':
+            return '(-{})'.format(CollectionExpression._source(tree[1], names, args))
+        return '({} {} {})'.format(
+            CollectionExpression._source(tree[1], names, args), kind,
+            CollectionExpression._source(tree[2], names, args))
+
+    def __add__(self, other):
+        return self._combine(other, '+')
+
+    def __radd__(self, other):
+        return self._combine(other, '+', True)
+
+    def __sub__(self, other):
+        return self._combine(other, '-')
+
+    def __rsub__(self, other):
+        return self._combine(other, '-', True)
+
+    def __mul__(self, other):
+        return self._combine(other, '*')
+
+    def __rmul__(self, other):
+        return self._combine(other, '*', True)
+
+    def __div__(self, other):
+        return self._combine(other, '/')
+
+    def __rdiv__(self, other):
+        return self._combine(other, '/', True)
+
+    def __truediv__(self, other):
+        return self._combine(other, '/')
+
+    def __rtruediv__(self, other):
+        return self._combine(other, '/', True)
+
+    def __neg__(self):
+        return CollectionExpression(self._anchor, ('neg', self._tree))
+
+    def __len__(self):
+        return len(self._anchor)
+
+    def __getitem__(self, key):
+        return self._evaluated()[key]
+
+    def __iter__(self):
+        return iter(self._evaluated())
+
+    def __getattr__(self, name):
+        # any other attribute of a Data Collection requires the evaluated values
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._evaluated(), name)
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Collection expression representation."""
+        return 'Collection Expression\n{}\n{}'.format(
+            self._source(self._tree, {}, {}), self._anchor.header)
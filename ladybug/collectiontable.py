@@ -0,0 +1,297 @@
+# coding=utf-8
+"""Table of aligned Data Collections that share a single time index.
+
+A CollectionTable stores several named Data Collections (columns) that are all
+aligned with one another. The alignment is checked only once upon creation
+of the table and every filtering operation computes the selected rows only
+once before applying them to all of the columns.
+"""
+from __future__ import division
+
+from string import ascii_lowercase
+
+from ._datacollectionbase import BaseCollection
+from .datacollection import HourlyDiscontinuousCollection, \
+    HourlyContinuousCollection, DailyCollection, MonthlyCollection
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    xrange = range  # python 3
+
+
+class CollectionTable(object):
+    """A table of named, aligned Data Collections sharing one time index.
+
+    The input Data Collections are used as the columns of the table without
+    being copied. So editing the values of a column edits the original collection.
+
+    Args:
+        data_collections: A list of aligned Data Collections to be used as the
+            columns of the table.
+        names: An optional list of unique text names for each of the columns.
+            If None, the name of each Data Collection's data type will be used.
+
+    Properties:
+        * names
+        * columns
+        * analysis_period
+        * datetimes
+        * is_continuous
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.epw import EPW
+
+        epw = EPW('./epws/denver.epw')
+        table = epw.to_collection_table((6, 8, 21))
+        windy_hot = table.filter_by_conditional_statement('a > 25 and c > 3')
+        print(windy_hot['Relative Humidity'].average)
+    """
+    __slots__ = ('_names', '_columns', '_name_map')
+
+    def __init__(self, data_collections, names=None):
+        """Initialize collection table."""
+        columns = tuple(data_collections)
+        assert len(columns) > 0, 'CollectionTable must have at least one column.'
+        for coll in columns:
+            assert isinstance(coll, BaseCollection), 'Expected Data Collection ' \
+                'for CollectionTable column. Got {}.'.format(type(coll))
+        BaseCollection.are_collections_aligned(columns)
+
+        if names is None:
+            names = [str(coll.header.data_type) for coll in columns]
+        names = tuple(str(name) for name in names)
+        assert len(names) == len(columns), 'Number of names ({}) does not match ' \
+            'the number of columns ({}).'.format(len(names), len(columns))
+        name_map = {}
+        for i, name in enumerate(names):
+            assert name not in name_map, \
+                'CollectionTable column name "{}" is duplicated.'.format(name)
+            name_map[name] = i
+
+        self._names = names
+        self._columns = columns
+        self._name_map = name_map
+
+    @property
+    def names(self):
+        """Tuple of text for the names of the columns."""
+        return self._names
+
+    @property
+    def columns(self):
+        """Tuple of the Data Collections that make up the columns of the table."""
+        return self._columns
+
+    @property
+    def analysis_period(self):
+        """The AnalysisPeriod shared by all columns of the table."""
+        return self._columns[0].header.analysis_period
+
+    @property
+    def datetimes(self):
+        """Tuple of the datetimes shared by all columns of the table."""
+        return self._columns[0].datetimes
+
+    @property
+    def is_continuous(self):
+        """Boolean denoting whether the columns of the table are continuous."""
+        return self._columns[0].is_continuous
+
+    def column_index(self, name):
+        """Get the index of a column from its name.
+
+        Args:
+            name: Text for the name of a column in the table.
+        """
+        try:
+            return self._name_map[name]
+        except KeyError:
+            raise KeyError('Column "{}" was not found in the CollectionTable. '
+                           'Columns are: {}'.format(name, ', '.join(self._names)))
+
+    def select(self, names):
+        """Get a new table with only some of the columns of this one.
+
+        The columns of the new table are the same objects as this table's columns.
+
+        Args:
+            names: A list of column names or indices to be included in the new table.
+        """
+        indices = self._column_indices(names)
+        return CollectionTable([self._columns[i] for i in indices],
+                               [self._names[i] for i in indices])
+
+    def rows(self):
+        """Get an iterator over tuples with the values of each row in the table."""
+        return zip(*[coll._values for coll in self._columns])
+
+    def filter_by_pattern(self, pattern):
+        """Filter all columns of the table based on a list of booleans.
+
+        Args:
+            pattern: A list of True/False values.  Typically, this is a list
+                with a length matching the number of rows in the table
+                but it can also be a pattern to be repeated over the table.
+
+        Return:
+            A new CollectionTable with filtered columns.
+        """
+        try:
+            _len = len(pattern)
+        except TypeError:
+            raise TypeError("pattern is not a list of Booleans. Got {}".format(
+                type(pattern)))
+        indices = [i for i in xrange(len(self)) if pattern[i % _len]]
+        return self._filtered_table(indices)
+
+    def filter_by_conditional_statement(self, statement, names=None):
+        """Filter all columns of the table based on a conditional statement.
+
+        The statement is evaluated only once for each row of the table.
+
+        Args:
+            statement: A conditional statement as a string (e.g. a>25 and b%5==0).
+                The variables should be named with consecutive letters of the
+                alphabet ('a', 'b', 'c', ...), which map to the columns of the
+                table in order.
+            names: An optional list of up to 26 column names or indices to be
+                mapped to the variables of the statement. If None, the columns of
+                the table will be used in order, such that only the first 26
+                columns can be used in the statement. (Default: None).
+
+        Return:
+            A new CollectionTable with filtered columns.
+        """
+        if names is None:
+            indices = list(xrange(min(len(self._columns), len(ascii_lowercase))))
+        else:
+            if len(names) > len(ascii_lowercase):
+                raise ValueError(
+                    'A conditional statement can use at most {} columns. Got {} '
+                    'names.'.format(len(ascii_lowercase), len(names)))
+            indices = self._column_indices(names)
+        correct_var = BaseCollection._check_conditional_statement(
+            statement, len(indices))
+        funct = eval('lambda {}: {}'.format(', '.join(correct_var), statement), {})
+        values = [self._columns[i]._values for i in indices]
+        row_indices = [i for i, row in enumerate(zip(*values)) if funct(*row)]
+        try:
+            return self._filtered_table(row_indices)
+        except AssertionError as e:
+            raise AssertionError('No value meets the conditional statement.'
+                                 '\n{}'.format(e))
+
+    def filter_by_analysis_period(self, analysis_period):
+        """Filter all columns of the table based on an analysis period.
+
+        Args:
+           analysis period: A Ladybug analysis period
+
+        Return:
+            A new CollectionTable with filtered columns.
+        """
+        first = self._columns[0]
+        if not isinstance(first, HourlyDiscontinuousCollection):
+            # match the datetimes in the same way as the filter of each collection
+            datetimes = first.datetimes
+            if isinstance(first, DailyCollection):
+                first._check_analysis_period(analysis_period)
+                selected = set(analysis_period.doys_int)
+            elif isinstance(first, MonthlyCollection):
+                selected = set(analysis_period.months_int)
+            else:  # MonthlyPerHourCollection
+                selected = set(tuple(m_h) for m_h in analysis_period.months_per_hour)
+                datetimes = [tuple(d) for d in datetimes]
+            indices = [i for i, d in enumerate(datetimes) if d in selected]
+            return self._filtered_table(indices, analysis_period)
+
+        first._check_analysis_period(analysis_period)
+        if isinstance(first, HourlyContinuousCollection):
+            analysis_period = first._get_analysis_period_subset(analysis_period)
+            if analysis_period.st_hour == 0 and analysis_period.end_hour == 23:
+                # the result can be continuous; slice the same rows out of each column
+                t_s = 60 / analysis_period.timestep
+                st_ind = int((analysis_period.st_time.moy / t_s) -
+                             (first.header.analysis_period.st_time.moy / t_s))
+                end_ind = int((analysis_period.end_time.moy / t_s) -
+                              (analysis_period.st_time.moy / t_s) + st_ind +
+                              analysis_period.timestep)
+                new_columns = []
+                for coll in self._columns:
+                    _vals = coll._values
+                    _filt_vals = _vals[st_ind:end_ind] if end_ind > st_ind \
+                        else _vals[st_ind:] + _vals[:end_ind]
+                    header = coll.header.duplicate()
+                    header._analysis_period = analysis_period
+                    new_columns.append(HourlyContinuousCollection(header, _filt_vals))
+                return CollectionTable(new_columns, self._names)
+
+        ap_moys = set(analysis_period.moys)
+        indices = [i for i, moy in enumerate(first._datetime_moys()) if moy in ap_moys]
+        return self._filtered_table(indices, analysis_period)
+
+    def duplicate(self):
+        """Return a copy of the table, including a copy of each column."""
+        return self.__copy__()
+
+    def _column_indices(self, names):
+        """Get a list of column indices from a list of names and/or indices."""
+        return [name if isinstance(name, int) else self.column_index(name)
+                for name in names]
+
+    def _filtered_table(self, indices, analysis_period=None):
+        """Get a new table with only the rows at the input indices.
+
+        The datetimes are filtered only once and shared across all new columns.
+        """
+        first = self._columns[0]
+        all_datetimes = first.datetimes
+        _filt_datetimes = tuple(all_datetimes[i] for i in indices)
+        if isinstance(first, HourlyDiscontinuousCollection):
+            col_obj = HourlyDiscontinuousCollection
+        else:
+            if first._enumeration is None:
+                first._get_mutable_enumeration()
+            col_obj = first._enumeration['mutable'][first._collection_type]
+
+        new_columns = []
+        for coll in self._columns:
+            _vals = coll._values
+            header = coll.header.duplicate()
+            if analysis_period is not None:
+                header._analysis_period = analysis_period
+            new_coll = col_obj(header, [_vals[i] for i in indices], _filt_datetimes)
+            new_coll._validated_a_period = coll._validated_a_period
+            new_columns.append(new_coll)
+        return CollectionTable(new_columns, self._names)
+
+    def __copy__(self):
+        return CollectionTable([coll.duplicate() for coll in self._columns],
+                               self._names)
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._columns[key]
+        return self._columns[self.column_index(key)]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __contains__(self, name):
+        return name in self._name_map
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Collection table representation."""
+        return 'Collection Table [{} rows x {} columns]\n{}'.format(
+            len(self), len(self._columns), '\n'.join(self._names))
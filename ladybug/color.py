@@ -167,6 +167,8 @@ class Colorset(object):
                 <R:239, G:156, B:21>, <R:234, G:123, B:0>, <R:234, G:74, B:0>,
                 <R:234, G:38, B:0>]
     """
+    __slots__ = ()
+
     # base color sets for which there are several variations
     _multicolored = [(4, 25, 145), (7, 48, 224), (7, 88, 255), (1, 232, 255),
                      (97, 246, 156), (166, 249, 86), (254, 244, 1), (255, 121, 0),
@@ -439,6 +441,7 @@ class ColorRange(object):
             color_range.color(300)
             >> (R:245, G:239, B:103)
     """
+    __slots__ = ('_colors', '_domain', '_continuous_colors', '_is_domain_set')
 
     def __init__(self, colors=None, domain=None, continuous_colors=True):
         """Initiate Ladybug color range.
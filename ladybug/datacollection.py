@@ -20,6 +20,8 @@ All Data Collections in this module have the ability to:
     * perform unit conversions on the data: to_unit, to_ip, to_si
     * filter based on conditional statements
     * filter based on analysis period
+    * arithmetic operations with numbers, aligned collections or (for hourly
+      collections) Daily, Monthly and MonthlyPerHour collections
 
 The Hourly Continuous Collection should be used for all annual hourly data
 since it possesses the features of the other classes but includes
@@ -36,7 +38,12 @@ from .header import Header
 from .analysisperiod import AnalysisPeriod
 from .dt import DateTime
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from bisect import bisect_right
+try:
+    from math import gcd  # python >= 3.5
+except ImportError:
+    from fractions import gcd  # python 2
 try:
     from collections.abc import Iterable  # python < 3.7
 except ImportError:
@@ -75,7 +82,11 @@ class HourlyDiscontinuousCollection(BaseCollection):
         * values
     """
 
+    __slots__ = ()
     _collection_type = 'HourlyDiscontinuous'
+    _DAYSUNTILMONTH = (
+        (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334),
+        (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335))
 
     def __init__(self, header, values, datetimes):
         """Initialize hourly discontinuous collection.
@@ -107,12 +118,22 @@ class HourlyDiscontinuousCollection(BaseCollection):
                 "validated_a_period": True  # Boolean for whether header
                                             # analysis_period is valid
                 }
+
+        Note that the values and datetimes can also be base64 strings of packed
+        binary values produced by to_dict(compact=True), in which case the
+        dictionary also has "values_format" and "datetimes_format" keys.
         """
         assert 'header' in data, 'Required keyword "header" is missing!'
         assert 'values' in data, 'Required keyword "values" is missing!'
         assert 'datetimes' in data, 'Required keyword "datetimes" is missing!'
-        collection = cls(Header.from_dict(data['header']), data['values'],
-                         [DateTime.from_array(dat) for dat in data['datetimes']])
+        if data.get('datetimes_format') == 'moy':
+            leap_yr = data['datetimes_leap_year']
+            datetimes = [DateTime.from_moy(moy, leap_yr)
+                         for moy in cls._decode_array(data['datetimes'], 'i')]
+        else:
+            datetimes = [DateTime.from_array(dat) for dat in data['datetimes']]
+        collection = cls(Header.from_dict(data['header']),
+                         cls._values_from_dict(data), datetimes)
         if 'validated_a_period' in data:
             collection._validated_a_period = data['validated_a_period']
         return collection
@@ -172,7 +193,7 @@ class HourlyDiscontinuousCollection(BaseCollection):
         Return:
             A new Data Collection with filtered data
         """
-        _filt_values, _filt_datetimes = self._filter_by_moys_slow(moys)
+        _filt_values, _filt_datetimes = self._filter_by_moys(moys)
         collection = HourlyDiscontinuousCollection(
             self.header.duplicate(), _filt_values, _filt_datetimes)
         collection._validated_a_period = self._validated_a_period
@@ -271,44 +292,66 @@ class HourlyDiscontinuousCollection(BaseCollection):
         """
         return self._time_interval_operation('monthlyperhour', 'percentile', percentile)
 
-    def interpolate_holes(self):
+    def interpolate_holes(self, max_gap=None, gap_value=None):
         """Linearly interpolate over holes in this collection to make it continuous.
 
+        Args:
+            max_gap: An optional number for the maximum number of hours of
+                consecutive missing data that will be filled by interpolation.
+                Holes that are longer than this will not be interpolated and
+                will instead be filled with the gap_value. If None, all holes
+                will be interpolated regardless of their length. (Default: None).
+            gap_value: A number used to mark the steps of any hole that is longer
+                than the max_gap (eg. -999). This is required when a max_gap is
+                input such that the result supports math operations. Note that
+                these marked values are included in the results of operations
+                like average or total. (Default: None).
+
         Returns:
             continuous_collection -- A HourlyContinuousCollection with the same data
             as this collection but with missing data filled by means of a
             linear interpolation.
         """
-        # validate analysis_period and use the resulting period to generate datetimes
+        # validate analysis_period and use the resulting period to generate indices
         assert self.validated_a_period, 'validated_a_period property must be' \
             ' True to use interpolate_holes(). Run validate_analysis_period().'
-        mins_per_step = int(60 / self.header.analysis_period.timestep)
-        new_datetimes = self.header.analysis_period.datetimes
-        new_values = []
+        a_per = self.header.analysis_period
+        mins_per_step = int(60 / a_per.timestep)
+        max_steps = None if max_gap is None else max_gap * a_per.timestep
+        assert max_gap is None or isinstance(gap_value, (int, float)), 'A number ' \
+            'must be input for gap_value when max_gap is used. Got {}.'.format(
+                gap_value)
+        st_moy = a_per.st_time.moy
+        year_mins = 527040 if a_per.is_leap_year else 525600
+        indices = [((moy - st_moy) % year_mins) // mins_per_step
+                   for moy in self._datetime_moys()]
+
+        # scatter the known values into a list with a slot for each step.
+        values = self._values
+        new_len = len(a_per.moys)
+        new_values = [gap_value] * new_len
+        for i, val in zip(indices, values):
+            new_values[i] = val
 
         # if the first steps are a hole, duplicate the first value.
-        i = 0
-        if new_datetimes[0] != self.datetimes[0]:
-            n_steps = int((self.datetimes[0].moy - new_datetimes[0].moy) / mins_per_step)
-            new_values.extend([self._values[0]] * n_steps)
-            i = n_steps - 1
+        st_i, end_i = indices[0], indices[-1]
+        if max_steps is None or st_i <= max_steps:
+            new_values[:st_i] = [values[0]] * st_i
 
         # go through the values interpolating any holes.
-        for j in xrange(len(self._values)):
-            if new_datetimes[i] == self.datetimes[j]:  # there is no hole.
-                new_values.append(self._values[j])
-                i += 1
-            else:  # there is a hole between this step and the previous step.
-                n_steps = int((self.datetimes[j].moy - new_datetimes[i].moy)
-                              / mins_per_step)
-                intp_vals = self._xxrange(self._values[j - 1], self._values[j], n_steps)
-                new_values.extend(list(intp_vals)[1:] + [self._values[j]])
-                i += n_steps
-
-        # if the last steps are a hole duplicate the last value.
-        if len(new_values) != len(new_datetimes):
-            n_steps = len(new_datetimes) - len(new_values)
-            new_values.extend([self._values[-1]] * n_steps)
+        for j in xrange(1, len(indices)):
+            n_steps = indices[j] - indices[j - 1]
+            if n_steps == 1 or (max_steps is not None and n_steps - 1 > max_steps):
+                continue
+            v_1 = values[j - 1]
+            _step = (values[j] - v_1) / float(n_steps)
+            new_values[indices[j - 1] + 1:indices[j]] = \
+                [v_1 + k * _step for k in xrange(1, n_steps)]
+
+        # if the last steps are a hole, duplicate the last value.
+        n_steps = new_len - end_i - 1
+        if max_steps is None or n_steps <= max_steps:
+            new_values[end_i + 1:] = [values[-1]] * n_steps
 
         # build the new continuous data collection.
         return HourlyContinuousCollection(self.header.duplicate(), new_values)
@@ -366,93 +409,188 @@ class HourlyDiscontinuousCollection(BaseCollection):
         n_ap = [a_per.st_month, a_per.st_day, a_per.st_hour, a_per.end_month,
                 a_per.end_day, a_per.end_hour, a_per.timestep, a_per.is_leap_year]
 
+        # get integer moys and check hours, timestep and leap days in a single pass.
+        sort_datetimes, sort_values = self.datetimes, self._values
+        moys = [0] * len(sort_datetimes)
+        is_sorted, has_leap_day = True, False
+        min_hour, max_hour = 23, 0
+        mins_per_step = int(60 / n_ap[6])
+        prev_moy = -1
+        for i, date_t in enumerate(sort_datetimes):
+            month, day, hour, minute = \
+                date_t.month, date_t.day, date_t.hour, date_t.minute
+            leap_i = 1 if date_t.year == 2016 else 0
+            moy = (self._DAYSUNTILMONTH[leap_i][month - 1] + day - 1) * 1440 + \
+                hour * 60 + minute
+            moys[i] = moy
+            if moy <= prev_moy:
+                is_sorted = False
+            prev_moy = moy
+            if hour < min_hour:
+                min_hour = hour
+            if hour > max_hour:
+                max_hour = hour
+            if minute % mins_per_step != 0:
+                mins_per_step = gcd(mins_per_step, minute)
+            if leap_i and month == 2 and day == 29:
+                has_leap_day = True
+
         # make sure that datetimes are all in chronological order.
-        sort_datetimes, sort_values = zip(*sorted(zip(self.datetimes, self.values)))
+        if not is_sorted:
+            order = sorted(xrange(len(moys)), key=moys.__getitem__)
+            moys = [moys[i] for i in order]
+            sort_datetimes = tuple(sort_datetimes[i] for i in order)
+            sort_values = [sort_values[i] for i in order]
+            # check that there are no duplicate datetimes.
+            for i in xrange(1, len(moys)):
+                assert moys[i] != moys[i - 1], 'Duplicate datetime ' \
+                    'was found in the collection: {}'.format(sort_datetimes[i])
+
         if not a_per.is_reversed and not a_per.is_annual:
-            if sort_datetimes[0].doy < a_per.st_time.doy:
+            if moys[0] // 1440 + 1 < a_per.st_time.doy:
                 n_ap[0] = sort_datetimes[0].month
                 n_ap[1] = sort_datetimes[0].day
-            if sort_datetimes[-1].doy > a_per.end_time.doy:
+            if moys[-1] // 1440 + 1 > a_per.end_time.doy:
                 n_ap[3] = sort_datetimes[-1].month
                 n_ap[4] = sort_datetimes[-1].day
         elif a_per.is_reversed:
-            last_ind = None
-            for i, date_t in enumerate(sort_datetimes):
-                last_ind = i if date_t.moy <= a_per.end_time.moy else last_ind
-            if last_ind is not None:
-                last_ind = last_ind + 1
-                sort_datetimes = sort_datetimes[last_ind:] + sort_datetimes[:last_ind]
-                sort_values = sort_values[last_ind:] + sort_values[:last_ind]
+            last_ind = bisect_right(moys, a_per.end_time.moy)
             # If datetimes are outside the a_period range, just make it annual.
             # There's no way to know what side of the analysis_period should be etended.
-            if sort_datetimes[0].doy > a_per.end_time.doy and \
-                    sort_datetimes[0].doy < a_per.st_time.doy:
+            first_doy = moys[last_ind % len(moys)] // 1440 + 1
+            if a_per.end_time.doy < first_doy < a_per.st_time.doy:
                 n_ap[0], n_ap[1], n_ap[3], n_ap[4] = 1, 1, 12, 31
-                sort_datetimes, sort_values = zip(*sorted(zip(
-                    self.datetimes, self.values)))
+            elif last_ind != 0:
+                sort_datetimes = tuple(sort_datetimes[last_ind:]) + \
+                    tuple(sort_datetimes[:last_ind])
+                sort_values = list(sort_values[last_ind:]) + \
+                    list(sort_values[:last_ind])
 
         # check that no hours lie outside of the analysis_period
         if not a_per.is_annual:
-            if a_per.st_hour != 0:
-                for date_t in sort_datetimes:
-                    n_ap[2] = date_t.hour if date_t.hour < n_ap[2] else n_ap[2]
-            if a_per.end_hour != 23:
-                for date_t in sort_datetimes:
-                    n_ap[5] = date_t.hour if date_t.hour > n_ap[5] else n_ap[5]
-
-        # check that there are no duplicate datetimes.
-        for i in xrange(len(sort_datetimes)):
-            assert sort_datetimes[i] != sort_datetimes[i - 1], 'Duplicate datetime ' \
-                'was found in the collection: {}'.format(sort_datetimes[i])
+            if a_per.st_hour != 0 and min_hour < n_ap[2]:
+                n_ap[2] = min_hour
+            if a_per.end_hour != 23 and max_hour > n_ap[5]:
+                n_ap[5] = max_hour
 
         # check that the analysis_period timestep is correct.
-        mins_per_step = int(60 / n_ap[6])
-        for date_t in sort_datetimes:
-            if date_t.moy % mins_per_step != 0:
-                i = 0
-                valid_steps = sorted(a_per.VALIDTIMESTEPS.keys())
-                while date_t.moy % mins_per_step != 0 and i < len(valid_steps):
-                    mins_per_step = int(60 / valid_steps[i])
-                    i += 1
-                n_ap[6] = int(60 / mins_per_step)
+        n_ap[6] = int(60 / mins_per_step)
 
         # check that the analysis_period leap_year is correct.
-        if not a_per.is_leap_year:
-            for date_t in sort_datetimes:
-                if date_t.month == 2 and date_t.day == 29:
-                    n_ap[7] = True
+        if has_leap_day:
+            n_ap[7] = True
 
         # build a validated collection.
-        new_ap = AnalysisPeriod(*n_ap)
+        new_ap = AnalysisPeriod.interned(*n_ap)
         new_header = self.header.duplicate()
         new_header._analysis_period = new_ap
         new_coll = HourlyDiscontinuousCollection(new_header, sort_values, sort_datetimes)
         new_coll._validated_a_period = True
         return new_coll
 
-    def to_dict(self):
-        """Convert Data Collection to a dictionary."""
-        return {
+    def to_dict(self, compact=False):
+        """Convert Data Collection to a dictionary.
+
+        Args:
+            compact: Boolean to note whether the numerical values and the datetimes
+                should be encoded as base64 strings of packed binary values, which
+                are much smaller when serialized to JSON. Datetimes are encoded as
+                integer minutes of the year. (Default: False).
+        """
+        if not compact:
+            return {
+                'header': self.header.to_dict(),
+                'values': self._values,
+                'datetimes': [dat.to_array() for dat in self.datetimes],
+                'validated_a_period': self._validated_a_period,
+                'type': 'HourlyDiscontinuousCollection'
+            }
+        base = {
             'header': self.header.to_dict(),
             'values': self._values,
-            'datetimes': [dat.to_array() for dat in self.datetimes],
+            'datetimes': self._encode_array(self._datetime_moys(), 'i'),
+            'datetimes_format': 'moy',
+            'datetimes_leap_year': self.datetimes[0].leap_year
+            if len(self.datetimes) != 0 else False,
             'validated_a_period': self._validated_a_period,
             'type': 'HourlyDiscontinuousCollection'
         }
+        self._compact_values(base)
+        return base
+
+    def _broadcast_values(self, other):
+        """Get values of a coarser collection aligned with the values of this one.
+
+        This allows Daily, Monthly and MonthlyPerHour collections to be used in
+        arithmetic operations with this collection, where each value of the coarser
+        collection is repeated over all of the steps that it describes. Returns None
+        if the other collection is not one of these coarser collection types.
+        """
+        coll_type = other._collection_type
+        if coll_type not in ('Daily', 'Monthly', 'MonthlyPerHour'):
+            return None
+
+        # build a lookup list where the other collection's values sit at integer keys
+        if coll_type == 'Daily':
+            lookup = [None] * 367
+            for doy, val in zip(other.datetimes, other._values):
+                lookup[doy] = val
+        elif coll_type == 'Monthly':
+            lookup = [None] * 13
+            for month, val in zip(other.datetimes, other._values):
+                lookup[month] = val
+        else:
+            lookup = [None] * 13 * 24
+            for (month, hour), val in zip(other.datetimes, other._values):
+                lookup[month * 24 + hour] = val
+
+        # map each of this collection's steps to a key of the lookup in one pass
+        moys = self._datetime_moys()
+        if coll_type == 'Daily':
+            new_vals = [lookup[moy // 1440 + 1] for moy in moys]
+        else:
+            days_per_month = self.header.analysis_period._num_of_days_each_month
+            day_months = [month for month, n_days in enumerate(days_per_month, 1)
+                          for _ in xrange(n_days)]
+            if coll_type == 'Monthly':
+                new_vals = [lookup[day_months[moy // 1440]] for moy in moys]
+            else:
+                new_vals = [lookup[day_months[moy // 1440] * 24 + (moy // 60) % 24]
+                            for moy in moys]
+        assert None not in new_vals, '{} does not have values for all of the ' \
+            'datetimes of {}.'.format(other.__class__.__name__, self.__class__.__name__)
+        return new_vals
 
-    def _xxrange(self, start, end, step_count):
-        """Generate n values between start and end."""
-        _step = (end - start) / float(step_count)
-        return (start + (i * _step) for i in xrange(int(step_count)))
+    def _datetime_moys(self):
+        """Get a list of integer minutes of the year for each of the datetimes.
 
-    def _filter_by_moys_slow(self, moys):
-        """Filter the Data Collection with a slow method that always works."""
+        This is faster than calling the moy property of each datetime.
+        """
+        days_until_month = self._DAYSUNTILMONTH
+        return [(days_until_month[d_t.year == 2016][d_t.month - 1] + d_t.day - 1)
+                * 1440 + d_t.hour * 60 + d_t.minute for d_t in self.datetimes]
+
+    def _reduced_datetimes(self):
+        """Get the datetimes of this collection as packed minutes of the year."""
+        leap_yr = self._datetimes[0].leap_year if len(self._datetimes) != 0 else False
+        return leap_yr, self._pack_array(self._datetime_moys(), 'i')
+
+    @staticmethod
+    def _restored_datetimes(datetimes):
+        """Get the datetimes of a collection from the output of _reduced_datetimes."""
+        leap_yr, moys = datetimes
+        return tuple(DateTime.from_moy(moy, leap_yr)
+                     for moy in BaseCollection._unpack_array(moys, 'i'))
+
+    def _filter_by_moys(self, moys):
+        """Filter the Data Collection with a hash set of moys that always works."""
+        _moys = set(moys)
         _filt_values = []
         _filt_datetimes = []
-        for i, d in enumerate(self.datetimes):
-            if d.moy in moys:
+        for v, d in zip(self._values, self.datetimes):
+            if d.moy in _moys:
                 _filt_datetimes.append(d)
-                _filt_values.append(self._values[i])
+                _filt_values.append(v)
         return _filt_values, _filt_datetimes
 
     def _timestep_cull(self, timestep):
@@ -464,12 +602,17 @@ class HourlyDiscontinuousCollection(BaseCollection):
             if date_t.moy % mins_per_step == 0:
                 new_datetimes.append(date_t)
                 new_values.append(self.values[i])
-        a_per = self.header.analysis_period
-        new_ap = AnalysisPeriod(a_per.st_month, a_per.st_day, a_per.st_hour,
-                                a_per.end_month, a_per.end_day, a_per.end_hour,
-                                timestep, a_per.is_leap_year)
+        new_ap = self._timestep_analysis_period(timestep)
         return new_ap, new_values, new_datetimes
 
+    def _timestep_analysis_period(self, timestep):
+        """Get a copy of the header analysis_period with a different timestep."""
+        a_per = self.header.analysis_period
+        return AnalysisPeriod.interned(
+            a_per.st_month, a_per.st_day, a_per.st_hour,
+            a_per.end_month, a_per.end_day, a_per.end_hour,
+            timestep, a_per.is_leap_year)
+
     def _check_analysis_period(self, analysis_period):
         assert self.header.analysis_period.timestep == analysis_period.timestep,\
             'analysis_period timestep must match that on the'\
@@ -563,6 +706,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         * values
     """
 
+    __slots__ = ()
     _collection_type = 'HourlyContinuous'
 
     def __init__(self, header, values):
@@ -595,10 +739,14 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
                 "header": {}  # A Ladybug Header,
                 "values": []  # An array of values,
                 }
+
+        Note that the values can also be a base64 string of packed binary values
+        produced by to_dict(compact=True), in which case the dictionary also has a
+        "values_format" key.
         """
         assert 'header' in data, 'Required keyword "header" is missing!'
         assert 'values' in data, 'Required keyword "values" is missing!'
-        return cls(Header.from_dict(data['header']), data['values'])
+        return cls(Header.from_dict(data['header']), cls._values_from_dict(data))
 
     @property
     def datetimes(self):
@@ -607,7 +755,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
             self._datetimes = tuple(self.header.analysis_period.datetimes)
         return self._datetimes
 
-    def interpolate_holes(self):
+    def interpolate_holes(self, max_gap=None, gap_value=None):
         """All continuous collections do not have holes in the data set.
 
         Therefore, there is no need to run this method on a continuous collection.
@@ -638,31 +786,159 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
             assert isinstance(cumulative, bool), \
                 'Expected Boolean. Got {}'.format(type(cumulative))
 
-        # generate new data
-        _new_values = []
+        # get the number of new steps for each existing step
+        _n_steps = int(timestep / self.header.analysis_period.timestep)
         _data_length = len(self._values)
-        for d in xrange(_data_length):
-            for _v in self._xxrange(self[d], self[(d + 1) % _data_length], timestep):
-                _new_values.append(_v)
+        _new_length = _data_length * _n_steps
+        _new_values = [0] * _new_length
+
+        # divide cumulative values by the number of steps
+        native_cumulative = self.header.data_type.cumulative
+        _divisor = _n_steps if cumulative or \
+            (cumulative is None and native_cumulative) else 1
+
+        # shift data by a half-step if data is averaged or cumulative over a step
+        _shift = 0 if self.header.data_type.point_in_time else int(_n_steps / 2)
+
+        # write each block of interpolated values directly into the new list
+        _steps = tuple(xrange(_n_steps))
+        _next_values = self._values[1:] + self._values[:1]
+        for d, (_v1, _v2) in enumerate(zip(self._values, _next_values)):
+            _step = (_v2 - _v1) / float(_n_steps)
+            _block = [(_v1 + i * _step) / _divisor for i in _steps]
+            st_i = d * _n_steps + _shift
+            end_i = st_i + _n_steps
+            if end_i <= _new_length:
+                _new_values[st_i:end_i] = _block
+            else:  # the last block wraps around to the start of the list
+                _split = _new_length - st_i
+                _new_values[st_i:] = _block[:_split]
+                _new_values[:_n_steps - _split] = _block[_split:]
+
+        # build a new header
+        _new_header = self.header.duplicate()
+        _new_header._analysis_period = self._timestep_analysis_period(timestep)
+        return HourlyContinuousCollection(_new_header, _new_values)
+
+    def aggregate_to_timestep(self, timestep=1, cumulative=None):
+        """Aggregate data to a coarser timestep by averaging or totaling each step.
+
+        Args:
+            timestep: Target timestep as an integer. The current timestep must be
+                divisable by the target timestep. (Default: 1).
+            cumulative: A boolean that sets whether the aggregation should treat
+                the data colection values as cumulative, in which case the values
+                within each new timestep are totaled (instead of averaged). The
+                default will check the DataType to see if this type of data is
+                typically cumulative over time.
 
-        # divide cumulative values by the timestep
+        Return:
+            A continuous hourly data collection with data aggregated to
+            the input timestep.
+        """
+        assert self.header.analysis_period.timestep % timestep == 0, \
+            'Current timestep({}) must be divisable by target timestep({})' \
+            .format(self.header.analysis_period.timestep, timestep)
+        if cumulative is not None:
+            assert isinstance(cumulative, bool), \
+                'Expected Boolean. Got {}'.format(type(cumulative))
+
+        # get the number of existing steps within each new step
+        _n_steps = int(self.header.analysis_period.timestep / timestep)
         native_cumulative = self.header.data_type.cumulative
-        if cumulative or (cumulative is None and native_cumulative):
-            for i, d in enumerate(_new_values):
-                _new_values[i] = d / timestep
+        _divisor = 1 if cumulative or \
+            (cumulative is None and native_cumulative) else _n_steps
 
-        # shift data by a half-hour if data is averaged or cumulative over an hour
-        if not self.header.data_type.point_in_time:
-            shift_dist = int(timestep / 2)
-            _new_values = _new_values[-shift_dist:] + _new_values[:-shift_dist]
+        # reduce each bucket of existing values to a single value
+        _vals = self._values
+        _new_values = [sum(_vals[i:i + _n_steps]) / _divisor
+                       for i in xrange(0, len(_vals), _n_steps)]
 
         # build a new header
-        a_per = self.header.analysis_period
-        _new_a_per = AnalysisPeriod(a_per.st_month, a_per.st_day, a_per.st_hour,
-                                    a_per.end_month, a_per.end_day, a_per.end_hour,
-                                    timestep, a_per.is_leap_year)
         _new_header = self.header.duplicate()
-        _new_header._analysis_period = _new_a_per
+        _new_header._analysis_period = self._timestep_analysis_period(timestep)
+        return HourlyContinuousCollection(_new_header, _new_values)
+
+    def rolling(self, window, stat='average', data_type=None, unit=None):
+        """Get a collection of a statistic over a trailing window of hours at each step.
+
+        For annual collections, the window wraps around to the end of the year for
+        the first steps of the collection. For other collections, the window of
+        the first steps only includes the steps since the start of the collection.
+
+        Args:
+            window: An integer for the number of hours in the window (e.g. 24 for
+                a daily moving average or 168 for a weekly one).
+            stat: Text for the statistic to compute over each window. Choose from
+                average, total, min or max. (Default: average).
+            data_type: The data type of the returned collection. Default is to
+                use the data type of this collection.
+            unit: The unit of the returned collection. Default is to
+                use the unit of this collection or the base unit of the
+                input data_type (if it exists).
+
+        Return:
+            A continuous hourly data collection with the rolling statistic.
+        """
+        steps = int(window * self.header.analysis_period.timestep)
+        assert 0 < steps <= len(self._values), 'window must be greater than zero ' \
+            'and no longer than the collection. Got {}.'.format(window)
+        wrap = self.header.analysis_period.is_annual
+        if stat in ('average', 'total'):
+            _new_values = self._rolling_sum(steps, stat == 'average', wrap)
+        elif stat in ('min', 'max'):
+            _new_values = self._rolling_extreme(steps, stat == 'max', wrap)
+        else:
+            raise ValueError('Invalid input value for stat: {}'.format(stat))
+
+        _new_header = self._operation_header(
+            data_type, unit, '{} hour rolling {}'.format(window, stat))
+        return HourlyContinuousCollection(_new_header, _new_values)
+
+    def exponential_running_mean(self, alpha=0.8, data_type=None, unit=None):
+        """Get a collection of the exponentially-weighted running mean at each step.
+
+        The input alpha is the weight of the running mean from one day earlier,
+        which is converted to a weight for each step of the collection as
+        ``alpha_step = alpha ** (1 / steps_per_day)``. Each step of the running
+        mean is then computed as:
+        ``mean[i] = alpha_step * mean[i - 1] + (1 - alpha_step) * value[i]``.
+        This gives the same time constant as applying alpha once per day to daily
+        means. For annual collections, the mean is warmed up over the end of the
+        year before the first step. For other collections, the first step of the
+        mean is the first value of the collection.
+
+        Args:
+            alpha: A number between 0 and 1 for the weight of the running mean
+                from one day earlier. Higher values give a slower response to
+                recent values. (Default: 0.8, which is the value commonly used
+                with daily average temperatures for prevailing outdoor temperature).
+            data_type: The data type of the returned collection. Default is to
+                use the data type of this collection.
+            unit: The unit of the returned collection. Default is to
+                use the unit of this collection or the base unit of the
+                input data_type (if it exists).
+
+        Return:
+            A continuous hourly data collection with the running mean.
+        """
+        assert 0 <= alpha < 1, 'alpha must be between 0 and 1. Got {}.'.format(alpha)
+        _vals = self._values
+        alpha = alpha ** (1 / (24 * self.header.analysis_period.timestep))
+        beta = 1 - alpha
+        _mean = _vals[0]
+        if self.header.analysis_period.is_annual:  # warm up over the year end
+            for val in _vals:
+                _mean = alpha * _mean + beta * val
+            _mean = alpha * _mean + beta * _vals[0]
+        _new_values = [0] * len(_vals)
+        _new_values[0] = _mean
+        for i in xrange(1, len(_vals)):
+            _mean = alpha * _mean + beta * _vals[i]
+            _new_values[i] = _mean
+
+        _new_header = self._operation_header(
+            data_type, unit, 'exponential running mean')
         return HourlyContinuousCollection(_new_header, _new_values)
 
     def filter_by_conditional_statement(self, statement):
@@ -916,13 +1192,88 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         """
         return self.duplicate()
 
-    def to_dict(self):
-        """Convert Data Collection to a dictionary."""
-        return {
+    def to_dict(self, compact=False):
+        """Convert Data Collection to a dictionary.
+
+        Args:
+            compact: Boolean to note whether the numerical values should be
+                encoded as a base64 string of packed binary values, which is
+                much smaller when serialized to JSON. (Default: False).
+        """
+        base = {
             'header': self.header.to_dict(),
             'values': self._values,
             'type': 'HourlyContinuousCollection'
         }
+        if compact:
+            self._compact_values(base)
+        return base
+
+    def _datetime_moys(self):
+        """Get a list of integer minutes of the year for each step of the collection."""
+        return self.header.analysis_period.moys
+
+    def _operation_header(self, data_type, unit, operation):
+        """Get a header for a collection derived from this one by an operation."""
+        header = self._check_aligned_header(data_type, unit)
+        header._metadata = dict(header.metadata)
+        header.metadata['operation'] = operation
+        return header
+
+    def _rolling_sum(self, steps, average, wrap):
+        """Get the trailing window total or average at each step using prefix sums."""
+        _vals = self._values
+        if wrap and steps > 1:
+            _vals = _vals[1 - steps:] + _vals
+        prefix = [0] * (len(_vals) + 1)
+        total = 0
+        for i, val in enumerate(_vals):
+            total += val
+            prefix[i + 1] = total
+        if wrap:
+            sums = [prefix[i + steps] - prefix[i] for i in xrange(len(self._values))]
+            return [val / steps for val in sums] if average else sums
+        sums = [prefix[i + 1] - prefix[max(0, i + 1 - steps)]
+                for i in xrange(len(_vals))]
+        if average:
+            return [val / min(i + 1, steps) for i, val in enumerate(sums)]
+        return sums
+
+    def _rolling_extreme(self, steps, maximum, wrap):
+        """Get the trailing window min or max at each step using a monotonic deque."""
+        _vals = self._values
+        offset = 0
+        if wrap and steps > 1:
+            _vals = _vals[1 - steps:] + _vals
+            offset = steps - 1
+        _new_values = [0] * len(self._values)
+        window = deque()  # indices of values that can still be the window extreme
+        for i, val in enumerate(_vals):
+            if maximum:
+                while window and _vals[window[-1]] <= val:
+                    window.pop()
+            else:
+                while window and _vals[window[-1]] >= val:
+                    window.pop()
+            window.append(i)
+            if window[0] <= i - steps:
+                window.popleft()
+            if i >= offset:
+                _new_values[i - offset] = _vals[window[0]]
+        return _new_values
+
+    def _new_from_values(self, values):
+        """Get a collection like this one with the same header but new values."""
+        return self.__class__(self.header, values)
+
+    def _reduced_datetimes(self):
+        """Continuous collections do not need datetimes to be pickled."""
+        return None
+
+    @staticmethod
+    def _restored_datetimes(datetimes):
+        """Datetimes of continuous collections are generated from the header."""
+        return None
 
     def _get_analysis_period_subset(self, a_per):
         """Return an analysis_period is always a subset of the Data Collection"""
@@ -949,7 +1300,7 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
             new_needed = True
         if not new_needed:
             return a_per
-        return AnalysisPeriod(*n_ap)
+        return AnalysisPeriod.interned(*n_ap)
 
     def _check_values(self, values):
         """Check values whenever they come through the values setter."""
@@ -971,30 +1322,6 @@ class HourlyContinuousCollection(HourlyDiscontinuousCollection):
         """Boolean denoting whether the data collection is continuous."""
         return True
 
-    def __add__(self, other):
-        new_vals = self._add_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __sub__(self, other):
-        new_vals = self._sub_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __mul__(self, other):
-        new_vals = self._mul_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __div__(self, other):
-        new_vals = self._div_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __truediv__(self, other):
-        new_vals = self._div_values(other)
-        return self.__class__(self.header, new_vals)
-
-    def __neg__(self):
-        new_vals = [-v_1 for v_1 in self._values]
-        return self.__class__(self.header, new_vals)
-
     def __repr__(self):
         """Hourly Discontinuous Collection representation."""
         return "{} Continuous Data Collection\n{}\n{} ({})\n...{} values...".format(
@@ -1027,6 +1354,7 @@ class DailyCollection(BaseCollection):
         * validated_a_period
         * values
     """
+    __slots__ = ()
     _collection_type = 'Daily'
 
     def __init__(self, header, values, datetimes):
@@ -1066,12 +1394,13 @@ class DailyCollection(BaseCollection):
         Return:
             A new Data Collection with filtered data
         """
+        _doys = set(doys)
         _filt_values = []
         _filt_datetimes = []
-        for i, d in enumerate(self.datetimes):
-            if d in doys:
+        for v, d in zip(self._values, self.datetimes):
+            if d in _doys:
                 _filt_datetimes.append(d)
-                _filt_values.append(self._values[i])
+                _filt_values.append(v)
         _filt_header = self.header.duplicate()
         return DailyCollection(_filt_header, _filt_values, _filt_datetimes)
 
@@ -1166,7 +1495,7 @@ class DailyCollection(BaseCollection):
                 'was found in the collection: {}'.format(sort_datetimes[i])
 
         # build a validated collection.
-        new_ap = AnalysisPeriod(*n_ap)
+        new_ap = AnalysisPeriod.interned(*n_ap)
         new_header = self.header.duplicate()
         new_header._analysis_period = new_ap
         new_coll = DailyCollection(new_header, sort_values, sort_datetimes)
@@ -1250,6 +1579,7 @@ class MonthlyCollection(BaseCollection):
         * values
     """
 
+    __slots__ = ()
     _collection_type = 'Monthly'
 
     def __init__(self, header, values, datetimes):
@@ -1288,12 +1618,13 @@ class MonthlyCollection(BaseCollection):
         Return:
             A new Data Collection with filtered data
         """
+        _months = set(months)
         _filt_values = []
         _filt_datetimes = []
-        for i, d in enumerate(self.datetimes):
-            if d in months:
+        for v, d in zip(self._values, self.datetimes):
+            if d in _months:
                 _filt_datetimes.append(d)
-                _filt_values.append(self._values[i])
+                _filt_values.append(v)
         _filt_header = self.header.duplicate()
         return MonthlyCollection(_filt_header, _filt_values, _filt_datetimes)
 
@@ -1344,7 +1675,7 @@ class MonthlyCollection(BaseCollection):
                 'was found in the collection: {}'.format(sort_datetimes[i])
 
         # build a validated collection.
-        new_ap = AnalysisPeriod(st_month=n_ap[0], end_month=n_ap[1])
+        new_ap = AnalysisPeriod.interned(st_month=n_ap[0], end_month=n_ap[1])
         new_header = self.header.duplicate()
         new_header._analysis_period = new_ap
         new_coll = MonthlyCollection(new_header, sort_values, sort_datetimes)
@@ -1391,6 +1722,7 @@ class MonthlyPerHourCollection(BaseCollection):
         * values
     """
 
+    __slots__ = ()
     _collection_type = 'MonthlyPerHour'
 
     def __init__(self, header, values, datetimes):
@@ -1432,12 +1764,13 @@ class MonthlyPerHourCollection(BaseCollection):
         Return:
             A new Data Collection with filtered data
         """
+        _months_per_hour = set(tuple(m_h) for m_h in months_per_hour)
         _filt_values = []
         _filt_datetimes = []
-        for i, d in enumerate(self.datetimes):
-            if d in months_per_hour:
+        for v, d in zip(self._values, self.datetimes):
+            if tuple(d) in _months_per_hour:
                 _filt_datetimes.append(d)
-                _filt_values.append(self._values[i])
+                _filt_values.append(v)
         return MonthlyPerHourCollection(
             self.header.duplicate(), _filt_values, _filt_datetimes)
 
@@ -1498,8 +1831,8 @@ class MonthlyPerHourCollection(BaseCollection):
                     n_ap[3] = date_t[1] if date_t[1] > n_ap[3] else n_ap[3]
 
         # build a validated collection.
-        new_ap = AnalysisPeriod(st_month=n_ap[0], st_hour=n_ap[1],
-                                end_month=n_ap[2], end_hour=n_ap[3])
+        new_ap = AnalysisPeriod.interned(st_month=n_ap[0], st_hour=n_ap[1],
+                                         end_month=n_ap[2], end_hour=n_ap[3])
         new_header = self.header.duplicate()
         new_header._analysis_period = new_ap
         new_coll = MonthlyPerHourCollection(new_header, sort_values, sort_datetimes)
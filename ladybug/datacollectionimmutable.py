@@ -25,6 +25,7 @@ from .datacollection import HourlyDiscontinuousCollection, HourlyContinuousColle
 
 class _ImmutableCollectionBase(object):
     """Base class for all immutable Data Collections."""
+    __slots__ = ()
     _mutable = False
 
     @property
@@ -55,6 +56,7 @@ class _ImmutableCollectionBase(object):
 class HourlyDiscontinuousCollectionImmutable(
         _ImmutableCollectionBase, HourlyDiscontinuousCollection):
     """Immutable Discontinous Data Collection at hourly or sub-hourly intervals."""
+    __slots__ = ()
 
     def convert_to_culled_timestep(self, timestep=1):
         """This method is not available for immutable collections."""
@@ -68,6 +70,7 @@ class HourlyDiscontinuousCollectionImmutable(
 class HourlyContinuousCollectionImmutable(
         _ImmutableCollectionBase, HourlyContinuousCollection):
     """Immutable Continous Data Collection at hourly or sub-hourly intervals."""
+    __slots__ = ()
 
     def convert_to_culled_timestep(self, timestep=1):
         """This method is not available for immutable collections."""
@@ -81,6 +84,7 @@ class HourlyContinuousCollectionImmutable(
 class DailyCollectionImmutable(
         _ImmutableCollectionBase, DailyCollection):
     """Immutable Daily Data Collection."""
+    __slots__ = ()
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
@@ -90,6 +94,7 @@ class DailyCollectionImmutable(
 class MonthlyCollectionImmutable(
         _ImmutableCollectionBase, MonthlyCollection):
     """Immutable Monthly Data Collection."""
+    __slots__ = ()
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
@@ -99,6 +104,7 @@ class MonthlyCollectionImmutable(
 class MonthlyPerHourCollectionImmutable(
         _ImmutableCollectionBase, MonthlyPerHourCollection):
     """Immutable Monthly Per Hour Data Collection."""
+    __slots__ = ()
 
     def to_mutable(self):
         """Get a mutable version of this collection."""
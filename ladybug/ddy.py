@@ -3,7 +3,8 @@ from __future__ import division
 
 from .location import Location
 from .designday import DesignDay
-from .futil import write_to_file
+from .futil import write_to_file, is_compressed_path, compressed_file_exists, \
+    uncompressed_path, open_compressed_file
 
 import os
 import re
@@ -61,21 +62,38 @@ class DDY(object):
 
         Args:
             file_path: A string representing a complete path to the .ddy file.
+                This can also be a .ddy.gz file or a path to a .ddy file inside
+                of a zip archive (e.g. c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.ddy).
         """
         # check that the file is there
-        if not os.path.isfile(file_path):
+        compressed = is_compressed_path(file_path)
+        file_exists = compressed_file_exists(file_path) if compressed \
+            else os.path.isfile(file_path)
+        if not file_exists:
             raise ValueError(
                 'Cannot find a .ddy file at {}'.format(file_path))
-        if not file_path.lower().endswith('.ddy'):
+        if not uncompressed_path(file_path).lower().endswith('.ddy'):
             raise ValueError(
                 'DDY file does not have a .ddy extension.')
 
         # check the python version and open the file
-        if platform.python_implementation() == 'IronPython':
+        if compressed:
+            ddywin = open_compressed_file(file_path)
+        elif platform.python_implementation() == 'IronPython':
             ddywin = codecs.open(file_path, 'r')
         else:
             ddywin = codecs.open(file_path, 'r', encoding='utf-8', errors='ignore')
+        return cls._from_ddy_file_obj(ddywin, file_path)
 
+    @classmethod
+    def _from_ddy_file_obj(cls, ddywin, file_path):
+        """Initalize from a file object of a ddy file that is already open.
+
+        Args:
+            ddywin: A file object of a ddy file, which will be closed once
+                it has been read.
+            file_path: A string for the path to the .ddy file.
+        """
         # extract all location and design day definitions from the file
         loc_p = re.compile(r"(Site:Location,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
         dday_p = re.compile(r"(SizingPeriod:DesignDay,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
@@ -5,14 +5,17 @@ from .location import Location
 from .designday import DesignDay
 from .datacollection import HourlyContinuousCollection
 from .datacollection import MonthlyCollection
+from .collectiontable import CollectionTable
 from .header import Header
 from .analysisperiod import AnalysisPeriod
 from .datatype import angle, distance, energyflux, energyintensity, generic, \
     illuminance, luminance, fraction, pressure, speed, temperature
 from .skymodel import calc_sky_temperature
-from .futil import write_to_file
+from .futil import write_lines_to_file, is_compressed_path, \
+    compressed_file_exists, uncompressed_path, open_compressed_file
 
 import os
+from itertools import chain, islice
 readmode = 'rb'
 try:
     from itertools import izip as zip  # python 2
@@ -25,7 +28,9 @@ class EPW(object):
     """An EPW object containing all of the data of an .epw file.
 
     Args:
-        file_path: Local file address to an .epw file.
+        file_path: Local file address to an .epw file. This can also be a .epw.gz
+            file or a path to an .epw file inside of a zip archive
+            (e.g. c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.epw).
 
     Properties:
         * location
@@ -143,7 +148,7 @@ class EPW(object):
         epw_obj._location = Location()
 
         # create an annual analysis period
-        analysis_period = AnalysisPeriod(is_leap_year=is_leap_year)
+        analysis_period = AnalysisPeriod.interned(is_leap_year=is_leap_year)
 
         # create headers and an empty list for each field in epw file
         headers = []
@@ -511,19 +516,23 @@ class EPW(object):
                     ' a week.  Got AnalysisPeriod for {} days.'.format(
                         week_type, type(val))
 
-    def _import_data(self, import_header_only=False):
+    def _import_data(self, import_header_only=False, file_obj=None):
         """Import data from an epw file.
 
         Hourly data will be saved in self.data and the various header data
         will be saved in the properties above.
+
+        Args:
+            import_header_only: Boolean to note whether only the header of the
+                file should be imported. (Default: False).
+            file_obj: An optional file object that is already open, from which
+                the data will be read instead of opening the file_path. It will
+                be closed once the data is imported. (Default: None).
         """
-        # perform checks on the file before opening it.
-        assert os.path.isfile(self._file_path), 'Cannot find an epw file at {}'.format(
-            self._file_path)
-        assert self._file_path.lower().endswith('epw'), '{} is not an .epw file. \n' \
-            'It does not possess the .epw file extension.'.format(self._file_path)
+        if file_obj is None:
+            file_obj = self._open_file()
 
-        with open(self._file_path, readmode) as epwin:
+        with file_obj as epwin:
             line = epwin.readline()
             original_header_load = bool(self._is_header_loaded)
 
@@ -597,7 +606,7 @@ class EPW(object):
                     header_meta['soil density'] = grnd_data[st_ind + 2]
                     header_meta['soil specific heat'] = grnd_data[st_ind + 3]
                     grnd_header = Header(temperature.GroundTemperature(), 'C',
-                                         AnalysisPeriod(), header_meta)
+                                         AnalysisPeriod.interned(), header_meta)
                     grnd_vlas = [float(x) for x in grnd_data[st_ind + 4: st_ind + 16]]
                     self._monthly_ground_temps[float(grnd_data[st_ind])] = \
                         MonthlyCollection(grnd_header, grnd_vlas, list(xrange(12)))
@@ -628,7 +637,7 @@ class EPW(object):
             self._num_of_fields = min(len(line.strip().split(',')), 35)
 
             # create an annual analysis period
-            analysis_period = AnalysisPeriod(is_leap_year=self.is_leap_year)
+            analysis_period = AnalysisPeriod.interned(is_leap_year=self.is_leap_year)
 
             # create headers and an empty list for each field in epw file
             headers = []
@@ -672,6 +681,20 @@ class EPW(object):
 
             self._is_data_loaded = True
 
+    def _open_file(self):
+        """Open the epw file, which can be a .gz file or inside of a zip archive."""
+        # perform checks on the file before opening it.
+        compressed = is_compressed_path(self._file_path)
+        file_exists = compressed_file_exists(self._file_path) if compressed \
+            else os.path.isfile(self._file_path)
+        assert file_exists, 'Cannot find an epw file at {}'.format(self._file_path)
+        assert uncompressed_path(self._file_path).lower().endswith('epw'), \
+            '{} is not an .epw file. \nIt does not possess the .epw file ' \
+            'extension.'.format(self._file_path)
+        if compressed:
+            return open_compressed_file(self._file_path)
+        return open(self._file_path, readmode)
+
     @property
     def header(self):
         """A list of text representing the full header (the first 8 lines) of the EPW."""
@@ -736,51 +759,34 @@ class EPW(object):
         Args:
             file_path: A string representing the path to write the epw file to.
         """
-        # load data if it's  not loaded convert to SI if it is in IP
+        # load data if it's  not loaded
         if not self.is_data_loaded:
             self._import_data()
-        originally_ip = False
-        if self.is_ip:
-            self.convert_to_si()
-            originally_ip = True
-
-        # write the file
-        lines = self.header
-        try:
-            # if the first value is at 1AM, move first item to end position
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time:
-                    first_hour = self._data[field]._values.pop(0)
-                    self._data[field]._values.append(first_hour)
-
-            annual_a_per = AnalysisPeriod(is_leap_year=self.is_leap_year)
-            for hour in xrange(0, len(annual_a_per.datetimes)):
-                line = []
-                for field in xrange(0, self._num_of_fields):
-                    line.append(str(self._data[field]._values[hour]))
-                lines.append(",".join(line) + "\n")
-        except IndexError:
-            # cleaning up
-            length_error_msg = 'Data length is not for a full year and cannot be ' + \
-                'saved as an EPW file.'
-            raise ValueError(length_error_msg)
-        else:
-            file_data = ''.join(lines)
-            write_to_file(file_path, file_data, True)
-        finally:
-            del(lines)
-            # move last item to start position for fields on the hour
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time:
-                    last_hour = self._data[field]._values.pop()
-                    self._data[field]._values.insert(0, last_hour)
 
-        if originally_ip:
-            self.convert_to_ip()
-
-        return file_path
+        # format each column once without changing the data collections
+        hour_count = len(AnalysisPeriod.interned(is_leap_year=self.is_leap_year))
+        columns = []
+        for field in xrange(0, self._num_of_fields):
+            values = self._si_values(self._data[field])
+            if len(values) < hour_count:
+                raise ValueError('Data length is not for a full year and cannot be '
+                                 'saved as an EPW file.')
+            if self._data[field].header.data_type.point_in_time:
+                # the first value is at 1AM, so the first item goes to the end
+                values = values[1:] + values[:1]
+            columns.append(map(str, values))
+
+        # write the file in buffered chunks of rows
+        rows = (','.join(row) + '\n' for row in zip(*columns))
+        return write_lines_to_file(
+            file_path, chain(self.header, islice(rows, hour_count)), True)
+
+    def _si_values(self, data_collection):
+        """Get the values of one of the EPW data collections in SI units."""
+        if not self.is_ip:
+            return data_collection._values
+        return data_collection.header.data_type.to_si(
+            data_collection._values, data_collection.header.unit)[0]
 
     def convert_to_ip(self):
         """Convert all Data Collections of this EPW object to IP units.
@@ -880,6 +886,28 @@ class EPW(object):
         """
         return self._get_data_by_field(field_number)
 
+    def to_collection_table(self, field_numbers=None):
+        """Get a CollectionTable with the data collections of several epw fields.
+
+        The data collections of this EPW are used as the columns of the table
+        without being copied and all of them share the same annual time index.
+
+        Args:
+            field_numbers: An optional list of values between 0 to 34 for the
+                epw fields to be included in the table. If None, all of the
+                fields of the epw will be included. (Default: None).
+
+        Returns:
+            A CollectionTable with one column for each field. The columns are named
+            after the data type of each field (eg. 'Dry Bulb Temperature').
+        """
+        if not self.is_data_loaded:
+            self._import_data()
+        if field_numbers is None:
+            field_numbers = xrange(self._num_of_fields)
+        columns = [self._get_data_by_field(num) for num in field_numbers]
+        return CollectionTable(columns)
+
     @property
     def years(self):
         """Return years as a Ladybug Data Collection."""
@@ -1295,7 +1323,7 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
         """
         # create sky temperature header
         sky_temp_header = Header(data_type=temperature.SkyTemperature(), unit='C',
-                                 analysis_period=AnalysisPeriod(),
+                                 analysis_period=AnalysisPeriod.interned(),
                                  metadata=self._metadata)
 
         # calculate sy temperature for each hour
@@ -1325,32 +1353,16 @@ pdfs/pdfs_v8.4.0/AuxiliaryPrograms.pdf (Chapter 2.9.1)
         if not file_path.lower().endswith('.wea'):
             file_path += '.wea'
 
-        originally_ip = False
-        if self.is_ip:
-            self.convert_to_si()
-            originally_ip = True
-
-        # write header
-        lines = [self._get_wea_header()]
-        # write values
+        # write the values in buffered chunks of rows
         datetimes = self.direct_normal_radiation.datetimes
-        for hoy in hoys:
-            dir_rad = self.direct_normal_radiation[hoy]
-            dif_rad = self.diffuse_horizontal_radiation[hoy]
-            line = "%d %d %.3f %d %d\n" \
-                % (datetimes[hoy].month,
-                   datetimes[hoy].day,
-                   datetimes[hoy].hour + 0.5,
-                   dir_rad, dif_rad)
-            lines.append(line)
-
-        file_data = ''.join(lines)
-        write_to_file(file_path, file_data, True)
-
-        if originally_ip:
-            self.convert_to_ip()
-
-        return file_path
+        dir_rad = self._si_values(self.direct_normal_radiation)
+        dif_rad = self._si_values(self.diffuse_horizontal_radiation)
+        rows = ('%d %d %.3f %d %d\n' % (datetimes[hoy].month, datetimes[hoy].day,
+                                        datetimes[hoy].hour + 0.5,
+                                        dir_rad[hoy], dif_rad[hoy])
+                for hoy in hoys)
+        return write_lines_to_file(
+            file_path, chain((self._get_wea_header(),), rows), True)
 
     def to_dict(self):
         """Convert the EPW to a dictionary."""
@@ -0,0 +1,240 @@
+# coding=utf-8
+"""Load many EPW files in parallel using a pool of processes.
+
+The load_epws function parses a list of EPW files (or all of the EPW files in
+a folder) across several processes. Each file can be reduced to a small result
+inside the worker process such that only that result is sent back. Results are
+yielded as soon as each file is finished and new files are only sent to the
+workers as results are consumed, which keeps the memory of the parent process
+bounded regardless of the number of files.
+
+Usage:
+
+.. code-block:: python
+
+    from ladybug.epwbatch import load_epws
+
+    def annual_average_temperature(epw):
+        return epw.dry_bulb_temperature.average
+
+    for result in load_epws('C:/epw_data', annual_average_temperature):
+        if result.success:
+            print(result.file_path, result.result)
+"""
+from __future__ import division
+
+import os
+import glob
+import traceback
+
+try:  # python 3
+    import queue
+except ImportError:  # python 2
+    import Queue as queue
+
+from .epw import EPW
+from .config import folders
+
+try:
+    import multiprocessing
+except ImportError:  # IronPython
+    multiprocessing = None
+
+try:  # python 2
+    basestring
+except NameError:  # python 3
+    basestring = str
+
+
+class EPWLoadResult(object):
+    """The result of loading one EPW file in a batch.
+
+    Args:
+        file_path: The path to the EPW file.
+        result: The EPW object or the output of the reduce_function for the
+            file. None if loading the file failed.
+        error: Text for the traceback of the exception that was raised while
+            loading the file. None if the file was loaded successfully.
+
+    Properties:
+        * file_path
+        * result
+        * error
+        * success
+    """
+    __slots__ = ('_file_path', '_result', '_error')
+
+    def __init__(self, file_path, result=None, error=None):
+        """Initialize EPW load result."""
+        self._file_path = file_path
+        self._result = result
+        self._error = error
+
+    @property
+    def file_path(self):
+        """Get the path to the EPW file."""
+        return self._file_path
+
+    @property
+    def result(self):
+        """Get the EPW object or the output of the reduce_function for the file."""
+        return self._result
+
+    @property
+    def error(self):
+        """Get text for the traceback of the failure or None if it was successful."""
+        return self._error
+
+    @property
+    def success(self):
+        """Get a boolean for whether the file was loaded successfully."""
+        return self._error is None
+
+    def __reduce__(self):
+        return (EPWLoadResult, (self._file_path, self._result, self._error))
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """EPW load result representation."""
+        status = 'Success' if self.success else 'Failed'
+        return 'EPW Load Result [{}]: {}'.format(status, self._file_path)
+
+
+def epw_file_paths(epw_files=None):
+    """Get a sorted list of EPW file paths from a folder, a glob pattern or a list.
+
+    Args:
+        epw_files: Either a list of paths to EPW files, a path to a folder in
+            which all .epw files (including those in sub-folders) will be found,
+            or a glob pattern (eg. 'C:/epw_data/USA_*.epw'). If None, the
+            default_epw_folder of the ladybug config will be used. (Default: None).
+    """
+    if epw_files is None:
+        epw_files = folders.default_epw_folder
+        assert epw_files is not None, 'No epw_files were input and no ' \
+            'default_epw_folder was found in the ladybug config.'
+    if not isinstance(epw_files, basestring):
+        return [os.path.normpath(path) for path in epw_files]
+
+    if os.path.isdir(epw_files):
+        paths = []
+        for root, _, files in os.walk(epw_files):
+            paths.extend(os.path.join(root, f) for f in files
+                         if f.lower().endswith('.epw'))
+    else:
+        try:
+            paths = glob.glob(epw_files, recursive=True)
+        except TypeError:  # python 2 does not support recursive glob
+            paths = glob.glob(epw_files)
+    return sorted(os.path.normpath(path) for path in paths)
+
+
+def load_epws(epw_files=None, reduce_function=None, processes=None,
+              progress_callback=None, chunk_size=1):
+    """Get a generator of the results of loading many EPW files in parallel.
+
+    Exceptions raised while loading a file or while reducing it are caught and
+    recorded on the EPWLoadResult of that file such that one bad file does not
+    stop the rest of the batch.
+
+    Args:
+        epw_files: Either a list of paths to EPW files, a path to a folder of EPW
+            files, or a glob pattern. If None, the default_epw_folder of the
+            ladybug config will be used. (Default: None).
+        reduce_function: An optional function that takes a loaded EPW object and
+            returns the result for the file. It must be defined at the top level
+            of a module so that it can be sent to the worker processes. If None,
+            the fully-loaded EPW object is the result. (Default: None).
+        processes: An integer for the number of worker processes. If None, the
+            number of CPUs is used. If 1 or if multiprocessing is not available
+            (eg. in IronPython), the files are loaded in this process.
+            (Default: None).
+        progress_callback: An optional function that is called in this process
+            after each file is finished. It receives three arguments: the number of
+            finished files, the total number of files and the EPWLoadResult of
+            the finished file. (Default: None).
+        chunk_size: An integer for the number of files that are sent to a
+            worker process at once. At most two chunks per process are loaded
+            ahead of the results that have been consumed. (Default: 1).
+
+    Returns:
+        A generator of EPWLoadResult objects, which are yielded in the order
+        that the files are finished rather than in the order of epw_files.
+    """
+    paths = epw_file_paths(epw_files)
+    total = len(paths)
+    tasks = [(path, reduce_function) for path in paths]
+    if processes is None and multiprocessing is not None:
+        processes = multiprocessing.cpu_count()
+    if multiprocessing is None or processes == 1 or total <= 1:
+        results = (_load_epw(task) for task in tasks)
+        pool = None
+    else:
+        processes = min(processes, total)
+        pool = multiprocessing.Pool(processes)
+        results = _load_bounded(pool, tasks, chunk_size, 2 * processes)
+
+    try:
+        for count, result in enumerate(results):
+            if progress_callback is not None:
+                progress_callback(count + 1, total, result)
+            yield result
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def _load_bounded(pool, tasks, chunk_size, window):
+    """Get a generator of results that keeps at most window chunks in progress.
+
+    A new chunk of tasks is only sent to the pool once the results of a previous
+    chunk are received, such that finished results never pile up in the parent
+    process when they are consumed more slowly than they are loaded.
+    """
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    finished = queue.Queue()
+
+    def submit(chunk):
+        def on_error(error):  # eg. a result that cannot be sent back
+            finished.put([EPWLoadResult(task[0], error=repr(error)) for task in chunk])
+        try:
+            pool.apply_async(_load_epw_chunk, (chunk,), callback=finished.put,
+                             error_callback=on_error)
+        except TypeError:  # python 2 does not support error_callback
+            pool.apply_async(_load_epw_chunk, (chunk,), callback=finished.put)
+
+    pending = 0
+    for chunk in chunks[:window]:
+        submit(chunk)
+        pending += 1
+    next_chunk = window
+    while pending:
+        results = finished.get()
+        pending -= 1
+        if next_chunk < len(chunks):
+            submit(chunks[next_chunk])
+            next_chunk += 1
+            pending += 1
+        for result in results:
+            yield result
+
+
+def _load_epw_chunk(tasks):
+    """Load a chunk of EPW files in a worker process."""
+    return [_load_epw(task) for task in tasks]
+
+
+def _load_epw(task):
+    """Load one EPW file and reduce it to a result in a worker process."""
+    file_path, reduce_function = task
+    try:
+        epw = EPW(file_path)
+        epw._import_data()
+        result = epw if reduce_function is None else reduce_function(epw)
+        return EPWLoadResult(file_path, result)
+    except Exception:
+        return EPWLoadResult(file_path, error=traceback.format_exc())
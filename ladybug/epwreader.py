@@ -0,0 +1,383 @@
+# coding=utf-8
+"""Streaming reader of the hourly data in EPW files.
+
+The EPWReader parses the hourly data of an .epw file one chunk of rows at a time
+instead of loading all fields of the whole year into Data Collections. Each
+chunk is yielded as an EPWDataBlock of typed columns (arrays of floats or
+integers), which keeps the peak memory bounded by the size of the chunk.
+"""
+from __future__ import division
+
+from array import array
+from bisect import bisect_left
+import os
+
+from .epw import EPW, EPWFields
+from .header import Header
+from .analysisperiod import AnalysisPeriod
+from .datacollection import HourlyContinuousCollection, HourlyDiscontinuousCollection
+from .dt import DateTime
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    xrange = range  # python 3
+
+
+class EPWReader(object):
+    """A streaming reader of the hourly data of an .epw file.
+
+    The values of point-in-time fields (eg. Dry Bulb Temperature) are shifted by
+    one hour in the same way as they are when the EPW class imports the data.
+    So the values of each row match those of the Data Collections of the EPW.
+
+    Args:
+        file_path: Local file address to an .epw file.
+        field_numbers: An optional list of values between 0 to 34 for the epw
+            fields to be read. If None, all of the fields of the epw will be
+            read. (Default: None).
+
+    Properties:
+        * file_path
+        * field_numbers
+        * location
+        * metadata
+        * is_leap_year
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.epwreader import EPWReader
+
+        reader = EPWReader('./epws/denver.epw', field_numbers=(6, 8))
+        for block in reader.iter_chunks(chunk_size=168):
+            dbt = block[6]  # an array of dry bulb temperatures for one week
+            print(block.start, max(dbt))
+    """
+    __slots__ = ('_epw', '_field_numbers', '_num_of_fields')
+
+    def __init__(self, file_path, field_numbers=None):
+        """Initialize EPW reader."""
+        self._epw = EPW(file_path)
+        self._epw._import_data(import_header_only=True)
+        with open(self._epw.file_path, 'rb') as epwin:
+            for i in xrange(8):
+                epwin.readline()
+            row = epwin.readline()
+        self._num_of_fields = min(len(row.strip().split(b',')), 35)
+
+        if field_numbers is None:
+            field_numbers = xrange(self._num_of_fields)
+        field_numbers = tuple(int(num) for num in field_numbers)
+        for num in field_numbers:
+            assert 0 <= num < self._num_of_fields, 'Field number should be ' \
+                'between 0-{}. Got {}.'.format(self._num_of_fields - 1, num)
+        self._field_numbers = field_numbers
+
+    @property
+    def file_path(self):
+        """Get the path to the EPW file."""
+        return self._epw.file_path
+
+    @property
+    def field_numbers(self):
+        """Get a tuple of the epw field numbers that are read."""
+        return self._field_numbers
+
+    @property
+    def location(self):
+        """Get a Ladybug Location object for the EPW."""
+        return self._epw.location
+
+    @property
+    def metadata(self):
+        """Get a dictionary of the metadata assigned to all data of the EPW."""
+        return self._epw.metadata
+
+    @property
+    def is_leap_year(self):
+        """Boolean to denote whether the EPW is a leap year or not."""
+        return self._epw.is_leap_year
+
+    def iter_chunks(self, chunk_size=168):
+        """Get a generator of the hourly data in blocks of a fixed number of rows.
+
+        Args:
+            chunk_size: An integer for the number of hourly rows in each block.
+                The last block of the year may have fewer rows. (Default: 168,
+                which is one week of hourly data).
+
+        Returns:
+            A generator of EPWDataBlock objects. The start of each block is the
+            index of its first row within the annual data.
+        """
+        assert chunk_size > 0, 'EPWReader chunk_size must be greater than 0. ' \
+            'Got {}.'.format(chunk_size)
+        converters = [_column_converter(num) for num in self._field_numbers]
+        point_in_time = [
+            EPWFields.field_by_number(num).name.point_in_time
+            for num in self._field_numbers]
+        # the first hour of point-in-time fields is the last row of the file
+        last_row = _last_row(self._epw.file_path).split(b',')
+        carry = [conv([last_row[num]])[0]
+                 for num, conv in zip(self._field_numbers, converters)]
+
+        start = 0
+        with open(self._epw.file_path, 'rb') as epwin:
+            for i in xrange(8):
+                epwin.readline()
+            while True:
+                rows = []
+                for i in xrange(chunk_size):
+                    line = epwin.readline()
+                    if not line:
+                        break
+                    rows.append(line.strip().split(b','))
+                if not rows:
+                    return
+                columns = []
+                for i, num in enumerate(self._field_numbers):
+                    column = converters[i]([row[num] for row in rows])
+                    if point_in_time[i]:  # shift the values by one hour
+                        column.insert(0, carry[i])
+                        carry[i] = column.pop()
+                    columns.append(column)
+                yield EPWDataBlock(self, columns, xrange(start, start + len(rows)))
+                start += len(rows)
+
+    def iter_windows(self, analysis_periods, chunk_size=744):
+        """Get a generator of the hourly data within several analysis periods.
+
+        The file is read only once for all of the analysis periods and only the
+        rows that fall within each period are kept in memory. Each window is
+        yielded as soon as all of its rows have been read, meaning that the
+        windows are yielded in the order that they end within the file.
+
+        Args:
+            analysis_periods: A list of hourly AnalysisPeriods for the windows
+                of data to be read.
+            chunk_size: An integer for the number of rows that are parsed from
+                the file at once. (Default: 744, which is 31 days).
+
+        Returns:
+            A generator of EPWDataBlock objects, each of which has the
+            analysis_period of its window.
+        """
+        windows = []
+        for a_per in analysis_periods:
+            assert isinstance(a_per, AnalysisPeriod), 'Expected AnalysisPeriod ' \
+                'for EPWReader window. Got {}.'.format(type(a_per))
+            assert a_per.timestep == 1, 'EPWReader windows must have an hourly ' \
+                'timestep. Got {}.'.format(a_per.timestep)
+            assert a_per.is_leap_year == self.is_leap_year, 'EPWReader window ' \
+                'is_leap_year ({}) does not match the EPW ({}).'.format(
+                    a_per.is_leap_year, self.is_leap_year)
+            windows.append(_Window(a_per))
+        if not windows:
+            return
+
+        for chunk in self.iter_chunks(chunk_size):
+            chunk_st, chunk_end = chunk.start, chunk.start + len(chunk)
+            for window in windows:
+                if window.columns is None:
+                    window.columns = [_empty_column(col, len(window.rows))
+                                      for col in chunk.columns]
+                window.fill(chunk.columns, chunk_st, chunk_end)
+            for window in windows:
+                if window.last_row < chunk_end:
+                    yield EPWDataBlock(self, window.columns, window.rows,
+                                       window.analysis_period)
+            windows = [win for win in windows if win.last_row >= chunk_end]
+            if not windows:
+                return
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """EPW reader representation."""
+        return 'EPW Reader [{}] ({} fields)'.format(
+            self._epw.location.city, len(self._field_numbers))
+
+
+class EPWDataBlock(object):
+    """A block of rows of hourly EPW data stored as typed columns.
+
+    Columns of float fields are arrays of doubles, columns of integer fields are
+    arrays of integers and columns of text fields are lists of strings.
+
+    Args:
+        reader: The EPWReader that produced the block.
+        columns: A list of columns with one column for each field number
+            of the reader.
+        rows: A sequence of integers for the index of each row of the block
+            within the annual data.
+        analysis_period: An optional AnalysisPeriod for the window of the
+            block. (Default: None).
+
+    Properties:
+        * field_numbers
+        * columns
+        * start
+        * rows
+        * hoys
+        * analysis_period
+    """
+    __slots__ = ('_reader', '_columns', '_rows', '_analysis_period')
+
+    def __init__(self, reader, columns, rows, analysis_period=None):
+        """Initialize EPW data block."""
+        self._reader = reader
+        self._columns = tuple(columns)
+        self._rows = rows
+        self._analysis_period = analysis_period
+
+    @property
+    def field_numbers(self):
+        """Get a tuple of the epw field numbers of the columns."""
+        return self._reader.field_numbers
+
+    @property
+    def columns(self):
+        """Get a tuple with the column of values for each field."""
+        return self._columns
+
+    @property
+    def start(self):
+        """Get an integer for the index of the first row within the annual data."""
+        return self._rows[0]
+
+    @property
+    def rows(self):
+        """Get a sequence with the index of each row within the annual data."""
+        return self._rows
+
+    @property
+    def hoys(self):
+        """Get a tuple with the hour of the year of each row."""
+        return tuple(float(row) for row in self._rows)
+
+    @property
+    def analysis_period(self):
+        """Get the AnalysisPeriod of the block or None if it is not a window."""
+        return self._analysis_period
+
+    def column(self, field_number):
+        """Get the column of values for an epw field number."""
+        try:
+            return self._columns[self._reader.field_numbers.index(field_number)]
+        except ValueError:
+            raise ValueError('Field number {} is not in the EPWDataBlock. Available '
+                             'fields are {}.'.format(field_number, self.field_numbers))
+
+    def to_collection(self, field_number):
+        """Get a Data Collection with the values of an epw field number.
+
+        The Data Collection is continuous when the block has an analysis_period
+        that covers whole days and it is discontinuous otherwise.
+        """
+        field = EPWFields.field_by_number(field_number)
+        values = list(self.column(field_number))
+        is_leap_year = self._reader.is_leap_year
+        a_per = self._analysis_period
+        if a_per is not None and a_per.st_hour == 0 and a_per.end_hour == 23:
+            header = Header(field.name, field.unit, a_per, dict(self._reader.metadata))
+            return HourlyContinuousCollection(header, values)
+        if a_per is None:
+            a_per = AnalysisPeriod.interned(is_leap_year=is_leap_year)
+        header = Header(field.name, field.unit, a_per, dict(self._reader.metadata))
+        datetimes = [DateTime.from_hoy(row, is_leap_year) for row in self._rows]
+        return HourlyDiscontinuousCollection(header, values, datetimes)
+
+    def to_collections(self):
+        """Get a list of Data Collections with one for each field of the block."""
+        return [self.to_collection(num) for num in self.field_numbers]
+
+    def __getitem__(self, field_number):
+        return self.column(field_number)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """EPW data block representation."""
+        return 'EPW Data Block ({} rows x {} fields, starting at row {})'.format(
+            len(self._rows), len(self._columns), self.start)
+
+
+class _Window(object):
+    """The rows of an analysis period that are being collected from a reader."""
+    __slots__ = ('analysis_period', 'rows', 'last_row', 'columns', '_runs')
+
+    def __init__(self, analysis_period):
+        self.analysis_period = analysis_period
+        self.rows = analysis_period.hoys_int
+        self.last_row = max(self.rows)
+        self.columns = None
+        # group the rows into runs of consecutive rows to copy them as slices
+        self._runs = []  # (first row, last row + 1, position in the window)
+        for pos, row in enumerate(self.rows):
+            if self._runs and self._runs[-1][1] == row:
+                self._runs[-1][1] += 1
+            else:
+                self._runs.append([row, row + 1, pos])
+        self._runs.sort()
+
+    def fill(self, chunk_columns, chunk_st, chunk_end):
+        """Copy the rows of a chunk that fall within the window."""
+        i = max(bisect_left(self._runs, [chunk_st]) - 1, 0)
+        for run_st, run_end, pos in self._runs[i:]:
+            if run_st >= chunk_end:
+                break
+            st, end = max(run_st, chunk_st), min(run_end, chunk_end)
+            if st >= end:
+                continue
+            w_st = pos + st - run_st
+            for col, chunk_col in zip(self.columns, chunk_columns):
+                col[w_st:w_st + end - st] = chunk_col[st - chunk_st:end - chunk_st]
+
+
+def _column_converter(field_number):
+    """Get a function that converts a list of raw text into a typed column."""
+    value_type = EPWFields.field_by_number(field_number).value_type
+    if value_type is float:
+        return lambda raw: array('d', [float(v) for v in raw])
+    elif value_type is int:
+        def _to_ints(raw):
+            try:
+                return array('i', [int(v) for v in raw])
+            except ValueError:  # some files write integer fields as floats
+                return array('i', [int(round(float(v))) for v in raw])
+        return _to_ints
+    return lambda raw: [v.decode('utf-8') if not isinstance(v, str) else v
+                        for v in raw]
+
+
+def _empty_column(column, length):
+    """Get an empty column of the same type as another column."""
+    if isinstance(column, array):
+        return array(column.typecode, [0]) * length
+    return [None] * length
+
+
+def _last_row(file_path):
+    """Get the last row of data in a file without reading the whole file."""
+    with open(file_path, 'rb') as epwin:
+        epwin.seek(0, os.SEEK_END)
+        position = epwin.tell()
+        tail = b''
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            epwin.seek(position)
+            tail = epwin.read(step) + tail
+            rows = tail.strip().split(b'\n')
+            if len(rows) > 1:
+                return rows[-1].strip()
+        return tail.strip()
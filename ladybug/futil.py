@@ -5,7 +5,10 @@ from __future__ import division
 import os
 import shutil
 import zipfile
+import gzip
+import io
 import sys
+from itertools import islice
 from distutils import dir_util
 
 if (sys.version_info < (3, 0)):
@@ -127,6 +130,40 @@ def write_to_file(file_path, data, mkdir=False):
     return write_to_file_by_name(folder, fname, data, mkdir)
 
 
+def write_lines_to_file(file_path, lines, mkdir=False, chunk_size=1024):
+    """Write an iterable of text lines to file in buffered chunks.
+
+    Unlike write_to_file, the lines are never joined into a single string of
+    the whole file and so they can be generated while the file is written.
+
+    Args:
+        file_path: Full path for a valid file path (e.g. c:/ladybug/testPts.pts)
+        lines: An iterable of strings, each of which should end with a line break.
+        mkdir: Set to True to create the directory if doesn't exist (Default: False)
+        chunk_size: An integer for the number of lines that are joined and
+            written to the file at once. (Default: 1024).
+    """
+    folder, fname = os.path.split(file_path)
+    if not os.path.isdir(folder):
+        if mkdir:
+            preparedir(folder)
+        else:
+            created = preparedir(folder, False)
+            if not created:
+                raise ValueError("Failed to find %s." % folder)
+
+    lines = iter(lines)
+    with open(file_path, writemode) as outf:
+        while True:
+            chunk = ''.join(islice(lines, chunk_size))
+            if not chunk:
+                return file_path
+            try:
+                outf.write(chunk)
+            except Exception as e:
+                raise IOError("Failed to write %s to file:\n\t%s" % (fname, str(e)))
+
+
 def copy_files_to_folder(files, target_folder, overwrite=True):
     """Copy a list of files to a new target folder.
 
@@ -316,6 +353,101 @@ def unzip_file(source_file, dest_dir=None, mkdir=False):
             zf.extract(member, dest_dir)
 
 
+def zip_member_path(file_path):
+    """Split a path to a file inside of a zip archive into the archive and member.
+
+    Args:
+        file_path: A path that goes through a zip archive as if it were a folder
+            (e.g. c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.epw).
+
+    Returns:
+        A tuple with the path to the zip archive and the name of the member
+        within the archive. Both are None if the path is not inside a zip archive.
+    """
+    head, members = os.path.normpath(file_path), []
+    while True:
+        if head.lower().endswith('.zip') and os.path.isfile(head):
+            return (head, '/'.join(reversed(members))) if members else (None, None)
+        head, tail = os.path.split(head)
+        if not tail:
+            return None, None
+        members.append(tail)
+
+
+def is_compressed_path(file_path):
+    """Check whether a path is to a .gz file or to a file inside of a zip archive."""
+    return file_path.lower().endswith('.gz') or \
+        zip_member_path(file_path)[0] is not None
+
+
+def uncompressed_path(file_path):
+    """Get a file path without any .gz extension (e.g. for checking the file type)."""
+    return file_path[:-3] if file_path.lower().endswith('.gz') else file_path
+
+
+def compressed_file_exists(file_path):
+    """Check whether a .gz file or a file inside of a zip archive exists."""
+    archive, member = zip_member_path(file_path)
+    if archive is None:
+        return os.path.isfile(file_path)
+    with zipfile.ZipFile(archive) as zf:
+        return _zip_member_name(zf, member) is not None
+
+
+def open_compressed_file(file_path):
+    """Open a .gz file or a file inside of a zip archive for reading.
+
+    The file is decompressed as it is read without being extracted to disk.
+
+    Args:
+        file_path: Path to a .gz file or to a file inside of a zip archive
+            (e.g. c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.epw).
+
+    Returns:
+        A file object of text (or of bytes in Python 2), which should be closed
+        once it is no longer needed.
+    """
+    archive, member = zip_member_path(file_path)
+    if archive is not None:
+        with zipfile.ZipFile(archive) as zf:
+            return open_zip_member(zf, member)
+    return _text_stream(gzip.open(file_path, 'rb'))
+
+
+def open_zip_member(zip_file, member):
+    """Open a file inside of an open zip archive for reading.
+
+    Args:
+        zip_file: An open zipfile.ZipFile object.
+        member: Text for the name of the file within the archive. Backslashes
+            are accepted in place of forward slashes.
+
+    Returns:
+        A file object of text (or of bytes in Python 2), which should be closed
+        once it is no longer needed.
+    """
+    name = _zip_member_name(zip_file, member)
+    if name is None:
+        raise ValueError('Failed to find {} in {}.'.format(member, zip_file.filename))
+    return _text_stream(zip_file.open(name))
+
+
+def _zip_member_name(zip_file, member):
+    """Get the name of a member in a zip archive, accounting for path separators."""
+    names = zip_file.namelist()
+    for name in (member, member.replace('\\', '/'), member.replace('/', '\\')):
+        if name in names:
+            return name
+
+
+def _text_stream(raw_file):
+    """Wrap a binary file object such that it reads text in the same way as readmode.
+    """
+    if sys.version_info < (3, 0):
+        return raw_file
+    return io.TextIOWrapper(raw_file, encoding='utf-8', errors='ignore')
+
+
 def csv_to_matrix(csv_file_path):
     """Load a CSV file into a Python matrix of strings.
 
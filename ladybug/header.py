@@ -97,9 +97,9 @@ class Header(object):
 
     def duplicate(self):
         """Return a copy of the header."""
-        a_per = self.analysis_period.duplicate() if self.analysis_period else None
+        # analysis periods are immutable and can be shared between headers
         return self.__class__(self.data_type, self.unit,
-                              a_per, deepcopy(self.metadata))
+                              self.analysis_period, deepcopy(self.metadata))
 
     def to_tuple(self):
         """Return Ladybug header as a list."""
@@ -110,6 +110,10 @@ class Header(object):
             self.metadata
         )
 
+    def __reduce__(self):
+        return (self.__class__, (self._data_type, self._unit,
+                                 self._analysis_period, self._metadata))
+
     def __iter__(self):
         """Return data as tuple."""
         return self.to_tuple()
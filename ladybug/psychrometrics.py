@@ -3,6 +3,11 @@
 from __future__ import division
 
 import math
+from bisect import bisect_right
+try:  # python 2
+    from itertools import izip as zip
+except ImportError:  # python 3
+    xrange = range
 
 
 def saturated_vapor_pressure(t_kelvin):
@@ -87,7 +92,7 @@ def enthalpy_from_db_hr(db_temp, humid_ratio, reference_temp=0):
     return enthalpy if enthalpy >= 0 else 0
 
 
-def dew_point_from_db_rh(db_temp, rel_humid):
+def dew_point_from_db_rh(db_temp, rel_humid, tabulated=False):
     """Dew point temperature (C) from air temperature (C) and relative humidity (%).
 
     The dew point temperature is solved by inverting the equation giving water vapor
@@ -100,6 +105,13 @@ def dew_point_from_db_rh(db_temp, rel_humid):
     Args:
         db_temp: Dry bulb temperature (C).
         rel_humid: Relative humidity (%).
+        tabulated: Boolean to note whether the equation should be inverted using
+            a precomputed table of saturation vapor pressure, which is about
+            twice as fast. The table covers -100 C to 200 C and its maximum error
+            in the natural log of vapor pressure is LN_P_WS_TABLE_ERROR, which
+            is far smaller than the 0.1 C tolerance of the Newton-Raphson
+            method. Values outside of the table are solved with the
+            Newton-Raphson method. (Default: False).
 
     Returns:
         Dew point temperature (C).
@@ -112,6 +124,8 @@ def dew_point_from_db_rh(db_temp, rel_humid):
         Open Source Software, 4(33), 1137, https://doi.org/10.21105/joss.01137
         https://github.com/psychrometrics/psychrolib/blob/master/src/python/psychrolib.py
     """
+    if tabulated:
+        return _dew_point_from_db_rh_tabulated(db_temp, rel_humid)
     p_ws = saturated_vapor_pressure(db_temp + 273.15)  # saturation pressure
     p_w = p_ws * (rel_humid / 100)  # partial pressure
 
@@ -138,13 +152,16 @@ def dew_point_from_db_rh(db_temp, rel_humid):
     return min(td, db_temp)
 
 
-def wet_bulb_from_db_rh(db_temp, rel_humid, b_press=101325):
+def wet_bulb_from_db_rh(db_temp, rel_humid, b_press=101325, tabulated=False):
     """Wet bulb temperature (C) from air temperature (C) and relative humidity (%).
 
     Args:
         db_temp: Dry bulb temperature (C).
         rel_humid: Relative humidity (%).
         b_press: Air pressure (Pa). Default is pressure at sea level (101325 Pa).
+        tabulated: Boolean to note whether saturation vapor pressures should be
+            interpolated from a precomputed table, which covers -100 C to 200 C.
+            See dew_point_from_db_rh for more information. (Default: False).
 
     Returns:
         Wet bulb temperature (C).
@@ -157,6 +174,8 @@ def wet_bulb_from_db_rh(db_temp, rel_humid, b_press=101325):
         Open Source Software, 4(33), 1137, https://doi.org/10.21105/joss.01137
         https://github.com/psychrometrics/psychrolib/blob/master/src/python/psychrolib.py
     """
+    if tabulated:
+        return _wet_bulb_from_db_rh_tabulated(db_temp, rel_humid, b_press)
     humid_ratio = humid_ratio_from_db_rh(db_temp, rel_humid, b_press)
     # Initial guesses
     wb_temp_sup = db_temp
@@ -314,14 +333,7 @@ def humid_ratio_from_db_wb(db_temp, wb_temp, b_press=101325):
         [1] ASHRAE Handbook - Fundamentals (2017) ch. 1 eqn 36, solved for W
     """
     p_ws = saturated_vapor_pressure(wb_temp + 273.15)
-    p_ws_star = 0.621945 * p_ws / (b_press - p_ws)
-    if wb_temp >= 0:
-        humid_ratio = ((2501. - 2.326 * wb_temp) * p_ws_star - 1.006 * (db_temp - wb_temp)) \
-            / (2501. + 1.86 * db_temp - 4.186 * wb_temp)
-    else:
-        humid_ratio = ((2830. - 0.24 * wb_temp) * p_ws_star - 1.006 * (db_temp - wb_temp)) \
-            / (2830. + 1.86 * db_temp - 2.1 * wb_temp)
-    return humid_ratio
+    return _humid_ratio_from_wb_p_ws(db_temp, wb_temp, p_ws, b_press)
 
 
 def db_temp_from_enth_hr(enthalpy, humid_ratio, reference_temp=0):
@@ -345,6 +357,311 @@ def db_temp_from_enth_hr(enthalpy, humid_ratio, reference_temp=0):
     return db_temp + reference_temp
 
 
+def saturated_vapor_pressure_array(t_kelvin):
+    """Saturated vapor pressures (Pa) for a list of dry bulb temperatures (K).
+
+    This is the list-processing version of saturated_vapor_pressure, which
+    evaluates all values in one pass instead of one function call per value.
+
+    Args:
+        t_kelvin: A list of dry bulb temperatures (K).
+
+    Returns:
+        A list of saturated vapor pressures (Pa).
+    """
+    exp = math.exp
+    return [exp(ln_p_ws) for ln_p_ws in _ln_p_ws_array(t_kelvin)]
+
+
+def humid_ratio_from_db_rh_array(db_temp, rel_humid, b_press=101325):
+    """Humidity ratios (water/air) from lists of temperatures (C) and humidities (%).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        rel_humid: A list of relative humidities (%).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of humidity ratios (kg water/kg air).
+    """
+    b_press = _as_list(b_press, len(db_temp))
+    p_ws = saturated_vapor_pressure_array([t + 273.15 for t in db_temp])
+    p_w = [p * (rh / 100) for p, rh in zip(p_ws, rel_humid)]
+    return [(p * 0.621945) / (bp - p) for p, bp in zip(p_w, b_press)]
+
+
+def enthalpy_from_db_hr_array(db_temp, humid_ratio, reference_temp=0):
+    """Enthalpies (kJ/kg) from lists of humidity ratios (water/air) and temperatures (C).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        humid_ratio: A list of humidity ratios (kg water/kg air).
+        reference_temp: Reference dry air temperature (C) as a single number or
+            a list. Default is 0C. See enthalpy_from_db_hr for other options.
+
+    Returns:
+        A list of enthalpies (kJ/kg).
+    """
+    reference_temp = _as_list(reference_temp, len(db_temp))
+    enthalpy = []
+    for t, hr, ref_t in zip(db_temp, humid_ratio, reference_temp):
+        correct_temp = t - ref_t
+        enth = 1.006 * correct_temp + hr * (2501. + 1.86 * correct_temp)
+        enthalpy.append(enth if enth >= 0 else 0)
+    return enthalpy
+
+
+def dew_point_from_db_rh_array(db_temp, rel_humid, tabulated=False):
+    """Dew point temperatures (C) from lists of temperatures (C) and humidities (%).
+
+    This uses the same Newton-Raphson method as dew_point_from_db_rh but all
+    values are iterated together. Each iteration only evaluates the values
+    that have not yet converged to the 0.1 C tolerance and the iterations stop
+    once every value has converged.
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        rel_humid: A list of relative humidities (%).
+        tabulated: Boolean to note whether the precomputed table of saturation
+            vapor pressure should be used instead of Newton-Raphson iterations.
+            See dew_point_from_db_rh for more information. (Default: False).
+
+    Returns:
+        A list of dew point temperatures (C).
+    """
+    if tabulated:
+        return [_dew_point_from_db_rh_tabulated(t, rh)
+                for t, rh in zip(db_temp, rel_humid)]
+    log = math.log
+    p_ws = saturated_vapor_pressure_array([t + 273.15 for t in db_temp])
+    ln_vp = [log(p * (rh / 100)) if p * rh > 0 else None
+             for p, rh in zip(p_ws, rel_humid)]
+    dew_pt = list(db_temp)  # first guess for dew point temperature
+    active = [i for i, lvp in enumerate(ln_vp) if lvp is not None]
+
+    index = 1
+    while active:
+        td_iter = [dew_pt[i] for i in active]
+        ln_vp_iter = _ln_p_ws_array([td + 273.15 for td in td_iter])
+        d_ln_vp = _d_ln_p_ws_array(td_iter)
+        not_converged = []
+        for i, td, ln_vp_i, d_ln_vp_i in zip(active, td_iter, ln_vp_iter, d_ln_vp):
+            dew_pt[i] = td - (ln_vp_i - ln_vp[i]) / d_ln_vp_i
+            if math.fabs(dew_pt[i] - td) > 0.1:  # 0.1 is degree C tolerance
+                not_converged.append(i)
+        if index > 100:  # 100 is the max iterations (usually only 3-5 are needed)
+            break
+        active = not_converged
+        index = index + 1
+
+    return [-273.15 if lvp is None else min(td, t)
+            for td, t, lvp in zip(dew_pt, db_temp, ln_vp)]
+
+
+def wet_bulb_from_db_rh_array(db_temp, rel_humid, b_press=101325, tabulated=False):
+    """Wet bulb temperatures (C) from lists of temperatures (C) and humidities (%).
+
+    This uses the same bisection method as wet_bulb_from_db_rh but all values
+    are bisected together until the bounds of every value are within 0.1 C.
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        rel_humid: A list of relative humidities (%).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+        tabulated: Boolean to note whether the precomputed table of saturation
+            vapor pressure should be used. See dew_point_from_db_rh for more
+            information. (Default: False).
+
+    Returns:
+        A list of wet bulb temperatures (C).
+    """
+    b_press = _as_list(b_press, len(db_temp))
+    if tabulated:
+        return [wet_bulb_from_db_rh(t, rh, bp, True)
+                for t, rh, bp in zip(db_temp, rel_humid, b_press)]
+    humid_ratio = humid_ratio_from_db_rh_array(db_temp, rel_humid, b_press)
+    # initial guesses
+    wb_temp_sup = list(db_temp)
+    wb_temp_inf = dew_point_from_db_rh_array(db_temp, rel_humid)
+    wb_temp = [(inf + sup) / 2 for inf, sup in zip(wb_temp_inf, wb_temp_sup)]
+    active = [i for i in xrange(len(wb_temp)) if wb_temp_sup[i] - wb_temp_inf[i] > 0.1]
+
+    index = 1
+    while active:
+        w_star = humid_ratio_from_db_wb_array(
+            [db_temp[i] for i in active], [wb_temp[i] for i in active],
+            [b_press[i] for i in active])
+        for i, w_st in zip(active, w_star):
+            if w_st > humid_ratio[i]:
+                wb_temp_sup[i] = wb_temp[i]
+            else:
+                wb_temp_inf[i] = wb_temp[i]
+            wb_temp[i] = (wb_temp_sup[i] + wb_temp_inf[i]) / 2
+        if index >= 100:
+            break  # 100 is the max iterations (usually only 3-5 are needed)
+        active = [i for i in active if wb_temp_sup[i] - wb_temp_inf[i] > 0.1]
+        index = index + 1
+    return wb_temp
+
+
+def rel_humid_from_db_hr_array(db_temp, humid_ratio, b_press=101325):
+    """Relative humidities (%) from lists of humidity ratios and temperatures (C).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        humid_ratio: A list of humidity ratios (kg water/kg air).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of relative humidities (%).
+    """
+    b_press = _as_list(b_press, len(db_temp))
+    pws = saturated_vapor_pressure_array([t + 273.15 for t in db_temp])
+    return [(((hr * 1000 * bp) / (621.9907 + (hr * 1000))) / p) * 100
+            for hr, bp, p in zip(humid_ratio, b_press, pws)]
+
+
+def rel_humid_from_db_enth_array(db_temp, enthalpy, b_press=101325, reference_temp=0):
+    """Relative humidities (%) from lists of temperatures (C) and enthalpies (kJ/kg).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        enthalpy: A list of enthalpies (kJ/kg).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+        reference_temp: Reference dry air temperature (C) as a single number or
+            a list. Default is 0C. See enthalpy_from_db_hr for other options.
+
+    Returns:
+        A list of relative humidities (%).
+    """
+    return rel_humid_from_db_hr_array(
+        db_temp, _humid_ratio_from_db_enth_array(db_temp, enthalpy, reference_temp),
+        b_press)
+
+
+def rel_humid_from_db_dpt_array(db_temp, dew_pt):
+    """Relative humidities (%) from lists of dry bulb and dew point temperatures (C).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        dew_pt: A list of dew point temperatures (C).
+
+    Returns:
+        A list of relative humidities (%).
+    """
+    pws_ta = saturated_vapor_pressure_array([t + 273.15 for t in db_temp])
+    pws_td = saturated_vapor_pressure_array([t + 273.15 for t in dew_pt])
+    return [100 * (p_td / p_ta) for p_td, p_ta in zip(pws_td, pws_ta)]
+
+
+def rel_humid_from_db_wb_array(db_temp, wet_bulb, b_press=101325):
+    """Relative humidities (%) from lists of dry bulb and wet bulb temperatures (C).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        wet_bulb: A list of wet bulb temperatures (C).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of relative humidities (%).
+    """
+    b_press = _as_list(b_press, len(db_temp))
+    p_ws = saturated_vapor_pressure_array([t + 273.15 for t in db_temp])
+    p_ws_wb = saturated_vapor_pressure_array([t + 273.15 for t in wet_bulb])
+    return [((p_wb - (bp * 0.000662 * (t - wb))) / p) * 100
+            for t, wb, bp, p, p_wb in zip(db_temp, wet_bulb, b_press, p_ws, p_ws_wb)]
+
+
+def dew_point_from_db_hr_array(db_temp, humid_ratio, b_press=101325):
+    """Dew point temperatures (C) from lists of temperatures (C) and humidity ratios.
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        humid_ratio: A list of humidity ratios (kg water/kg air).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of dew point temperatures (C).
+    """
+    rh = rel_humid_from_db_hr_array(db_temp, humid_ratio, b_press)
+    return dew_point_from_db_rh_array(db_temp, rh)
+
+
+def dew_point_from_db_enth_array(db_temp, enthlpy, b_press=101325, reference_temp=0):
+    """Dew point temperatures (C) from lists of temperatures (C) and enthalpies (kJ/kg).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        enthalpy: A list of enthalpies (kJ/kg).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+        reference_temp: Reference dry air temperature (C) as a single number or
+            a list. Default is 0C. See enthalpy_from_db_hr for other options.
+
+    Returns:
+        A list of dew point temperatures (C).
+    """
+    rh = rel_humid_from_db_enth_array(db_temp, enthlpy, b_press, reference_temp)
+    return dew_point_from_db_rh_array(db_temp, rh)
+
+
+def dew_point_from_db_wb_array(db_temp, wet_bulb, b_press=101325):
+    """Dew point temperatures (C) from lists of dry bulb and wet bulb temperatures (C).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        wet_bulb: A list of wet bulb temperatures (C).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of dew point temperatures (C).
+    """
+    rh = rel_humid_from_db_wb_array(db_temp, wet_bulb, b_press)
+    return dew_point_from_db_rh_array(db_temp, rh)
+
+
+def humid_ratio_from_db_wb_array(db_temp, wb_temp, b_press=101325):
+    """Humidity ratios from lists of dry bulb and wet bulb temperatures (C).
+
+    Args:
+        db_temp: A list of dry bulb temperatures (C).
+        wb_temp: A list of wet bulb temperatures (C).
+        b_press: Air pressure (Pa) as a single number or a list with one value
+            for each temperature. Default is pressure at sea level (101325 Pa).
+
+    Returns:
+        A list of humidity ratios (kg water / kg air).
+    """
+    b_press = _as_list(b_press, len(db_temp))
+    p_ws = saturated_vapor_pressure_array([t + 273.15 for t in wb_temp])
+    return [_humid_ratio_from_wb_p_ws(t, wb, p, bp)
+            for t, wb, bp, p in zip(db_temp, wb_temp, b_press, p_ws)]
+
+
+def db_temp_from_enth_hr_array(enthalpy, humid_ratio, reference_temp=0):
+    """Dry bulb temperatures (C) from lists of enthalpies (kJ/kg) and humidity ratios.
+
+    Args:
+        enthalpy: A list of enthalpies (kJ/kg).
+        humid_ratio: A list of humidity ratios (kg water/kg air).
+        reference_temp: Reference dry air temperature (C) as a single number or
+            a list. Default is 0C. See enthalpy_from_db_hr for other options.
+
+    Returns:
+        A list of dry bulb temperatures (C).
+    """
+    reference_temp = _as_list(reference_temp, len(enthalpy))
+    return [(enth - 2501. * hr) / (1.006 + 1.86 * hr) + ref_t
+            for enth, hr, ref_t in zip(enthalpy, humid_ratio, reference_temp)]
+
+
 def dew_point_from_db_rh_fast(db_temp, rel_humid):
     """Dew point temperature (C) from air temperature (C) and relative humidity (%).
 
@@ -444,3 +761,194 @@ def _d_ln_p_ws(db_temp):
             4.1764768E-05 * T - 3 * 1.4452093E-08 * math.pow(T, 2) + \
             6.5459673 / T
     return d_ln_p_ws
+
+
+def _ln_p_ws_array(t_kelvin):
+    """Get the natural log of saturation vapor pressures (Pa) for temperatures (K).
+
+    The equation for each value is selected by whether it is below or above the
+    freezing point of water, matching saturated_vapor_pressure.
+    """
+    log = math.log
+    return [-5.6745359E+03 / t + 6.3925247 + t * (-9.677843E-03 + t * (
+            6.2215701E-07 + t * (2.0747825E-09 - 9.484024E-13 * t))) +
+            4.1635019 * log(t) if t <= 273.15 else
+            -5.8002206E+03 / t + 1.3914993 + t * (-4.8640239E-02 + t * (
+                4.1764768E-05 - 1.4452093E-08 * t)) + 6.5459673 * log(t)
+            for t in t_kelvin]
+
+
+def _d_ln_p_ws_array(db_temp):
+    """Get the derivative of _ln_p_ws_array for a list of dry bulb temperatures (C).
+
+    The equation for each value is selected by whether it is below or above the
+    freezing point of water, matching _d_ln_p_ws.
+    """
+    d_ln_p_ws = []
+    for td in db_temp:
+        t = td + 273.15  # temperature in kelvin
+        if td <= 0.:
+            d_ln_p_ws.append(5.6745359E+03 / (t * t) - 9.677843E-03 + t * (
+                2 * 6.2215701E-07 + t * (3 * 2.0747825E-09 - 4 * 9.484024E-13 * t)) +
+                4.1635019 / t)
+        else:
+            d_ln_p_ws.append(5.8002206E+03 / (t * t) - 4.8640239E-02 + t * (
+                2 * 4.1764768E-05 - 3 * 1.4452093E-08 * t) + 6.5459673 / t)
+    return d_ln_p_ws
+
+
+def _humid_ratio_from_db_enth_array(db_temp, enthalpy, reference_temp=0):
+    """Get a list of humidity ratios from lists of temperatures (C) and enthalpies."""
+    reference_temp = _as_list(reference_temp, len(db_temp))
+    humid_ratio = []
+    for t, enth, ref_t in zip(db_temp, enthalpy, reference_temp):
+        correct_temp = t - ref_t
+        humid_ratio.append(
+            (enth - (1.006 * correct_temp)) / ((1.86 * correct_temp) + 2501))
+    return humid_ratio
+
+
+def _as_list(value, count):
+    """Get a list of values from either a list or a single value to be repeated."""
+    if isinstance(value, (int, float)):
+        return [value] * count
+    return value
+
+
+def _humid_ratio_from_wb_p_ws(db_temp, wb_temp, p_ws, b_press):
+    """Get humidity ratio from temperatures (C) and saturation pressure at wet bulb."""
+    p_ws_star = 0.621945 * p_ws / (b_press - p_ws)
+    if wb_temp >= 0:
+        return ((2501. - 2.326 * wb_temp) * p_ws_star - 1.006 * (db_temp - wb_temp)) \
+            / (2501. + 1.86 * db_temp - 4.186 * wb_temp)
+    return ((2830. - 0.24 * wb_temp) * p_ws_star - 1.006 * (db_temp - wb_temp)) \
+        / (2830. + 1.86 * db_temp - 2.1 * wb_temp)
+
+
+def _ln_p_ws_tabulated(db_temp):
+    """Get the natural log of saturation vapor pressure (Pa) from the table.
+
+    Temperatures on the freezing point use the interval below it such that they
+    are evaluated with the equation for ice like saturated_vapor_pressure.
+
+    Args:
+        db_temp: Dry bulb temperature (C).
+    """
+    x = (db_temp - _TABLE_MIN_TEMP) / _TABLE_STEP
+    if not 0 <= x <= _TABLE_COUNT:  # outside of the table
+        return math.log(saturated_vapor_pressure(db_temp + 273.15))
+    i = int(x)
+    if i == x and i != 0:  # temperature on a node; use the interval below it
+        i -= 1
+    u = x - i
+    a, b, c, d = _LN_P_WS_TABLE[i]
+    return a + u * (b + u * (c + u * d))
+
+
+def _dew_point_from_db_rh_tabulated(db_temp, rel_humid):
+    """Get dew point temperature (C) by inverting the saturation vapor pressure table.
+
+    The interval of the table is found by bisection and the cubic of that
+    interval is then solved with a few Newton-Raphson steps.
+    """
+    if rel_humid <= 0:  # relative humidity of 0, return absolute zero
+        return -273.15
+    ln_vp = _ln_p_ws_tabulated(db_temp) + math.log(rel_humid / 100)
+    i = bisect_right(_LN_P_WS_TABLE_STARTS, ln_vp) - 1
+    if i < 0 or ln_vp > _LN_P_WS_TABLE_END:  # outside of the table
+        return dew_point_from_db_rh(db_temp, rel_humid)
+    a, b, c, d = _LN_P_WS_TABLE[i]
+    y = ln_vp - a
+    u = y / b  # first guess assuming that the interval is linear
+    # one Newton-Raphson step is accurate to less than 1e-6 C on every interval
+    u -= (u * (b + u * (c + u * d)) - y) / (b + u * (2 * c + 3 * d * u))
+    u = 0 if u < 0 else 1 if u > 1 else u  # in the gap between ice and water at 0 C
+    return min(_TABLE_MIN_TEMP + (i + u) * _TABLE_STEP, db_temp)
+
+
+def _wet_bulb_from_db_rh_tabulated(db_temp, rel_humid, b_press):
+    """Get wet bulb temperature (C) using the saturation vapor pressure table.
+
+    This uses the same bisection as wet_bulb_from_db_rh, which is kept because
+    the equation for the humidity ratio changes at a wet bulb of 0 C and it can
+    have two roots near that temperature.
+    """
+    exp, ln_p_ws, hr_from_p_ws = math.exp, _ln_p_ws_tabulated, _humid_ratio_from_wb_p_ws
+    p_w = exp(ln_p_ws(db_temp)) * (rel_humid / 100)
+    humid_ratio = (p_w * 0.621945) / (b_press - p_w)
+    # Initial guesses
+    wb_temp_sup = db_temp
+    wb_temp_inf = _dew_point_from_db_rh_tabulated(db_temp, rel_humid)
+    wb_temp = (wb_temp_inf + wb_temp_sup) / 2
+
+    index = 1
+    while ((wb_temp_sup - wb_temp_inf) > 0.1):  # 0.1 is degree C tolerance
+        w_star = hr_from_p_ws(db_temp, wb_temp, exp(ln_p_ws(wb_temp)), b_press)
+        if w_star > humid_ratio:
+            wb_temp_sup = wb_temp
+        else:
+            wb_temp_inf = wb_temp
+        wb_temp = (wb_temp_sup + wb_temp_inf) / 2
+        if index >= 100:
+            break  # 100 is the max iterations (usually only 3-5 are needed)
+        index = index + 1
+    return wb_temp
+
+
+def _build_ln_p_ws_table():
+    """Build the table of cubic Hermite polynomials for ln(p_ws) over temperature.
+
+    Each interval between two nodes uses the value and the analytical derivative
+    of ln(p_ws) at the nodes, using the equation for ice or water depending on
+    the side of the freezing point that the interval is on. The error of Hermite
+    interpolation over an interval of width h is no greater than
+    h^4 / 384 * max|f^(4)|, which is used to certify the error of the table.
+
+    Returns:
+        A tuple with two items.
+
+        -   table: A tuple with the (a, b, c, d) coefficients of each interval
+            for the polynomial a + b*u + c*u^2 + d*u^3 where u is the position
+            within the interval from 0 to 1.
+
+        -   error: The maximum error of ln(p_ws) over the whole table.
+    """
+    ice = (-5.6745359E+03, (6.3925247, -9.677843E-03, 6.2215701E-07,
+                            2.0747825E-09, -9.484024E-13), 4.1635019)
+    water = (-5.8002206E+03, (1.3914993, -4.8640239E-02, 4.1764768E-05,
+                              -1.4452093E-08, 0), 6.5459673)
+
+    def ln_p_ws(coeffs, t):
+        c_inv, poly, c_ln = coeffs
+        return c_inv / t + sum(p * t ** k for k, p in enumerate(poly)) + \
+            c_ln * math.log(t)
+
+    def d_ln_p_ws(coeffs, t):
+        c_inv, poly, c_ln = coeffs
+        return -c_inv / t ** 2 + \
+            sum(k * p * t ** (k - 1) for k, p in enumerate(poly) if k > 0) + c_ln / t
+
+    def d4_ln_p_ws_bound(coeffs, t):  # every term decreases in magnitude with t
+        c_inv, poly, c_ln = coeffs
+        return 24 * abs(c_inv) / t ** 5 + 24 * abs(poly[4]) + 6 * abs(c_ln) / t ** 4
+
+    h = _TABLE_STEP
+    table, error = [], 0
+    for i in xrange(_TABLE_COUNT):
+        t_0 = _TABLE_MIN_TEMP + i * h + 273.15
+        t_1 = t_0 + h
+        coeffs = ice if t_1 <= 273.15 else water
+        y_0, y_1 = ln_p_ws(coeffs, t_0), ln_p_ws(coeffs, t_1)
+        m_0, m_1 = d_ln_p_ws(coeffs, t_0) * h, d_ln_p_ws(coeffs, t_1) * h
+        table.append((y_0, m_0, 3 * (y_1 - y_0) - 2 * m_0 - m_1,
+                      2 * (y_0 - y_1) + m_0 + m_1))
+        error = max(error, h ** 4 / 384 * d4_ln_p_ws_bound(coeffs, t_0))
+    return tuple(table), error
+
+
+# table of ln(p_ws) with a cubic polynomial for every 1 C from -100 C to 200 C
+_TABLE_MIN_TEMP, _TABLE_MAX_TEMP, _TABLE_STEP = -100., 200., 1.
+_TABLE_COUNT = int(round((_TABLE_MAX_TEMP - _TABLE_MIN_TEMP) / _TABLE_STEP))
+_LN_P_WS_TABLE, LN_P_WS_TABLE_ERROR = _build_ln_p_ws_table()
+_LN_P_WS_TABLE_STARTS = tuple(coeffs[0] for coeffs in _LN_P_WS_TABLE)
+_LN_P_WS_TABLE_END = sum(_LN_P_WS_TABLE[-1])
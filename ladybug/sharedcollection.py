@@ -0,0 +1,169 @@
+# coding=utf-8
+"""Data Collection values that live in shared memory for use by other processes.
+
+A SharedCollection copies the values of a numerical Data Collection into a block
+of shared memory once. Pickling the SharedCollection to send it to a worker process
+only sends the name of the memory block along with the header and compact
+datetimes of the collection. The worker can then read the values directly from
+the shared memory without them being copied through the pickle.
+
+Note that shared memory requires Python 3.8 or above.
+"""
+from __future__ import division
+
+from array import array
+
+from ._datacollectionbase import BaseCollection, _rebuild_collection
+
+try:
+    from multiprocessing import shared_memory  # python >= 3.8
+except ImportError:  # python 2, IronPython or older python 3
+    shared_memory = None
+
+
+class SharedCollection(object):
+    """A Data Collection with values stored in a block of shared memory.
+
+    The process that creates the SharedCollection owns the memory block and
+    should call unlink() once all other processes are done with it. Every
+    process should call close() once it no longer needs the values.
+
+    Args:
+        data_collection: A Data Collection with values that are floats and/or
+            32-bit integers. A mix of integers and floats is shared as floats.
+        name: Optional text for the name of the shared memory block. If None,
+            a unique name is generated. (Default: None).
+
+    Properties:
+        * name
+        * header
+        * values
+
+    Usage:
+
+    .. code-block:: python
+
+        from concurrent.futures import ProcessPoolExecutor
+        from ladybug.epw import EPW
+        from ladybug.sharedcollection import SharedCollection
+
+        def annual_average(shared_coll):
+            average = sum(shared_coll.values) / len(shared_coll)
+            shared_coll.close()
+            return average
+
+        epw = EPW('./epws/denver.epw')
+        shared_dbt = SharedCollection(epw.dry_bulb_temperature)
+        with ProcessPoolExecutor() as executor:
+            print(executor.submit(annual_average, shared_dbt).result())
+        shared_dbt.close()
+        shared_dbt.unlink()
+    """
+    __slots__ = ('_shm', '_class', '_header', '_typecode', '_length',
+                 '_datetimes', '_validated_a_period')
+
+    def __init__(self, data_collection, name=None):
+        """Initialize shared collection."""
+        assert shared_memory is not None, \
+            'SharedCollection requires multiprocessing.shared_memory (Python >= 3.8).'
+        assert isinstance(data_collection, BaseCollection), 'Expected Data ' \
+            'Collection for SharedCollection. Got {}.'.format(type(data_collection))
+        typecode = data_collection._values_typecode()
+        assert typecode is not None, 'SharedCollection values must be floats ' \
+            'and/or 32-bit integers.'
+        if typecode == 'm':  # share a mix of integers and floats as floats
+            typecode = 'd'
+        length = len(data_collection)
+        raw = array(typecode, data_collection._values).tobytes()
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=max(len(raw), 1))
+        self._shm.buf[:len(raw)] = raw
+        self._class = data_collection.__class__
+        self._header = data_collection.header
+        self._typecode = typecode
+        self._length = length
+        self._datetimes = data_collection._reduced_datetimes()
+        self._validated_a_period = data_collection._validated_a_period
+
+    @classmethod
+    def _attach(cls, name, collection_class, header, typecode, length,
+                datetimes, validated_a_period):
+        """Attach to the shared memory block of an existing SharedCollection."""
+        try:  # avoid tracking the memory block in processes that do not own it
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # python < 3.13
+            shm = shared_memory.SharedMemory(name=name)
+        shared_coll = cls.__new__(cls)
+        shared_coll._shm = shm
+        shared_coll._class = collection_class
+        shared_coll._header = header
+        shared_coll._typecode = typecode
+        shared_coll._length = length
+        shared_coll._datetimes = datetimes
+        shared_coll._validated_a_period = validated_a_period
+        return shared_coll
+
+    @property
+    def name(self):
+        """Text for the name of the shared memory block."""
+        return self._shm.name
+
+    @property
+    def header(self):
+        """The Ladybug Header of the collection."""
+        return self._header
+
+    @property
+    def values(self):
+        """A read-only memoryview of the values in the shared memory block.
+
+        The values are read directly from the shared memory without being copied.
+        Note that the memoryview should be released before calling close().
+        """
+        view = self._shm.buf[:self._length * array(self._typecode).itemsize]
+        return view.toreadonly().cast(self._typecode)
+
+    def to_collection(self):
+        """Get a Data Collection with a copy of the values in shared memory."""
+        view = self.values
+        try:
+            values = view.tolist()
+        finally:
+            view.release()
+        return _rebuild_collection(self._class, self._header, None, values,
+                                   self._datetimes, self._validated_a_period)
+
+    def close(self):
+        """Close access to the shared memory block from this process."""
+        self._shm.close()
+
+    def unlink(self):
+        """Request that the shared memory block be destroyed.
+
+        This should only be called once by the process that created the
+        SharedCollection.
+        """
+        self._shm.unlink()
+
+    def __reduce__(self):
+        # send only the name of the memory block instead of the values
+        return (_attach_shared_collection,
+                (self._shm.name, self._class, self._header, self._typecode,
+                 self._length, self._datetimes, self._validated_a_period))
+
+    def __len__(self):
+        return self._length
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Shared collection representation."""
+        return 'Shared Data Collection "{}"\n{} ({})\n...{} values...'.format(
+            self.name, self._header.data_type, self._header.unit, self._length)
+
+
+def _attach_shared_collection(*args):
+    """Rebuild a SharedCollection from the output of its __reduce__ method."""
+    return SharedCollection._attach(*args)
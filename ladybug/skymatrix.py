@@ -0,0 +1,255 @@
+# coding=utf-8
+"""Discretize the sky dome into patches and compute cumulative sky matrices.
+
+The sky dome is divided into the 145 patches of Tregenza or into the Reinhart
+subdivisions of these patches. The irradiance of each timestep is distributed
+to the patches: the direct normal irradiance goes to the patch that contains
+the sun and the diffuse horizontal irradiance is spread over all patches
+following the Perez all-weather sky luminance distribution. The sum of these
+over many timesteps is a cumulative sky matrix with one value per patch, which
+is what Radiance gendaymtx computes from the file written by Wea.write.
+
+Sky patches are ordered by row from the horizon up to the zenith. The patches
+of each row start at north and proceed clockwise (towards east). The matrices
+returned by cumulative_sky_matrix have one more item after the sky patches for
+the ground.
+
+Usage:
+
+.. code-block:: python
+
+    from ladybug.wea import Wea
+
+    wea = Wea.from_epw_file('C:/epw_data/USA_CO_Denver.epw')
+    direct, diffuse = wea.cumulative_sky_matrix()
+    total = [dir_rad + dif_rad for dir_rad, dif_rad in zip(direct, diffuse)]
+"""
+from __future__ import division
+
+import math
+
+from .skymodel import perez_sky_coefficients, get_extra_radiation_array, \
+    get_relative_airmass_array
+
+try:  # python 2
+    from itertools import izip as zip
+except ImportError:  # python 3
+    xrange = range
+
+TREGENZA_ROW_COUNTS = (30, 30, 24, 24, 18, 12, 6)  # patches of each row below the cap
+
+
+def sky_patch_rows(subdivisions=1):
+    """Get the rows of sky patches from the horizon to the zenith.
+
+    Args:
+        subdivisions: An integer for the number of Reinhart subdivisions of each
+            Tregenza patch in each direction. 1 gives the 145 patches of Tregenza,
+            2 gives 577 patches and 4 gives 2305 patches. (Default: 1).
+
+    Returns:
+        A tuple with one (min altitude, max altitude, patch count) tuple for
+        each row. Altitudes are in degrees. The last row is the single patch
+        of the zenith cap.
+    """
+    return _sky_patches(subdivisions)[0]
+
+
+def sky_patch_count(subdivisions=1):
+    """Get the number of sky patches (excluding the ground).
+
+    Args:
+        subdivisions: An integer for the number of Reinhart subdivisions of each
+            Tregenza patch in each direction. (Default: 1).
+    """
+    return len(_sky_patches(subdivisions)[1])
+
+
+def sky_patch_vectors(subdivisions=1):
+    """Get a tuple of unit vectors pointing from the ground to each sky patch center.
+
+    Args:
+        subdivisions: An integer for the number of Reinhart subdivisions of each
+            Tregenza patch in each direction. (Default: 1).
+
+    Returns:
+        A tuple of (x, y, z) tuples with one for each sky patch. The Y axis
+        points north and the X axis points east.
+    """
+    return _sky_patches(subdivisions)[1]
+
+
+def sky_patch_solid_angles(subdivisions=1):
+    """Get a tuple of the solid angle of each sky patch in steradians.
+
+    Args:
+        subdivisions: An integer for the number of Reinhart subdivisions of each
+            Tregenza patch in each direction. (Default: 1).
+    """
+    return _sky_patches(subdivisions)[2]
+
+
+def sky_patch_index(altitude, azimuth, subdivisions=1):
+    """Get the index of the sky patch that contains a direction.
+
+    Args:
+        altitude: A number for the altitude of the direction in degrees.
+        azimuth: A number for the azimuth of the direction in degrees, starting
+            from north and increasing clockwise.
+        subdivisions: An integer for the number of Reinhart subdivisions of each
+            Tregenza patch in each direction. (Default: 1).
+
+    Returns:
+        An integer for the index of the patch. This is the number of sky patches
+        (the index of the ground) if the altitude is below the horizon.
+    """
+    rows, vectors, _, _, row_starts = _sky_patches(subdivisions)
+    if altitude < 0:
+        return len(vectors)
+    row = int(altitude / rows[0][1])
+    if row >= len(rows) - 1:
+        return len(vectors) - 1
+    count = rows[row][2]
+    return row_starts[row] + int((azimuth % 360) * count / 360 + 0.5) % count
+
+
+def cumulative_sky_matrix(altitudes, azimuths, doys, dni, dhi, subdivisions=1,
+                          ground_reflectance=0.2, timestep=1, indices=None):
+    """Get the cumulative radiation of each sky patch from lists of irradiance.
+
+    The direct normal irradiance of each timestep is given to the patch that
+    contains the sun. The diffuse horizontal irradiance is distributed to all
+    patches with the Perez all-weather sky model and it is normalized such that
+    the patches give back exactly the diffuse horizontal irradiance to a
+    horizontal surface. Diffuse irradiance while the sun is below the horizon
+    is distributed uniformly. The ground is a uniform patch that reflects the
+    global horizontal irradiance.
+
+    Args:
+        altitudes: A list of solar altitude angles in degrees.
+        azimuths: A list of solar azimuth angles in degrees.
+        doys: A list of integers for the day of the year of each timestep.
+        dni: A list of Direct Normal Irradiance in W/m2.
+        dhi: A list of Diffuse Horizontal Irradiance in W/m2.
+        subdivisions: An integer for the number of Reinhart subdivisions of each
+            Tregenza patch in each direction. (Default: 1).
+        ground_reflectance: A number between 0 and 1 for the reflectance of
+            the ground. (Default: 0.2).
+        timestep: An integer for the number of timesteps per hour of the input
+            lists. (Default: 1).
+        indices: An optional list of integers for the indices of the timesteps
+            to be summed. If None, all timesteps are summed. (Default: None).
+
+    Returns:
+        A tuple with two lists
+
+        -   direct: The cumulative direct radiation of each sky patch in kWh/m2.
+
+        -   diffuse: The cumulative diffuse radiation of each sky patch in kWh/m2.
+
+        Each list has one value per sky patch followed by one value for the
+        ground. Each value is the radiation that the patch delivers to a
+        surface facing it (the radiance of the patch multiplied by its solid
+        angle). The ground value is the reflected radiation, which is included
+        in the diffuse list and is 0 in the direct list.
+    """
+    assert 0 <= ground_reflectance <= 1, 'ground_reflectance must be between ' \
+        '0 and 1. Got {}.'.format(ground_reflectance)
+    _, vectors, solid_angles, patch_rows, row_starts = _sky_patches(subdivisions)
+    if indices is None:
+        indices = xrange(len(altitudes))
+    patch_count = len(vectors)
+    direct, diffuse = [0] * patch_count, [0] * patch_count
+    ground, uniform = 0, 0
+
+    # sum the direct, ground and uniform diffuse radiation of all timesteps
+    sky_i = []
+    for i in indices:
+        alt, dn, dh = altitudes[i], dni[i], dhi[i]
+        if alt > 0:
+            ground += dh + dn * math.sin(math.radians(alt))
+            if dn > 0:
+                direct[sky_patch_index(alt, azimuths[i], subdivisions)] += dn
+            if dh > 0:
+                sky_i.append(i)
+        else:
+            ground += dh
+            uniform += dh
+
+    # distribute the diffuse radiation of the daytime timesteps to the patches
+    weights = [vec[2] * sa for vec, sa in zip(vectors, solid_angles)]
+    row_inv_cos = [1 / vectors[start][2] for start in row_starts]
+    exp, acos = math.exp, math.acos
+    airmasses = get_relative_airmass_array([altitudes[i] for i in sky_i])
+    extra_rads = get_extra_radiation_array([doys[i] for i in sky_i])
+    for i, airmass, extra_rad in zip(sky_i, airmasses, extra_rads):
+        alt, azi = math.radians(altitudes[i]), math.radians(azimuths[i])
+        s_x, s_y, s_z = math.sin(azi) * math.cos(alt), \
+            math.cos(azi) * math.cos(alt), math.sin(alt)
+        a, b, c, d, e = perez_sky_coefficients(
+            altitudes[i], dni[i], dhi[i], extra_rad, airmass)
+        gradation = [1 + a * exp(b * inv_cos) for inv_cos in row_inv_cos]
+        cos_gs = [min(s_x * p_x + s_y * p_y + s_z * p_z, 1.)
+                  for p_x, p_y, p_z in vectors]
+        lum = [gradation[row] * (1 + c * exp(d * acos(cos_g)) + e * cos_g * cos_g)
+               for row, cos_g in zip(patch_rows, cos_gs)]
+        if min(lum) < 0:  # the model can give small negative values far from the sun
+            lum = [lm if lm > 0 else 0 for lm in lum]
+        horiz = sum(lm * w for lm, w in zip(lum, weights))
+        if horiz > 0:
+            factor = dhi[i] / horiz
+            diffuse = [dif + factor * lm for dif, lm in zip(diffuse, lum)]
+        else:
+            uniform += dhi[i]
+
+    # convert the radiance of the patches to radiation in kWh/m2
+    to_kwh = 1 / (timestep * 1000)
+    uniform = uniform / sum(weights)
+    direct = [dir_rad * to_kwh for dir_rad in direct]
+    diffuse = [(dif + uniform) * sa * to_kwh for dif, sa in zip(diffuse, solid_angles)]
+    direct.append(0)
+    diffuse.append(ground * ground_reflectance * to_kwh)
+    return direct, diffuse
+
+
+def _sky_patches(subdivisions):
+    """Get the geometry of the sky patches for a number of subdivisions.
+
+    The result is computed once for each number of subdivisions and it is a
+    tuple of (rows, vectors, solid angles, row of each patch, start of each row).
+    """
+    try:
+        return _SKY_PATCHES[subdivisions]
+    except KeyError:
+        assert isinstance(subdivisions, int) and subdivisions > 0, 'subdivisions ' \
+            'must be an integer greater than 0. Got {}.'.format(subdivisions)
+    row_height = 90 / (len(TREGENZA_ROW_COUNTS) * subdivisions + 0.5)
+    rows, vectors, solid_angles, patch_rows, row_starts = [], [], [], [], []
+    for row_i in xrange(len(TREGENZA_ROW_COUNTS) * subdivisions):
+        count = TREGENZA_ROW_COUNTS[row_i // subdivisions] * subdivisions
+        low, high = row_i * row_height, (row_i + 1) * row_height
+        rows.append((low, high, count))
+        row_starts.append(len(vectors))
+        alt = math.radians((low + high) / 2)
+        solid_angle = 2 * math.pi * (math.sin(math.radians(high)) -
+                                     math.sin(math.radians(low))) / count
+        for azi_i in xrange(count):
+            azi = 2 * math.pi * azi_i / count
+            vectors.append((math.sin(azi) * math.cos(alt),
+                            math.cos(azi) * math.cos(alt), math.sin(alt)))
+            solid_angles.append(solid_angle)
+            patch_rows.append(row_i)
+    # add the cap at the zenith
+    low = rows[-1][1]
+    rows.append((low, 90, 1))
+    row_starts.append(len(vectors))
+    vectors.append((0, 0, 1))
+    solid_angles.append(2 * math.pi * (1 - math.sin(math.radians(low))))
+    patch_rows.append(len(rows) - 1)
+    patches = (tuple(rows), tuple(vectors), tuple(solid_angles), tuple(patch_rows),
+               tuple(row_starts))
+    _SKY_PATCHES[subdivisions] = patches
+    return patches
+
+
+_SKY_PATCHES = {}  # sky patch geometry for each number of subdivisions
@@ -2,9 +2,10 @@
 from __future__ import division
 """Functions for computing radiation for different idealized skies"""
 
-from .psychrometrics import dew_point_from_db_rh
+from .psychrometrics import dew_point_from_db_rh_array
 
 import math
+from bisect import bisect_left, bisect_right
 try:  # python 2
     from itertools import izip as zip
 except ImportError:  # python 3
@@ -217,8 +218,7 @@ def zhang_huang_solar_split(altitudes, doys, cloud_cover, relative_humidity,
 
     if not use_disc:
         # Calculate dew point temperature to improve the splitting of direct + diffuse
-        temp_dew = [dew_point_from_db_rh(dry_bulb_present[i], relative_humidity[i])
-                    for i in xrange(len(glob_ir))]
+        temp_dew = dew_point_from_db_rh_array(dry_bulb_present, relative_humidity)
 
         # Split global rad into direct + diffuse using dirint method (aka. Perez split)
         dir_norm_rad = dirint(glob_ir, altitudes, doys, atm_pressure,
@@ -278,95 +278,208 @@ def estimate_illuminance_from_irradiance(
         -   z_lum: Value for Zenith Luminance in lux.
 
     """
-    if altitude <= 0:  # sun is below the horizon, return 0 for all results
-        return 0, 0, 0, 0
+    rel_airmass = None if rel_airmass is None else [rel_airmass]
+    results = estimate_illuminance_from_irradiance_array(
+        [altitude], [ghi], [dni], [dhi], [dew_point], rel_airmass)
+    return tuple(result[0] for result in results)
 
+
+def estimate_illuminance_from_irradiance_array(
+        altitudes, ghi, dni, dhi, dew_point, rel_airmass=None):
+    """Estimate sky illuminance components from lists of irradiance components.
+
+    This is the same as estimate_illuminance_from_irradiance but it processes
+    whole lists of values (eg. an annual list of hourly values) in one call.
+
+    Args:
+        altitudes: A list of solar altitude angles in degrees.
+        ghi: A list of Global Horizontal Irradiance in W/m2.
+        dni: A list of Direct Normal Irradiance in W/m2.
+        dhi: A list of Diffuse Horizontal Irradiance in W/m2.
+        dew_point: A list of surface dewpoint in degrees C.
+        rel_airmass: An optional list of relative air masses. Default is None,
+            which will use the get_relative_airmass_array function in this
+            module with the kastenyoung1989 model to compute the values.
+
+    Returns:
+        A tuple with four lists
+
+        -   gh_ill: Global Horizontal Illuminance in lux.
+
+        -   dn_ill: Direct Normal Illuminance in lux.
+
+        -   dh_ill: Diffuse Horizontal Illuminance in lux.
+
+        -   z_lum: Zenith Luminance in lux.
+    """
+    # get the index of each daytime value; all night values are 0
+    count = len(altitudes)
+    gh_ill, dn_ill, dh_ill, z_lum = [0] * count, [0] * count, [0] * count, [0] * count
+    day_i = [i for i, alt in enumerate(altitudes) if alt > 0]
+    day_alt = [altitudes[i] for i in day_i]
     if rel_airmass is None:
-        rel_airmass = get_relative_airmass(altitude)
-    zenith = math.radians(90 - altitude)
-    dhi = 0.1 if dhi == 0 else dhi
+        day_airmass = get_relative_airmass_array(day_alt)
+    else:
+        day_airmass = [rel_airmass[i] for i in day_i]
+
+    # compute the sky clearness of all daytime values
     kai = 1.041
-    eps = ((dhi + dni) / dhi + kai * zenith ** 3) / (1 + kai * zenith ** 3)
-    delta = dhi * rel_airmass / 1360
-    w = math.exp(0.08 * dew_point - 0.075)
+    zeniths = [math.radians(90 - alt) for alt in day_alt]
+    day_dhi = [0.1 if dhi[i] == 0 else dhi[i] for i in day_i]
+    epsilons = [((dh + dni[i]) / dh + kai * zen ** 3) / (1 + kai * zen ** 3)
+                for i, dh, zen in zip(day_i, day_dhi, zeniths)]
 
     # Perez Table 1: Discrete Sky Clearness Categories
-    if eps >= 1 and eps < 1.065:
-        e_category = 0
-    elif eps >= 1.065 and eps < 1.23:
-        e_category = 1
-    elif eps >= 1.23 and eps < 1.5:
-        e_category = 2
-    elif eps >= 1.5 and eps < 1.95:
-        e_category = 3
-    elif eps >= 1.95 and eps < 2.8:
-        e_category = 4
-    elif eps >= 2.8 and eps < 4.5:
-        e_category = 5
-    elif eps >= 4.5 and eps < 6.2:
-        e_category = 6
-    elif eps >= 6.2:
-        e_category = 7
-    else:
-        raise ValueError('Error in sky luminous efficacy calculation\n'
-                         'eps: %f  altitude: %f' % (eps, altitude))
-
-    # Perez Table 4: Luminous Efficacy
-    glob_lum_eff_coeff = ((96.63, -0.47, 11.50, -9.16),
-                          (107.54, 0.79, 1.79, -1.19),
-                          (98.73, 0.70, 4.40, -6.95),
-                          (92.72, 0.56, 8.36, -8.31),
-                          (86.73, 0.98, 7.10, -10.94),
-                          (88.34, 1.39, 6.06, -7.60),
-                          (78.63, 1.47, 4.93, -11.37),
-                          (99.65, 1.86, -4.46, -3.15))
-
-    dir_lum_eff_coeff = ((57.20, -4.55, -2.98, 117.12),
-                         (98.99, -3.46, -1.21, 12.38),
-                         (109.83, -4.90, -1.71, -8.81),
-                         (110.34, -5.84, -1.99, -4.56),
-                         (106.36, -3.97, -1.75, -6.16),
-                         (107.19, -1.25, -1.51, -26.73),
-                         (105.75, 0.77, -1.26, -34.44),
-                         (101.18, 1.58, -1.10, -8.29))
-
-    diff_lum_eff_coeff = ((97.24, -0.46, 12.00, -8.91),
-                          (107.22, 1.15, 0.59, -3.95),
-                          (104.97, 2.96, -5.52, -8.77),
-                          (102.39, 5.59, -13.95, -13.90),
-                          (100.71, 5.94, -22.75, -23.74),
-                          (106.42, 3.83, -36.15, -28.83),
-                          (141.88, 1.90, -53.24, -14.03),
-                          (152.23, 0.35, -45.27, -7.98))
-
-    zen_lum_eff_coeff = ((40.86, 26.77, -29.59, -45.75),
-                         (26.58, 14.73, 58.46, -21.25),
-                         (19.34, 2.28, 100.00, 0.25),
-                         (13.25, -1.39, 124.79, 15.66),
-                         (14.47, -5.09, 160.09, 9.13),
-                         (19.76, -3.88, 154.61, -19.21),
-                         (28.39, -9.67, 151.58, -69.39),
-                         (42.91, -19.62, 130.80, -164.08))
-
-    # Eq 6
-    a, b, c, d = glob_lum_eff_coeff[e_category]
-    gh_ill = ghi * (a + b * w + c * math.cos(zenith) + d * math.log(delta))
-
-    # Eq 8
-    a, b, c, d = dir_lum_eff_coeff[e_category]
-    dn_ill = max(0, dni * (a + b * w + c * math.exp(5.73 * zenith - 5) + d * delta))
-
-    # Eq 7
-    a, b, c, d = diff_lum_eff_coeff[e_category]
-    dh_ill = dhi * (a + b * w + c * math.cos(zenith) + d * math.log(delta))
-
-    # Eq 9
-    a, b, c, d = zen_lum_eff_coeff[e_category]
-    z_lum = dhi * (a + b * math.cos(zenith) + c * math.exp(-3 * zenith) + d * delta)
+    for eps, alt in zip(epsilons, day_alt):
+        if not eps >= 1:
+            raise ValueError('Error in sky luminous efficacy calculation\n'
+                             'eps: %f  altitude: %f' % (eps, alt))
+    edges = _PEREZ_EPSILON_EDGES
+    categories = [bisect_right(edges, eps) for eps in epsilons]
+
+    for i, zenith, dhi_i, rel_am, e_cat in \
+            zip(day_i, zeniths, day_dhi, day_airmass, categories):
+        delta = dhi_i * rel_am / 1360
+        w = math.exp(0.08 * dew_point[i] - 0.075)
+        cos_zen, log_delta = math.cos(zenith), math.log(delta)
+
+        # Eq 6
+        a, b, c, d = _PEREZ_GLOB_LUM_EFF_COEFF[e_cat]
+        gh_ill[i] = ghi[i] * (a + b * w + c * cos_zen + d * log_delta)
+
+        # Eq 8
+        a, b, c, d = _PEREZ_DIR_LUM_EFF_COEFF[e_cat]
+        dn_ill[i] = max(
+            0, dni[i] * (a + b * w + c * math.exp(5.73 * zenith - 5) + d * delta))
+
+        # Eq 7
+        a, b, c, d = _PEREZ_DIFF_LUM_EFF_COEFF[e_cat]
+        dh_ill[i] = dhi_i * (a + b * w + c * cos_zen + d * log_delta)
+
+        # Eq 9
+        a, b, c, d = _PEREZ_ZEN_LUM_EFF_COEFF[e_cat]
+        z_lum[i] = dhi_i * (a + b * cos_zen + c * math.exp(-3 * zenith) + d * delta)
 
     return gh_ill, dn_ill, dh_ill, z_lum
 
 
+# Perez Table 1: Lower bounds of the Discrete Sky Clearness Categories 1-7
+_PEREZ_EPSILON_EDGES = (1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2)
+
+# Perez Table 4: Luminous Efficacy
+_PEREZ_GLOB_LUM_EFF_COEFF = (
+    (96.63, -0.47, 11.50, -9.16),
+    (107.54, 0.79, 1.79, -1.19),
+    (98.73, 0.70, 4.40, -6.95),
+    (92.72, 0.56, 8.36, -8.31),
+    (86.73, 0.98, 7.10, -10.94),
+    (88.34, 1.39, 6.06, -7.60),
+    (78.63, 1.47, 4.93, -11.37),
+    (99.65, 1.86, -4.46, -3.15))
+
+_PEREZ_DIR_LUM_EFF_COEFF = (
+    (57.20, -4.55, -2.98, 117.12),
+    (98.99, -3.46, -1.21, 12.38),
+    (109.83, -4.90, -1.71, -8.81),
+    (110.34, -5.84, -1.99, -4.56),
+    (106.36, -3.97, -1.75, -6.16),
+    (107.19, -1.25, -1.51, -26.73),
+    (105.75, 0.77, -1.26, -34.44),
+    (101.18, 1.58, -1.10, -8.29))
+
+_PEREZ_DIFF_LUM_EFF_COEFF = (
+    (97.24, -0.46, 12.00, -8.91),
+    (107.22, 1.15, 0.59, -3.95),
+    (104.97, 2.96, -5.52, -8.77),
+    (102.39, 5.59, -13.95, -13.90),
+    (100.71, 5.94, -22.75, -23.74),
+    (106.42, 3.83, -36.15, -28.83),
+    (141.88, 1.90, -53.24, -14.03),
+    (152.23, 0.35, -45.27, -7.98))
+
+_PEREZ_ZEN_LUM_EFF_COEFF = (
+    (40.86, 26.77, -29.59, -45.75),
+    (26.58, 14.73, 58.46, -21.25),
+    (19.34, 2.28, 100.00, 0.25),
+    (13.25, -1.39, 124.79, 15.66),
+    (14.47, -5.09, 160.09, 9.13),
+    (19.76, -3.88, 154.61, -19.21),
+    (28.39, -9.67, 151.58, -69.39),
+    (42.91, -19.62, 130.80, -164.08))
+
+
+# Perez et al. 1993: Coefficients of the all-weather sky luminance
+# distribution with one (x1, x2, x3, x4) tuple for each of a, b, c, d and e
+_PEREZ_SKY_COEFF = (
+    ((1.3525, -0.2576, -0.2690, -1.4366), (-0.7670, 0.0007, 1.2734, -0.1233),
+     (2.8000, 0.6004, 1.2375, 1.0000), (1.8734, 0.6297, 0.9738, 0.2809),
+     (0.0356, -0.1246, -0.5718, 0.9938)),
+    ((-1.2219, -0.7730, 1.4148, 1.1016), (-0.2054, 0.0367, -3.9128, 0.9156),
+     (6.9750, 0.1774, 6.4477, -0.1239), (-1.5798, -0.5081, -1.7812, 0.1080),
+     (0.2624, 0.0672, -0.2190, -0.4285)),
+    ((-1.1000, -0.2515, 0.8952, 0.0156), (0.2782, -0.1812, -4.5000, 1.1766),
+     (24.7219, -13.0812, -37.7000, 34.8438), (-5.0000, 1.5218, 3.9229, -2.6204),
+     (-0.0156, 0.1597, 0.4199, -0.5562)),
+    ((-0.5484, -0.6654, -0.2672, 0.7117), (0.7234, -0.6219, -5.6812, 2.6297),
+     (33.3389, -18.3000, -62.2500, 52.0781), (-3.5000, 0.0016, 1.1477, 0.1062),
+     (0.4659, -0.3296, -0.0876, -0.0329)),
+    ((-0.6000, -0.3566, -2.5000, 2.3250), (0.2937, 0.0496, -5.6812, 1.8415),
+     (21.0000, -4.7656, -21.5906, 7.2492), (-3.5000, -0.1554, 1.4062, 0.3988),
+     (0.0032, 0.0766, -0.0656, -0.1294)),
+    ((-1.0156, -0.3670, 1.0078, 1.4051), (0.2875, -0.5328, -3.8500, 3.3750),
+     (14.0000, -0.9999, -7.1406, 7.5469), (-3.4000, -0.1078, -1.0750, 1.5702),
+     (-0.0672, 0.4016, 0.3017, -0.4844)),
+    ((-1.0000, 0.0211, 0.5025, -0.5119), (-0.3000, 0.1922, 0.7023, -1.6317),
+     (19.0000, -5.0000, 1.2438, -1.9094), (-4.0000, 0.0250, 0.3844, 0.2656),
+     (1.0468, -0.3788, -2.4517, 1.4656)),
+    ((-1.0500, 0.0289, 0.4260, 0.3590), (-0.3250, 0.1156, 0.7781, 0.0025),
+     (31.0625, -14.5000, -46.1148, 55.3750), (-7.2312, 0.4050, 13.3500, 0.6234),
+     (1.5000, -0.6426, 1.8564, 0.5636)))
+
+
+def perez_sky_coefficients(altitude, dni, dhi, extra_radiation, rel_airmass=None):
+    """Get the coefficients of the Perez all-weather sky luminance distribution.
+
+    The relative luminance of a point of the sky is then given by
+    (1 + a * exp(b / cos(Zp))) * (1 + c * exp(d * g) + e * cos(g) ** 2), where
+    Zp is the zenith angle of the point and g is its angle from the sun in radians.
+
+    Note:
+        [1] Perez, R., Seals, R. and Michalsky, J. (1993). 'All-weather model
+        for sky luminance distribution - preliminary configuration and
+        validation'. Solar Energy. Vol. 50. No. 3, pp. 235-245.
+
+    Args:
+        altitude: Solar altitude angle in degrees. Must be greater than 0.
+        dni: Number for Direct Normal Irradiance in W/m2.
+        dhi: Number for Diffuse Horizontal Irradiance in W/m2. Must be greater
+            than 0.
+        extra_radiation: Number for the extraterrestrial radiation normal to
+            the sun in W/m2. This can be computed with get_extra_radiation.
+        rel_airmass: A number for the relative air mass. Default is None,
+            which will use the get_relative_airmass function in this module
+            with the kastenyoung1989 model to compute this value.
+
+    Returns:
+        A tuple with the five coefficients (a, b, c, d, e) of the distribution.
+    """
+    if rel_airmass is None:
+        rel_airmass = get_relative_airmass(altitude)
+    zenith = math.radians(90 - altitude)
+    kai_z3 = 1.041 * zenith ** 3
+    epsilon = ((dhi + dni) / dhi + kai_z3) / (1 + kai_z3)
+    delta = dhi * rel_airmass / extra_radiation
+    e_cat = bisect_right(_PEREZ_EPSILON_EDGES, epsilon)
+    (a, b, c, d, e) = [x1 + x2 * zenith + delta * (x3 + x4 * zenith)
+                       for x1, x2, x3, x4 in _PEREZ_SKY_COEFF[e_cat]]
+    if e_cat == 0:  # the overcast category has special equations for c and d
+        c1, c2, c3, c4 = _PEREZ_SKY_COEFF[0][2]
+        d1, d2, d3, d4 = _PEREZ_SKY_COEFF[0][3]
+        c = math.exp((delta * (c1 + c2 * zenith)) ** c3) - c4
+        d = -math.exp(delta * (d1 + d2 * zenith)) + d3 + delta * d4
+    return a, b, c, d, e
+
+
 """HORIZONTAL INFRARED INTENSITY + SKY TEMPERATURE MODELS"""
 
 
@@ -505,16 +618,11 @@ def dirint(ghi, altitudes, doys, pressures, use_delta_kt_prime=True,
         DIRINT model.
     """
     # calculate kt_prime values
-    kt_primes = []
-    disc_dni = []
-    for i in xrange(len(ghi)):
-        dni, kt, airmass = disc(ghi[i], altitudes[i], doys[i], pressure=pressures[i],
-                                min_sin_altitude=min_sin_altitude,
-                                min_altitude=min_altitude)
-        kt_prime = clearness_index_zenith_independent(
-            kt, airmass, max_clearness_index=1)
-        kt_primes.append(kt_prime)
-        disc_dni.append(dni)
+    disc_dni, kts, airmasses = disc_array(
+        ghi, altitudes, doys, pressures, min_sin_altitude=min_sin_altitude,
+        min_altitude=min_altitude)
+    kt_primes = [clearness_index_zenith_independent(kt, am, max_clearness_index=1)
+                 for kt, am in zip(kts, airmasses)]
 
     # calculate delta_kt_prime values
     if use_delta_kt_prime:
@@ -536,14 +644,9 @@ def dirint(ghi, altitudes, doys, pressures, use_delta_kt_prime=True,
     else:
         w = [-1] * len(ghi)
 
-    # bin the values into appropriate categoreis for lookup in the coefficient matirx.
-    ktp_bin, alt_bin, w_bin, delta_ktp_bin = \
-        _dirint_bins(kt_primes, altitudes, w, delta_kt_prime)
-
-    # get the dirint coefficient by looking up values in the matrix
-    coeffs = _get_dirint_coeffs()
-    dirint_coeffs = [coeffs[ktp_bin[i]][alt_bin[i]][delta_ktp_bin[i]][w_bin[i]]
-                     for i in xrange(len(ghi))]
+    # bin the values and look up the coefficients in the flat dirint table
+    coeff_indices = _dirint_coeff_indices(kt_primes, altitudes, w, delta_kt_prime)
+    dirint_coeffs = [_DIRINT_COEFFS[i] for i in coeff_indices]
 
     # Perez eqn 5
     dni = [disc_d * coef for disc_d, coef in zip(disc_dni, dirint_coeffs)]
@@ -551,58 +654,35 @@ def dirint(ghi, altitudes, doys, pressures, use_delta_kt_prime=True,
     return dni
 
 
-def _dirint_bins(ktp, alt, w, dktp):
+def _dirint_coeff_indices(ktp, alt, w, dktp):
     """
-    Determine the bins for the DIRINT coefficients.
+    Determine the index in _DIRINT_COEFFS of the coefficient for each hour.
+
+    All four bins of each hour are found in a single pass by bisecting the bin
+    edges. Values that are outside of the binned ranges fall in the last bin
+    of their dimension.
 
     Args:
         ktp : Altitude-independent clearness index
         alt : Solar altitude angle
-        w : precipitable water estimated from surface dew-point temperature
-        dktp : stability index
+        w : precipitable water estimated from surface dew-point temperature.
+            Use -1 for hours without this value.
+        dktp : stability index. Use -1 for hours without this value.
 
     Returns:
-        tuple of ktp_bin, alt_bin, w_bin, dktp_bin
+        A list of integers for the index of each hour's coefficient.
     """
-    it = xrange(len(ktp))
-
-    # Create kt_prime bins
-    ktp_bin = [-1] * len(ktp)
-    ktp_bin = [0 if ktp[i] >= 0 and ktp[i] < 0.24 else ktp_bin[i] for i in it]
-    ktp_bin = [1 if ktp[i] >= 0.24 and ktp[i] < 0.4 else ktp_bin[i] for i in it]
-    ktp_bin = [2 if ktp[i] >= 0.4 and ktp[i] < 0.56 else ktp_bin[i] for i in it]
-    ktp_bin = [3 if ktp[i] >= 0.56 and ktp[i] < 0.7 else ktp_bin[i] for i in it]
-    ktp_bin = [4 if ktp[i] >= 0.7 and ktp[i] < 0.8 else ktp_bin[i] for i in it]
-    ktp_bin = [5 if ktp[i] >= 0.8 and ktp[i] <= 1 else ktp_bin[i] for i in it]
-
-    # Create altitude angle bins
-    alt_bin = [-1] * len(alt)
-    alt_bin = [0 if alt[i] <= 90 and alt[i] > 65 else alt_bin[i] for i in it]
-    alt_bin = [1 if alt[i] <= 65 and alt[i] > 50 else alt_bin[i] for i in it]
-    alt_bin = [2 if alt[i] <= 50 and alt[i] > 35 else alt_bin[i] for i in it]
-    alt_bin = [3 if alt[i] <= 35 and alt[i] > 20 else alt_bin[i] for i in it]
-    alt_bin = [4 if alt[i] <= 20 and alt[i] > 10 else alt_bin[i] for i in it]
-    alt_bin = [5 if alt[i] <= 10 else alt_bin[i] for i in it]
-
-    # Create the bins for w based on dew point temperature
-    w_bin = [-1] * len(w)
-    w_bin = [0 if w[i] >= 0 and w[i] < 1 else w_bin[i] for i in it]
-    w_bin = [1 if w[i] >= 1 and w[i] < 2 else w_bin[i] for i in it]
-    w_bin = [2 if w[i] >= 2 and w[i] < 3 else w_bin[i] for i in it]
-    w_bin = [3 if w[i] >= 3 else w_bin[i] for i in it]
-    w_bin = [4 if w[i] == -1 else w_bin[i] for i in it]
-
-    # Create delta_kt_prime binning.
-    dktp_bin = [-1] * len(dktp)
-    dktp_bin = [0 if dktp[i] >= 0 and dktp[i] < 0.015 else dktp_bin[i] for i in it]
-    dktp_bin = [1 if dktp[i] >= 0.015 and dktp[i] < 0.035 else dktp_bin[i] for i in it]
-    dktp_bin = [2 if dktp[i] >= 0.035 and dktp[i] < 0.07 else dktp_bin[i] for i in it]
-    dktp_bin = [3 if dktp[i] >= 0.07 and dktp[i] < 0.15 else dktp_bin[i] for i in it]
-    dktp_bin = [4 if dktp[i] >= 0.15 and dktp[i] < 0.3 else dktp_bin[i] for i in it]
-    dktp_bin = [5 if dktp[i] >= 0.3 and dktp[i] <= 1 else dktp_bin[i] for i in it]
-    dktp_bin = [6 if dktp[i] == -1 else dktp_bin[i] for i in it]
-
-    return ktp_bin, alt_bin, w_bin, dktp_bin
+    ktp_edges, alt_edges = _DIRINT_KTP_EDGES, _DIRINT_ALT_EDGES
+    w_edges, dktp_edges = _DIRINT_W_EDGES, _DIRINT_DKTP_EDGES
+    ktp_st, alt_st, dktp_st, w_st = _DIRINT_STRIDES
+    indices = []
+    for k, a, pw, d in zip(ktp, alt, w, dktp):
+        k_bin = bisect_right(ktp_edges, k) if 0 <= k <= 1 else 5
+        a_bin = 5 - bisect_left(alt_edges, a) if a <= 90 else 5
+        w_bin = bisect_right(w_edges, pw) if pw >= 0 else 4
+        d_bin = bisect_right(dktp_edges, d) if 0 <= d <= 1 else 6
+        indices.append(k_bin * ktp_st + a_bin * alt_st + d_bin * dktp_st + w_bin * w_st)
+    return indices
 
 
 def disc(ghi, altitude, doy, pressure=101325,
@@ -666,25 +746,66 @@ def disc(ghi, altitude, doy, pressure=101325,
 
         -   am: Airmass
     """
-    if altitude > min_altitude and ghi > 0:
-        # this is the I0 calculation from the reference
-        # SSC uses solar constant = 1367.0 (checked 2018 08 15)
-        I0 = get_extra_radiation(doy, 1370.)
+    results = disc_array([ghi], [altitude], [doy], pressure,
+                         min_sin_altitude, min_altitude, max_airmass)
+    return tuple(result[0] for result in results)
 
-        kt = clearness_index(ghi, altitude, I0, min_sin_altitude=min_sin_altitude,
-                             max_clearness_index=1)
 
-        am = get_relative_airmass(altitude, model='kasten1966')
-        if pressure is not None:
-            am = get_absolute_airmass(am, pressure)
+def disc_array(ghi, altitudes, doys, pressures=101325,
+               min_sin_altitude=0.065, min_altitude=3, max_airmass=12):
+    """Estimate lists of Direct Normal Irradiance using the DISC model.
 
-        Kn, am = _disc_kn(kt, am, max_airmass=max_airmass)
-        dni = Kn * I0
-        dni = max(dni, 0)
+    This is the same as the disc function but it processes whole lists of
+    values (eg. an annual list of hourly values) in one call.
 
-        return dni, kt, am
-    else:
-        return 0, 0, None
+    Args:
+        ghi: A list of global horizontal irradiance in W/m^2.
+        altitudes: A list of true (not refraction-corrected) solar altitude
+            angles in decimal degrees.
+        doys: A list of integers representing the day of the year.
+        pressures: A list of site pressures in Pascal or a single number to be
+            used for all values. If None, relative air mass is used instead
+            of absolute (pressure-corrected) air mass. (Default: 101325).
+        min_sin_altitude: Minimum value of sin(altitude) to allow when
+            calculating global clearness index `kt`. (Default: 0.065).
+        min_altitude: Minimum value of altitude to allow in DNI calculation.
+            (Default: 3).
+        max_airmass: Maximum value of the air mass to allow in Kn calculation.
+            (Default: 12).
+
+    Returns:
+        A tuple with three lists
+
+        -   dni: The modeled direct normal irradiance in W/m^2.
+
+        -   kt: Ratio of global to extraterrestrial irradiance on a
+            horizontal plane.
+
+        -   am: Airmass (None where the sun is below min_altitude or there
+            is no ghi).
+    """
+    count = len(ghi)
+    dni, kt, am = [0] * count, [0] * count, [None] * count
+    pressures = _as_list(pressures, count)
+
+    # only compute values where the sun is up and there is some irradiance
+    up = [i for i in xrange(count) if altitudes[i] > min_altitude and ghi[i] > 0]
+    up_alts = [altitudes[i] for i in up]
+    # this is the I0 calculation from the reference
+    # SSC uses solar constant = 1367.0 (checked 2018 08 15)
+    up_i0 = get_extra_radiation_array([doys[i] for i in up], 1370.)
+    up_kt = clearness_index_array([ghi[i] for i in up], up_alts, up_i0,
+                                  min_sin_altitude=min_sin_altitude,
+                                  max_clearness_index=1)
+    up_am = get_relative_airmass_array(up_alts, model='kasten1966')
+
+    for i, i0, kt_i, am_i in zip(up, up_i0, up_kt, up_am):
+        if pressures[i] is not None:
+            am_i = am_i * pressures[i] / 101325.
+        kn, am[i] = _disc_kn(kt_i, am_i, max_airmass=max_airmass)
+        dni[i] = max(kn * i0, 0)
+        kt[i] = kt_i
+    return dni, kt, am
 
 
 def _disc_kn(clearness_index, airmass, max_airmass=12):
@@ -756,15 +877,33 @@ def get_extra_radiation(doy, solar_constant=1366.1):
         DatetimeIndex inputs will yield a Pandas TimeSeries. All other
         inputs will yield a float or an array of floats.
     """
-    # Calculates the day angle for the Earth's orbit around the Sun.
-    B = (2. * math.pi / 365.) * (doy - 1)
-    # Calculate R over R squared from the angle
-    RoverR0sqrd = (1.00011 + 0.034221 * math.cos(B) + 0.00128 * math.sin(B) +
-                   0.000719 * math.cos(2 * B) + 7.7e-05 * math.sin(2 * B))
+    return get_extra_radiation_array([doy], solar_constant)[0]
 
-    Ea = solar_constant * RoverR0sqrd
 
-    return Ea
+def get_extra_radiation_array(doys, solar_constant=1366.1):
+    """Determine a list of extraterrestrial radiation from a list of days of year.
+
+    This is the same as get_extra_radiation but it processes whole lists of
+    values in one call. The radiation is computed only once for each distinct
+    day of the year.
+
+    Args:
+        doys: A list of integers representing the days of the year.
+        solar_constant: A number for the solar constant. (Default: 1366.1).
+
+    Returns:
+        A list of the extraterrestrial radiation in watts per square meter on a
+        surface which is normal to the sun.
+    """
+    by_doy = {}
+    for doy in set(doys):
+        # Calculates the day angle for the Earth's orbit around the Sun.
+        B = (2. * math.pi / 365.) * (doy - 1)
+        # Calculate R over R squared from the angle
+        RoverR0sqrd = (1.00011 + 0.034221 * math.cos(B) + 0.00128 * math.sin(B) +
+                       0.000719 * math.cos(2 * B) + 7.7e-05 * math.sin(2 * B))
+        by_doy[doy] = solar_constant * RoverR0sqrd
+    return [by_doy[doy] for doy in doys]
 
 
 def clearness_index(ghi, altitude, extra_radiation, min_sin_altitude=0.065,
@@ -801,12 +940,35 @@ def clearness_index(ghi, altitude, extra_radiation, min_sin_altitude=0.065,
         kt -- numeric.
         Clearness index
     """
-    sin_altitude = math.sin(math.radians(altitude))
-    I0h = extra_radiation * max(sin_altitude, min_sin_altitude)
-    kt = ghi / I0h
-    kt = max(kt, 0)
-    kt = min(kt, max_clearness_index)
-    return kt
+    return clearness_index_array([ghi], [altitude], extra_radiation,
+                                 min_sin_altitude, max_clearness_index)[0]
+
+
+def clearness_index_array(ghi, altitudes, extra_radiation, min_sin_altitude=0.065,
+                          max_clearness_index=2.0):
+    """Calculate a list of clearness indices.
+
+    This is the same as clearness_index but it processes whole lists of
+    values in one call.
+
+    Args:
+        ghi: A list of global horizontal irradiance in W/m^2.
+        altitudes: A list of true (not refraction-corrected) solar altitude
+            angles in decimal degrees.
+        extra_radiation: A list of irradiance incident at the top of the
+            atmosphere or a single number to be used for all values.
+        min_sin_altitude: Minimum value of sin(altitude) to allow when
+            calculating the clearness index. (Default: 0.065).
+        max_clearness_index: Maximum value of the clearness index. (Default: 2.0).
+
+    Returns:
+        A list of clearness indices.
+    """
+    extra_radiation = _as_list(extra_radiation, len(ghi))
+    sin, radians = math.sin, math.radians
+    return [min(max(g / (e * max(sin(radians(alt)), min_sin_altitude)), 0),
+                max_clearness_index)
+            for g, alt, e in zip(ghi, altitudes, extra_radiation)]
 
 
 def clearness_index_zenith_independent(clearness_index, airmass,
@@ -872,10 +1034,27 @@ def get_absolute_airmass(airmass_relative, pressure=101325.):
         airmass_absolute -- numeric.
         Absolute (pressure corrected) air mass
     """
-    if airmass_relative is not None:
-        return airmass_relative * pressure / 101325.
-    else:
-        return None
+    return get_absolute_airmass_array([airmass_relative], pressure)[0]
+
+
+def get_absolute_airmass_array(airmass_relative, pressure=101325.):
+    """Determine a list of absolute (pressure corrected) airmass.
+
+    This is the same as get_absolute_airmass but it processes whole lists of
+    values in one call.
+
+    Args:
+        airmass_relative: A list of the air mass at sea-level. Items may be None.
+        pressure: A list of site pressures in Pascal or a single number to be
+            used for all values. (Default: 101325).
+
+    Returns:
+        A list of the absolute (pressure corrected) air mass. Items are None
+        where the relative air mass is None.
+    """
+    pressure = _as_list(pressure, len(airmass_relative))
+    return [None if am is None else am * p / 101325.
+            for am, p in zip(airmass_relative, pressure)]
 
 
 def get_relative_airmass(altitude, model='kastenyoung1989'):
@@ -936,38 +1115,88 @@ def get_relative_airmass(altitude, model='kastenyoung1989'):
         airmass_relative -- Relative airmass at sea level. Will return None for any
         altitude angle smaller than 0 degrees.
     """
-    if altitude < 0:
-        return None
-    else:
-        alt_rad = math.radians(altitude)
-        model = model.lower()
-
-        if 'kastenyoung1989' == model:
-            am = (1.0 / (math.sin(alt_rad) +
-                  0.50572*(((6.07995 + altitude) ** - 1.6364))))
-        elif 'kasten1966' == model:
-            am = 1.0 / (math.sin(alt_rad) + 0.15*((3.885 + altitude) ** - 1.253))
-        elif 'simple' == model:
-            am = 1.0 / math.sin(altitude)
-        elif 'pickering2002' == model:
-            am = (1.0 / (math.sin(math.radians(altitude +
-                  244.0 / (165 + 47.0 * altitude ** 1.1)))))
-        elif 'youngirvine1967' == model:
-            sec_zen = 1.0 / math.sin(alt_rad)
-            am = sec_zen * (1 - 0.0012 * (sec_zen * sec_zen - 1))
-        elif 'young1994' == model:
-            am = ((1.002432*((math.sin(alt_rad)) ** 2) +
-                  0.148386*(math.sin(alt_rad)) + 0.0096467) /
-                  (math.sin(alt_rad) ** 3 +
-                  0.149864*(math.sin(alt_rad) ** 2) +
-                  0.0102963*(math.sin(alt_rad)) + 0.000303978))
-        elif 'gueymard1993' == model:
-            am = (1.0 / (math.sin(alt_rad) +
-                  0.00176759*(90 - altitude)*(
-                      (94.37515 - (90 - altitude)) ** - 1.21563)))
-        else:
-            raise ValueError('%s is not a valid model for relativeairmass', model)
-    return am
+    return get_relative_airmass_array([altitude], model)[0]
+
+
+def get_relative_airmass_array(altitudes, model='kastenyoung1989'):
+    """Get a list of the relative (not pressure-corrected) airmass.
+
+    This is the same as get_relative_airmass but it processes whole lists of
+    values in one call.
+
+    Args:
+        altitudes: A list of altitude angles of the sun in degrees.
+        model: Text for the airmass model. See get_relative_airmass for the
+            available models. (Default: 'kastenyoung1989').
+
+    Returns:
+        A list of relative airmass at sea level. Items are None for any
+        altitude angle smaller than 0 degrees.
+    """
+    try:
+        am_func = _RELATIVE_AIRMASS_MODELS[model.lower()]
+    except KeyError:  # only raise the error if there is some value to compute
+        if all(alt < 0 for alt in altitudes):
+            return [None] * len(altitudes)
+        raise ValueError('%s is not a valid model for relativeairmass', model)
+    return [None if alt < 0 else am_func(alt) for alt in altitudes]
+
+
+def _kastenyoung1989(altitude):
+    return (1.0 / (math.sin(math.radians(altitude)) +
+            0.50572*(((6.07995 + altitude) ** - 1.6364))))
+
+
+def _kasten1966(altitude):
+    return 1.0 / (math.sin(math.radians(altitude)) +
+                  0.15*((3.885 + altitude) ** - 1.253))
+
+
+def _simple(altitude):
+    return 1.0 / math.sin(altitude)
+
+
+def _pickering2002(altitude):
+    return (1.0 / (math.sin(math.radians(altitude +
+            244.0 / (165 + 47.0 * altitude ** 1.1)))))
+
+
+def _youngirvine1967(altitude):
+    sec_zen = 1.0 / math.sin(math.radians(altitude))
+    return sec_zen * (1 - 0.0012 * (sec_zen * sec_zen - 1))
+
+
+def _young1994(altitude):
+    alt_rad = math.radians(altitude)
+    return ((1.002432*((math.sin(alt_rad)) ** 2) +
+            0.148386*(math.sin(alt_rad)) + 0.0096467) /
+            (math.sin(alt_rad) ** 3 +
+            0.149864*(math.sin(alt_rad) ** 2) +
+            0.0102963*(math.sin(alt_rad)) + 0.000303978))
+
+
+def _gueymard1993(altitude):
+    return (1.0 / (math.sin(math.radians(altitude)) +
+            0.00176759*(90 - altitude)*(
+                (94.37515 - (90 - altitude)) ** - 1.21563)))
+
+
+_RELATIVE_AIRMASS_MODELS = {
+    'kastenyoung1989': _kastenyoung1989,
+    'kasten1966': _kasten1966,
+    'simple': _simple,
+    'pickering2002': _pickering2002,
+    'youngirvine1967': _youngirvine1967,
+    'young1994': _young1994,
+    'gueymard1993': _gueymard1993
+}
+
+
+def _as_list(value, count):
+    """Get a list of values from either a list or a single value to be repeated."""
+    if value is None or isinstance(value, (int, float)):
+        return [value] * count
+    return value
 
 
 def _get_dirint_coeffs():
@@ -1305,3 +1534,14 @@ def _get_dirint_coeffs():
         [0.743440, 0.592190, 0.603060, 0.316930, 0.794390]]
 
     return coeffs
+
+
+# flat table of the dirint coefficients with the strides of its four dimensions
+_DIRINT_COEFFS = tuple(c for ktp_c in _get_dirint_coeffs() for alt_c in ktp_c
+                       for dktp_c in alt_c for c in dktp_c)
+_DIRINT_STRIDES = (210, 35, 5, 1)  # kt_prime, altitude, delta_kt_prime, w
+# lower edges of all bins after the first of each dimension
+_DIRINT_KTP_EDGES = (0.24, 0.4, 0.56, 0.7, 0.8)
+_DIRINT_ALT_EDGES = (10, 20, 35, 50, 65)  # upper edges, from the last bin down
+_DIRINT_W_EDGES = (1, 2, 3)
+_DIRINT_DKTP_EDGES = (0.015, 0.035, 0.07, 0.15, 0.3)
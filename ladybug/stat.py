@@ -10,6 +10,8 @@ from .designday import HumidityCondition
 from .designday import WindCondition
 from .designday import ASHRAETau
 from .designday import ASHRAEClearSky
+from .futil import is_compressed_path, compressed_file_exists, uncompressed_path, \
+    open_compressed_file
 
 import os
 import re
@@ -25,7 +27,9 @@ class STAT(object):
     """Import data from a local .stat file.
 
     Args:
-        file_path: Address to a local .stat file.
+        file_path: Address to a local .stat file. This can also be a .stat.gz
+            file or a path to a .stat file inside of a zip archive
+            (e.g. c:/ladybug/USA_CO_Denver.zip/USA_CO_Denver.stat).
 
     Properties:
         * location
@@ -103,10 +107,12 @@ class STAT(object):
         """Initalize the class.
         """
         if file_path is not None:
-            if not os.path.isfile(file_path):
+            file_exists = compressed_file_exists(file_path) \
+                if is_compressed_path(file_path) else os.path.isfile(file_path)
+            if not file_exists:
                 raise ValueError(
                     'Cannot find an stat file at {}'.format(file_path))
-            if not file_path.lower().endswith('stat'):
+            if not uncompressed_path(file_path).lower().endswith('stat'):
                 raise TypeError('{} is not an .stat file.'.format(file_path))
             self._file_path = os.path.normpath(file_path)
 
@@ -219,8 +225,13 @@ class STAT(object):
         """Get the path to the stat file."""
         return self._file_path
 
-    def _import_data(self):
+    def _import_data(self, file_obj=None):
         """Import data from a stat file.
+
+        Args:
+            file_obj: An optional file object that is already open, from which
+                the data will be read instead of opening the file_path. It will
+                be closed once the data is imported. (Default: None).
         """
         # set default state to ironpython for very old ironpython (2.7.0)
         iron_python = True
@@ -234,7 +245,11 @@ class STAT(object):
             if 'IronPython' in str(e):
                 iron_python = True
 
-        if iron_python:
+        if file_obj is not None:
+            statwin = file_obj
+        elif is_compressed_path(self.file_path):
+            statwin = open_compressed_file(self.file_path)
+        elif iron_python:
             statwin = codecs.open(self.file_path, 'r')
         else:
             statwin = codecs.open(self.file_path, 'r', encoding='utf-8', errors='ignore')
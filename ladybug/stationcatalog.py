@@ -0,0 +1,302 @@
+# coding=utf-8
+"""Catalog of the weather stations of a folder of EPW files.
+
+The StationCatalog reads only the header of each EPW file in a folder and
+indexes the location of each station in a k-d tree such that the stations
+nearest to a site can be found without parsing every file again. The catalog
+can be saved to a JSON file and it is updated incrementally, only re-reading
+the files that were added or modified since it was last built.
+"""
+from __future__ import division
+
+import os
+import json
+import math
+import heapq
+
+from .epw import EPW
+from .location import Location
+from .config import folders
+
+EARTH_RADIUS = 6371.0088  # mean radius of the earth in kilometers
+
+
+class StationCatalog(object):
+    """Catalog of the weather stations of a folder of EPW files.
+
+    Args:
+        folder: Path to a folder of EPW files, which will be searched recursively.
+            If None, the default_epw_folder of the ladybug config will
+            be used. (Default: None).
+        catalog_file: Optional path to a JSON file in which the catalog is saved.
+            If the file exists, the catalog is loaded from it and only the EPW
+            files that have changed since it was saved are re-read. The file is
+            re-written whenever the catalog changes upon update. (Default: None).
+
+    Properties:
+        * folder
+        * catalog_file
+        * file_paths
+        * locations
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.stationcatalog import StationCatalog
+
+        catalog = StationCatalog('C:/epw_data', 'C:/epw_data/stations.json')
+        for location in catalog.nearest(39.74, -105.18, count=3):
+            print(location.city, catalog.file_path(location))
+    """
+    __slots__ = ('_folder', '_catalog_file', '_stations', '_locations',
+                 '_file_paths', '_paths_by_key', '_tree')
+
+    def __init__(self, folder=None, catalog_file=None):
+        """Initialize station catalog."""
+        if folder is None:
+            folder = folders.default_epw_folder
+            assert folder is not None, 'No folder was input and no ' \
+                'default_epw_folder was found in the ladybug config.'
+        assert os.path.isdir(folder), \
+            'No folder of EPW files was found at: {}'.format(folder)
+        self._folder = os.path.normpath(folder)
+        self._catalog_file = catalog_file
+        self._stations = {}  # file path: (modified time, location dictionary)
+        if catalog_file is not None and os.path.isfile(catalog_file):
+            with open(catalog_file) as json_file:
+                data = json.load(json_file)
+            for station in data['stations']:
+                self._stations[station['file_path']] = \
+                    (station['modified_time'], station['location'])
+        self._tree = None
+        self.update()
+
+    @property
+    def folder(self):
+        """Get the path to the folder of EPW files."""
+        return self._folder
+
+    @property
+    def catalog_file(self):
+        """Get the path to the JSON file in which the catalog is saved."""
+        return self._catalog_file
+
+    @property
+    def file_paths(self):
+        """Get a tuple of the paths to the EPW files of the catalog."""
+        return self._file_paths
+
+    @property
+    def locations(self):
+        """Get a tuple of Location objects for the stations of the catalog."""
+        return self._locations
+
+    def update(self):
+        """Update the catalog with the EPW files that have changed in the folder.
+
+        Only the headers of files that are new or that have a different modified
+        time from when they were last read are imported. Stations of files that
+        no longer exist are removed.
+
+        Returns:
+            An integer for the number of EPW files that were re-read.
+        """
+        current = {}
+        for root, _, files in os.walk(self._folder):
+            for f in files:
+                if f.lower().endswith('.epw'):
+                    path = os.path.join(root, f)
+                    current[path] = os.path.getmtime(path)
+
+        read_count = 0
+        removed = set(self._stations) - set(current)
+        for path in removed:
+            del self._stations[path]
+        for path, mtime in current.items():
+            station = self._stations.get(path)
+            if station is not None and station[0] == mtime:
+                continue
+            epw = EPW(path)
+            try:
+                epw._import_data(import_header_only=True)
+            except Exception:  # not a valid EPW file; ignore it
+                self._stations.pop(path, None)
+                continue
+            self._stations[path] = (mtime, epw.location.to_dict())
+            read_count += 1
+
+        if read_count or removed or self._tree is None:
+            self._build_index()
+            if self._catalog_file is not None and (read_count or removed):
+                self.save()
+        return read_count
+
+    def save(self, catalog_file=None):
+        """Save the catalog to a JSON file.
+
+        Args:
+            catalog_file: Optional path to the JSON file. If None, the catalog_file
+                of this object is used. (Default: None).
+        """
+        catalog_file = catalog_file or self._catalog_file
+        assert catalog_file is not None, 'No catalog_file to save the catalog to.'
+        stations = [{'file_path': path, 'modified_time': self._stations[path][0],
+                     'location': self._stations[path][1]}
+                    for path in sorted(self._stations)]
+        with open(catalog_file, 'w') as json_file:
+            json.dump({'type': 'StationCatalog', 'stations': stations}, json_file)
+        return catalog_file
+
+    def nearest(self, latitude, longitude, count=1):
+        """Get the stations nearest to a site.
+
+        Args:
+            latitude: A number for the latitude of the site in degrees.
+            longitude: A number for the longitude of the site in degrees.
+            count: An integer for the number of stations to return. (Default: 1).
+
+        Returns:
+            A list of Location objects for the stations, sorted from the nearest
+            to the farthest.
+        """
+        if self._tree is None or count < 1:
+            return []
+        point = _unit_vector(latitude, longitude)
+        heap = []  # max-heap of (-squared distance, index) for the best stations
+        self._search_nearest(self._tree, point, count, heap)
+        return [self._locations[i] for _, i in sorted(heap, reverse=True)]
+
+    def within_radius(self, latitude, longitude, radius):
+        """Get the stations within a distance of a site.
+
+        Args:
+            latitude: A number for the latitude of the site in degrees.
+            longitude: A number for the longitude of the site in degrees.
+            radius: A number for the great-circle distance from the site
+                in kilometers.
+
+        Returns:
+            A list of Location objects for the stations, sorted from the nearest
+            to the farthest.
+        """
+        if self._tree is None:
+            return []
+        point = _unit_vector(latitude, longitude)
+        angle = min(radius / EARTH_RADIUS, math.pi)
+        chord = 2 * math.sin(angle / 2)  # straight distance on a unit sphere
+        found = []
+        self._search_radius(self._tree, point, chord * chord, found)
+        return [self._locations[i] for _, i in sorted(found)]
+
+    def file_path(self, location):
+        """Get the path to the EPW file of a station of this catalog.
+
+        The station is matched by the station_id, latitude and longitude of the
+        Location such that copies of the Locations returned by this catalog can
+        also be used. If several EPW files are for the same station, the first
+        of their paths in sorted order is returned.
+
+        Args:
+            location: A Location object for a station of this catalog.
+        """
+        try:
+            return self._paths_by_key[_station_key(location)]
+        except KeyError:
+            raise ValueError('Location "{}" is not a station of this catalog.'.format(
+                location.city))
+
+    @staticmethod
+    def distance(latitude1, longitude1, latitude2, longitude2):
+        """Get the great-circle distance between two points in kilometers."""
+        point1 = _unit_vector(latitude1, longitude1)
+        point2 = _unit_vector(latitude2, longitude2)
+        chord = math.sqrt(sum((a - b) ** 2 for a, b in zip(point1, point2)))
+        return 2 * EARTH_RADIUS * math.asin(min(chord / 2, 1))
+
+    def _build_index(self):
+        """Build the Location objects and the k-d tree of the stations."""
+        paths = sorted(self._stations)
+        self._locations = tuple(Location.from_dict(dict(self._stations[path][1]))
+                                for path in paths)
+        self._file_paths = tuple(paths)
+        self._paths_by_key = {}
+        for loc, path in zip(self._locations, paths):
+            self._paths_by_key.setdefault(_station_key(loc), path)
+        points = [(_unit_vector(loc.latitude, loc.longitude), i)
+                  for i, loc in enumerate(self._locations)]
+        self._tree = self._build_tree(points, 0) if points else None
+
+    @staticmethod
+    def _build_tree(points, depth):
+        """Build a k-d tree node from a list of (point, index) tuples.
+
+        Each node is a tuple of (point, index, axis, left node, right node).
+        """
+        if not points:
+            return None
+        axis = depth % 3
+        points.sort(key=lambda p: p[0][axis])
+        mid = len(points) // 2
+        return (points[mid][0], points[mid][1], axis,
+                StationCatalog._build_tree(points[:mid], depth + 1),
+                StationCatalog._build_tree(points[mid + 1:], depth + 1))
+
+    @staticmethod
+    def _search_nearest(node, point, count, heap):
+        """Recursively find the count nearest points in a k-d tree."""
+        if node is None:
+            return
+        n_point, index, axis, left, right = node
+        dist = sum((a - b) ** 2 for a, b in zip(n_point, point))
+        if len(heap) < count:
+            heapq.heappush(heap, (-dist, index))
+        elif dist < -heap[0][0]:
+            heapq.heapreplace(heap, (-dist, index))
+        diff = point[axis] - n_point[axis]
+        near, far = (left, right) if diff < 0 else (right, left)
+        StationCatalog._search_nearest(near, point, count, heap)
+        if len(heap) < count or diff * diff < -heap[0][0]:
+            StationCatalog._search_nearest(far, point, count, heap)
+
+    @staticmethod
+    def _search_radius(node, point, max_dist, found):
+        """Recursively find all points of a k-d tree within a squared distance."""
+        if node is None:
+            return
+        n_point, index, axis, left, right = node
+        dist = sum((a - b) ** 2 for a, b in zip(n_point, point))
+        if dist <= max_dist:
+            found.append((dist, index))
+        diff = point[axis] - n_point[axis]
+        if diff < 0 or diff * diff <= max_dist:
+            StationCatalog._search_radius(left, point, max_dist, found)
+        if diff >= 0 or diff * diff <= max_dist:
+            StationCatalog._search_radius(right, point, max_dist, found)
+
+    def __len__(self):
+        return len(self._locations)
+
+    def __iter__(self):
+        return iter(self._locations)
+
+    def ToString(self):
+        """Overwrite .NET ToString method."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Station catalog representation."""
+        return 'Station Catalog ({} stations): {}'.format(
+            len(self._locations), self._folder)
+
+
+def _station_key(location):
+    """Get a tuple that identifies the station of a Location."""
+    return (location.station_id, location.latitude, location.longitude)
+
+
+def _unit_vector(latitude, longitude):
+    """Get the point on a unit sphere for a latitude and longitude in degrees."""
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    cos_lat = math.cos(lat)
+    return (cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat))
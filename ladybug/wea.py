@@ -18,7 +18,8 @@ from .datatype.illuminance import GlobalHorizontalIlluminance, \
 from .datatype.luminance import ZenithLuminance
 
 from .skymodel import ashrae_revised_clear_sky, ashrae_clear_sky, \
-    zhang_huang_solar_split, estimate_illuminance_from_irradiance
+    zhang_huang_solar_split, estimate_illuminance_from_irradiance_array
+from .skymatrix import cumulative_sky_matrix
 
 from ladybug_geometry.geometry3d.pointvector import Vector3D
 
@@ -71,6 +72,8 @@ class Wea(object):
         self._is_leap_year = is_leap_year
         assert isinstance(timestep, int), 'timestep must be an' \
             ' integer. Got {}'.format(type(timestep))
+        self._sun_cache = None  # (location key, altitudes, azimuths)
+        self._sky_matrix_cache = None  # (input values, {parameters: matrix})
 
         self.location = location
         self.direct_normal_irradiance = direct_normal_irradiance
@@ -497,6 +500,7 @@ class Wea(object):
             'direct_normal_irradiance data type must be' \
             'DirectNormalIrradiance. Got {}'.format(type(data.header.data_type))
         self._direct_normal_irradiance = data
+        self._sky_matrix_cache = None
 
     @property
     def diffuse_horizontal_irradiance(self):
@@ -514,23 +518,19 @@ class Wea(object):
             'direct_normal_irradiance data type must be' \
             'DiffuseHorizontalIrradiance. Got {}'.format(type(data.header.data_type))
         self._diffuse_horizontal_irradiance = data
+        self._sky_matrix_cache = None
 
     @property
     def global_horizontal_irradiance(self):
         """Returns the global horizontal irradiance at each timestep."""
-        analysis_period = AnalysisPeriod(timestep=self.timestep,
-                                         is_leap_year=self.is_leap_year)
+        analysis_period = AnalysisPeriod.interned(timestep=self.timestep,
+                                                  is_leap_year=self.is_leap_year)
         header_ghr = Header(data_type=GlobalHorizontalIrradiance(),
                             unit='W/m2',
                             analysis_period=analysis_period,
                             metadata=self.metadata)
-        glob_horiz = []
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        for dt, dnr, dhr in zip(self.datetimes, self.direct_normal_irradiance,
-                                self.diffuse_horizontal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            glob_horiz.append(dhr + dnr * math.sin(math.radians(sun.altitude)))
+        altitudes, _ = self._sun_positions()
+        glob_horiz = self._global_horizontal_values(altitudes)
         return HourlyContinuousCollection(header_ghr, glob_horiz)
 
     @property
@@ -539,18 +539,15 @@ class Wea(object):
 
         Note that this is different from the direct_normal_irradiance needed
         to construct a Wea, which is NORMAL and not HORIZONTAL."""
-        analysis_period = AnalysisPeriod(timestep=self.timestep,
-                                         is_leap_year=self.is_leap_year)
+        analysis_period = AnalysisPeriod.interned(timestep=self.timestep,
+                                                  is_leap_year=self.is_leap_year)
         header_dhr = Header(data_type=DirectHorizontalIrradiance(),
                             unit='W/m2',
                             analysis_period=analysis_period,
                             metadata=self.metadata)
-        direct_horiz = []
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        for dt, dnr in zip(self.datetimes, self.direct_normal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            direct_horiz.append(dnr * math.sin(math.radians(sun.altitude)))
+        altitudes, _ = self._sun_positions()
+        direct_horiz = [dnr * math.sin(math.radians(alt)) for dnr, alt in
+                        zip(self.direct_normal_irradiance, altitudes)]
         return HourlyContinuousCollection(header_dhr, direct_horiz)
 
     @property
@@ -624,67 +621,114 @@ class Wea(object):
             -   reflected_irradiance: A data collection of ground reflected solar
                 irradiance.
         """
-        # function to convert polar coordinates to xyz.
-        def pol2cart(phi, theta):
-            mult = math.cos(theta)
-            x = math.sin(phi) * mult
-            y = math.cos(phi) * mult
-            z = math.sin(theta)
-            return Vector3D(x, y, z)
-
         # convert the altitude and azimuth to a normal vector
-        normal = pol2cart(math.radians(azimuth), math.radians(altitude))
+        alt, azi = math.radians(altitude), math.radians(azimuth)
+        normal = Vector3D(math.sin(azi) * math.cos(alt), math.cos(azi) * math.cos(alt),
+                          math.sin(alt))
+        total, direct, diffuse, reflected = next(self.directional_irradiance_chunks(
+            [normal], ground_reflectance, isotrophic, output_collections=True))
+        return total[0], direct[0], diffuse[0], reflected[0]
+
+    def directional_irradiance_chunks(
+            self, normals, ground_reflectance=0.2, isotrophic=True, chunk_size=50,
+            output_collections=False):
+        """Get the irradiance components facing many directions, in chunks of normals.
+
+        The sun positions are computed only once for all of the normals. The
+        irradiance of each normal is then computed from the dot products between
+        the sun vectors and the normal (the product of the matrix of sun vectors
+        and the matrix of normals). Results are yielded for a chunk of normals at
+        a time such that the memory used is bounded by the chunk_size rather
+        than the total number of normals.
 
-        # create sunpath and get altitude at every timestep of the year
-        direct_irr, diffuse_irr, reflected_irr, total_irr = [], [], [], []
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        for dt, dnr, dhr in zip(self.datetimes, self.direct_normal_irradiance,
-                                self.diffuse_horizontal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            sun_vec = pol2cart(math.radians(sun.azimuth),
-                               math.radians(sun.altitude))
-            vec_angle = sun_vec.angle(normal)
-
-            # direct irradiance on surface
-            srf_dir = 0
-            if sun.altitude > 0 and vec_angle < math.pi / 2:
-                srf_dir = dnr * math.cos(vec_angle)
-
-            # diffuse irradiance on surface
-            if isotrophic:
-                srf_dif = dhr * ((math.sin(math.radians(altitude)) / 2) + 0.5)
-            else:
-                y = max(0.45, 0.55 + (0.437 * math.cos(vec_angle)) + 0.313 *
-                        math.cos(vec_angle) * 0.313 * math.cos(vec_angle))
-                srf_dif = self.dhr * (y * (
-                    math.sin(math.radians(abs(90 - altitude)))) +
-                    math.cos(math.radians(abs(90 - altitude))))
-
-            # reflected irradiance on surface.
-            e_glob = dhr + dnr * math.cos(math.radians(90 - sun.altitude))
-            srf_ref = e_glob * ground_reflectance * (0.5 - (math.sin(
-                math.radians(altitude)) / 2))
-
-            # add it all together
-            direct_irr.append(srf_dir)
-            diffuse_irr.append(srf_dif)
-            reflected_irr.append(srf_ref)
-            total_irr.append(srf_dir + srf_dif + srf_ref)
-
-        # create the headers
-        a_per = AnalysisPeriod(timestep=self.timestep, is_leap_year=self.is_leap_year)
-        direct_hea = diffuse_hea = reflected_hea = total_hea = \
-            Header(Irradiance(), 'W/m2', a_per, self.metadata)
-
-        # create the data collections
-        direct_irradiance = HourlyContinuousCollection(direct_hea, direct_irr)
-        diffuse_irradiance = HourlyContinuousCollection(diffuse_hea, diffuse_irr)
-        reflected_irradiance = HourlyContinuousCollection(reflected_hea, reflected_irr)
-        total_irradiance = HourlyContinuousCollection(total_hea, total_irr)
-
-        return total_irradiance, direct_irradiance, \
-            diffuse_irradiance, reflected_irradiance
+        Args:
+            normals: A list of Vector3D (or lists of three numbers) for the
+                directions in which irradiance is evaluated. They do not need
+                to be unit vectors.
+            ground_reflectance: A number between 0 and 1 that represents the
+                reflectance of the ground. (Default: 0.2).
+            isotrophic: A boolean value that sets whether an isotropic sky is
+                used (as opposed to an anisotropic sky). See the
+                directional_irradiance method for more information. (Default: True).
+            chunk_size: An integer for the number of normals for which results
+                are computed and yielded together. (Default: 50).
+            output_collections: Boolean to note whether the results for each
+                normal should be data collections (True) or lists with one value
+                for each timestep of the Wea (False). (Default: False).
+
+        Returns:
+            A generator with one item for each chunk of normals. Each item is a
+            tuple of four lists (total, direct, diffuse and reflected irradiance)
+            with the results of each normal in the chunk, in the order of normals.
+            So, for the lists of values, each of the four is a matrix with one row
+            per normal and one column per timestep.
+        """
+        assert chunk_size > 0, \
+            'chunk_size must be greater than 0. Got {}.'.format(chunk_size)
+        # compute the sun vectors and horizontal irradiance for all timesteps once
+        altitudes, azimuths = self._sun_positions()
+        dir_norm = self.direct_normal_irradiance.values
+        diff_horiz = self.diffuse_horizontal_irradiance.values
+        glob_horiz = self._global_horizontal_values(altitudes)
+        sun_vecs = []
+        for alt, azi in zip(altitudes, azimuths):
+            alt, azi = math.radians(alt), math.radians(azi)
+            sun_vecs.append((math.sin(azi) * math.cos(alt),
+                             math.cos(azi) * math.cos(alt), math.sin(alt)))
+        count = len(sun_vecs)
+        # index the timesteps with direct sun and with diffuse sky
+        direct_hours = [(i, sun_vecs[i], dir_norm[i]) for i in xrange(count)
+                        if altitudes[i] > 0 and dir_norm[i] != 0]
+        diffuse_hours = [(i, sun_vecs[i], diff_horiz[i]) for i in xrange(count)
+                         if diff_horiz[i] != 0]
+        zeros = [0] * count
+        if output_collections:
+            a_per = AnalysisPeriod.interned(
+                timestep=self.timestep, is_leap_year=self.is_leap_year)
+            header = Header(Irradiance(), 'W/m2', a_per, self.metadata)
+
+        for start in xrange(0, len(normals), chunk_size):
+            total_irr, direct_irr, diffuse_irr, reflected_irr = [], [], [], []
+            for normal in normals[start:start + chunk_size]:
+                n_x, n_y, n_z = normal
+                mag = math.sqrt(n_x * n_x + n_y * n_y + n_z * n_z)
+                n_x, n_y, n_z = n_x / mag, n_y / mag, n_z / mag
+
+                # direct irradiance on surface
+                srf_dir = zeros[:]
+                for i, (s_x, s_y, s_z), dnr in direct_hours:
+                    cos_inc = s_x * n_x + s_y * n_y + s_z * n_z
+                    if cos_inc > 0:
+                        srf_dir[i] = dnr * cos_inc
+
+                # diffuse irradiance on surface
+                if isotrophic:
+                    view_factor = n_z / 2 + 0.5
+                    srf_dif = [dhr * view_factor for dhr in diff_horiz]
+                else:
+                    srf_dif = zeros[:]
+                    sin_tilt = math.sqrt(max(0, 1 - n_z * n_z))
+                    for i, (s_x, s_y, s_z), dhr in diffuse_hours:
+                        cos_inc = s_x * n_x + s_y * n_y + s_z * n_z
+                        y = max(0.45, 0.55 + (0.437 * cos_inc) + 0.313 *
+                                cos_inc * 0.313 * cos_inc)
+                        srf_dif[i] = dhr * (y * sin_tilt + n_z)
+
+                # reflected irradiance on surface
+                ground_factor = ground_reflectance * (0.5 - n_z / 2)
+                srf_ref = [ghr * ground_factor for ghr in glob_horiz]
+
+                # add it all together
+                srf_tot = [d + df + r for d, df, r in zip(srf_dir, srf_dif, srf_ref)]
+                if output_collections:
+                    srf_tot, srf_dir, srf_dif, srf_ref = \
+                        (HourlyContinuousCollection(header, vals)
+                         for vals in (srf_tot, srf_dir, srf_dif, srf_ref))
+                total_irr.append(srf_tot)
+                direct_irr.append(srf_dir)
+                diffuse_irr.append(srf_dif)
+                reflected_irr.append(srf_ref)
+            yield total_irr, direct_irr, diffuse_irr, reflected_irr
 
     def estimate_illuminance_components(self, dew_point):
         """Get estimated direct, diffuse, and global illuminance from this Wea.
@@ -700,8 +744,8 @@ class Wea(object):
             Vol. 44. No. 5, pp. 271-289. USA.
 
         Args:
-            dew_point: An annual hourly data collection of dewpoint temperature
-                in degrees C. The timestep of this data collection and the presence
+            dew_point: An annual hourly data collection (or list) of dewpoint
+                temperature in degrees C. The timestep of this data and the presence
                 or lack of a leap year must align with this Wea.
 
         Returns:
@@ -722,23 +766,17 @@ class Wea(object):
             'Input dew_point data must be annual hourly and align with the irradiance' \
             ' on the Wea.'
 
-        # calculate illuminance values
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        gh_ill_values, dn_ill_values, dh_ill_values, zen_lum_values = [], [], [], []
-        for dt, dp, ghi, dni, dhi in zip(
-                self.datetimes, dew_point, self.global_horizontal_irradiance,
-                self.direct_normal_irradiance, self.diffuse_horizontal_irradiance):
-            alt = sp.calculate_sun_from_date_time(dt).altitude
-            gh, dn, dh, z = estimate_illuminance_from_irradiance(alt, ghi, dni, dhi, dp)
-            gh_ill_values.append(gh)
-            dn_ill_values.append(dn)
-            dh_ill_values.append(dh)
-            zen_lum_values.append(z)
+        # calculate the solar altitudes once and use them for all illuminance values
+        altitudes, _ = self._sun_positions()
+        gh_ill_values, dn_ill_values, dh_ill_values, zen_lum_values = \
+            estimate_illuminance_from_irradiance_array(
+                altitudes, self._global_horizontal_values(altitudes),
+                self.direct_normal_irradiance.values,
+                self.diffuse_horizontal_irradiance.values, list(dew_point))
 
         # create data collection headers for the results
-        analysis_period = AnalysisPeriod(timestep=self.timestep,
-                                         is_leap_year=self.is_leap_year)
+        analysis_period = AnalysisPeriod.interned(timestep=self.timestep,
+                                                  is_leap_year=self.is_leap_year)
         gh_ill_head = Header(data_type=GlobalHorizontalIlluminance(), unit='lux',
                              analysis_period=analysis_period, metadata=self.metadata)
         dn_ill_head = Header(data_type=DirectNormalIlluminance(), unit='lux',
@@ -756,6 +794,76 @@ class Wea(object):
 
         return global_horiz_ill, direct_normal_ill, diffuse_horizontal_ill, zenith_lum
 
+    def cumulative_sky_matrix(self, subdivisions=1, ground_reflectance=0.2,
+                              analysis_period=None):
+        """Get the cumulative direct and diffuse radiation of each sky patch.
+
+        This is a native alternative to writing the Wea to a file and running
+        Radiance gendaymtx on it. The sky is divided into Tregenza patches (or
+        Reinhart subdivisions of them) and the radiation of each timestep is
+        distributed to the patches with the Perez all-weather sky model. See the
+        skymatrix module for more information.
+
+        The results are cached on this Wea such that requesting the same matrix
+        again does not recompute it. The cache only holds the matrices of the
+        current irradiance values and sun positions. It is cleared as soon as
+        these change, including when the data collections of the Wea are edited
+        in place (eg. by setting their values).
+
+        Args:
+            subdivisions: An integer for the number of Reinhart subdivisions of
+                each Tregenza patch in each direction. 1 gives the 145 patches of
+                Tregenza, 2 gives 577 patches and 4 gives 2305 patches. (Default: 1).
+            ground_reflectance: A number between 0 and 1 for the reflectance of
+                the ground. (Default: 0.2).
+            analysis_period: An optional AnalysisPeriod to only sum the radiation
+                of the timesteps within it. The timestep and the presence or lack
+                of a leap year must align with this Wea. If None, the radiation
+                of the whole year is summed. (Default: None).
+
+        Returns:
+            A tuple with two tuples
+
+            -   direct: The cumulative direct radiation of each sky patch in kWh/m2.
+
+            -   diffuse: The cumulative diffuse radiation of each sky patch
+                in kWh/m2.
+
+            Each tuple has one value per sky patch followed by one value for the
+            reflected radiation of the ground, which is 0 in the direct tuple.
+        """
+        altitudes, azimuths = self._sun_positions()
+        dir_norm = self.direct_normal_irradiance.values
+        diff_horiz = self.diffuse_horizontal_irradiance.values
+        inputs = (self._sun_cache[0], tuple(dir_norm), tuple(diff_horiz))
+        if self._sky_matrix_cache is None or self._sky_matrix_cache[0] != inputs:
+            self._sky_matrix_cache = (inputs, {})  # drop the matrices of old inputs
+        matrices = self._sky_matrix_cache[1]
+        key = (subdivisions, ground_reflectance, analysis_period)
+        try:
+            return matrices[key]
+        except KeyError:
+            pass
+
+        datetimes = self.direct_normal_irradiance.datetimes
+        if analysis_period is None:
+            indices = None
+        else:
+            assert analysis_period.timestep == self.timestep, 'analysis_period ' \
+                'timestep must match that of the Wea. {} != {}'.format(
+                    analysis_period.timestep, self.timestep)
+            assert analysis_period.is_leap_year is self.is_leap_year, \
+                'analysis_period is_leap_year must match that of the Wea. ' \
+                '{} != {}'.format(analysis_period.is_leap_year, self.is_leap_year)
+            indices = [i for i, dt in enumerate(datetimes)
+                       if analysis_period.is_time_included(dt)]
+        direct, diffuse = cumulative_sky_matrix(
+            altitudes, azimuths, [dt.doy for dt in datetimes], dir_norm,
+            diff_horiz, subdivisions, ground_reflectance, self.timestep, indices)
+        matrix = (tuple(direct), tuple(diffuse))
+        matrices[key] = matrix
+        return matrix
+
     def to_dict(self):
         """Get the Wea as a dictionary."""
         return {
@@ -819,6 +927,28 @@ class Wea(object):
 
         return file_path
 
+    def _sun_positions(self):
+        """Get tuples of solar altitudes and azimuths in degrees for each datetime.
+
+        The positions are computed once and they are only computed again if the
+        coordinates or the time zone of the location change.
+        """
+        key = (self.location.latitude, self.location.longitude,
+               self.location.time_zone)
+        if self._sun_cache is None or self._sun_cache[0] != key:
+            sp = Sunpath.from_location(self.location)
+            sp.is_leap_year = self.is_leap_year
+            suns = [sp.calculate_sun_from_date_time(dt) for dt in self.datetimes]
+            self._sun_cache = (key, tuple(sun.altitude for sun in suns),
+                               tuple(sun.azimuth for sun in suns))
+        return self._sun_cache[1], self._sun_cache[2]
+
+    def _global_horizontal_values(self, altitudes):
+        """Get a list of global horizontal irradiance from a list of solar altitudes."""
+        return [dhr + dnr * math.sin(math.radians(alt)) for dnr, dhr, alt in
+                zip(self.direct_normal_irradiance, self.diffuse_horizontal_irradiance,
+                    altitudes)]
+
     @staticmethod
     def _get_datetimes(timestep, is_leap_year):
         """List of datetimes based on timestep.
@@ -836,7 +966,8 @@ class Wea(object):
     @staticmethod
     def _get_data_collections(dnr_values, dhr_values, metadata, timestep, is_leap_year):
         """Return two data collections for Direct Normal, Diffuse Horizontal."""
-        analysis_period = AnalysisPeriod(timestep=timestep, is_leap_year=is_leap_year)
+        analysis_period = AnalysisPeriod.interned(
+            timestep=timestep, is_leap_year=is_leap_year)
         dnr_header = Header(data_type=DirectNormalIrradiance(),
                             unit='W/m2',
                             analysis_period=analysis_period,
@@ -0,0 +1,59 @@
+# coding=utf-8
+"""Load the EPW, STAT and DDY files of a zipped weather data bundle.
+
+Weather data is usually distributed as a zip archive with an .epw, a .stat and
+a .ddy file for the same station. The load_weather_bundle function opens the
+archive once and parses each of these files directly from the compressed
+stream without extracting anything to disk.
+"""
+from __future__ import division
+
+import os
+import zipfile
+
+from .epw import EPW
+from .stat import STAT
+from .ddy import DDY
+from .futil import open_zip_member
+
+
+def load_weather_bundle(zip_path):
+    """Load the EPW, STAT and DDY files of a zip archive in one pass.
+
+    The data of the EPW is fully loaded. The file_path of each returned object
+    is the path to its file inside of the archive (e.g. c:/ladybug/bundle.zip/
+    USA_CO_Denver.epw), which can be used to load the file again later.
+
+    Args:
+        zip_path: Path to a zip archive of weather data files. If the archive
+            has more than one file of a given type, the first one is loaded.
+
+    Returns:
+        A tuple with three items:
+
+        -   epw: An EPW object for the .epw file of the archive. None if the
+            archive has no .epw file.
+
+        -   stat: A STAT object for the .stat file of the archive. None if the
+            archive has no .stat file.
+
+        -   ddy: A DDY object for the .ddy file of the archive. None if the
+            archive has no .ddy file.
+    """
+    assert os.path.isfile(zip_path), 'Cannot find a zip file at {}'.format(zip_path)
+    zip_path = os.path.normpath(zip_path)
+    epw, stat, ddy = None, None, None
+    with zipfile.ZipFile(zip_path) as zf:
+        for name in zf.namelist():
+            lower_name = name.lower()
+            file_path = os.path.normpath(os.path.join(zip_path, name))
+            if lower_name.endswith('.epw') and epw is None:
+                epw = EPW(file_path)
+                epw._import_data(file_obj=open_zip_member(zf, name))
+            elif lower_name.endswith('.stat') and stat is None:
+                stat = STAT(None)
+                stat._file_path = file_path
+                stat._import_data(file_obj=open_zip_member(zf, name))
+            elif lower_name.endswith('.ddy') and ddy is None:
+                ddy = DDY._from_ddy_file_obj(open_zip_member(zf, name), file_path)
+    return epw, stat, ddy
@@ -3,6 +3,7 @@ from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.dt import DateTime
 
 from datetime import timedelta
+import pickle
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
@@ -174,6 +175,17 @@ def test_duplicate():
     assert ap_2 == ap
 
 
+def test_pickle():
+    """Test that the analysis period pickles without its timestamps."""
+    ap = AnalysisPeriod(2, 28, 9, 3, 1, 17, 4, True)
+    ap.datetimes
+    new_ap = pickle.loads(pickle.dumps(ap))
+    assert new_ap == ap
+    assert new_ap._timestamps_data is None
+    assert new_ap.moys == ap.moys
+    assert not hasattr(new_ap, '__dict__')
+
+
 def test_0_end_hour():
     """Test hour 0 for end hour."""
     params = [1, 1, 1, 1, 2, 0]
@@ -191,3 +203,24 @@ def test_equality():
     assert ap_one is not ap_two
     assert hash(ap_one) == hash(ap_one_duplicate)
     assert hash(ap_one) != hash(ap_two)
+
+
+def test_interned():
+    """Test that interned analysis periods are shared instances."""
+    ap_one = AnalysisPeriod.interned()
+    assert ap_one is AnalysisPeriod.interned(1, 1, 0, 12, 31, 23, 1, False)
+    assert ap_one is AnalysisPeriod.interned(end_month=12)
+    assert ap_one == AnalysisPeriod()
+    assert ap_one is not AnalysisPeriod.interned(is_leap_year=True)
+    assert ap_one is not AnalysisPeriod.interned(timestep=4)
+    assert len(AnalysisPeriod.interned(timestep=4)) == 8760 * 4
+
+
+def test_shared_timestamps():
+    """Test that equal analysis periods share their timestamps."""
+    ap_one = AnalysisPeriod(2, 1, 0, 3, 1, 23)
+    ap_two = AnalysisPeriod(2, 1, 0, 3, 1, 23)
+    assert ap_one is not ap_two
+    assert ap_one.moys is ap_two.moys
+    assert ap_one.hoys == ap_two.hoys
+    assert isinstance(ap_one.moys, tuple)
@@ -0,0 +1,94 @@
+# coding=utf-8
+from ladybug.collectionexpression import CollectionExpression
+from ladybug.datacollection import HourlyContinuousCollection, \
+    HourlyDiscontinuousCollection, DailyCollection
+from ladybug.datacollectionimmutable import HourlyContinuousCollectionImmutable
+from ladybug.header import Header
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.dt import DateTime
+from ladybug.datatype.generic import GenericType
+from ladybug.datatype.temperature import Temperature
+
+import pytest
+
+
+def _continuous(values, a_per=AnalysisPeriod(6, 21, 0, 6, 22, 23)):
+    return HourlyContinuousCollection(Header(Temperature(), 'C', a_per), values)
+
+
+def test_lazy_expression():
+    """Test that lazy expressions give the same result as eager arithmetic."""
+    dbt = _continuous([x * 0.37 for x in range(48)])
+    dpt = _continuous([x * 0.11 - 2 for x in range(48)])
+    rh = _continuous([50 + x * 0.5 for x in range(48)])
+
+    expression = (dbt.lazy() * 1.8 + 32 - dpt) / rh
+    assert isinstance(expression, CollectionExpression)
+    eager = (dbt * 1.8 + 32 - dpt) / rh
+    result = expression.evaluate()
+    assert isinstance(result, HourlyContinuousCollection)
+    assert result.values == eager.values
+    assert result.header is eager.header is dbt.header
+    assert expression.values == eager.values
+    assert expression[3] == eager[3]
+    assert list(expression) == list(eager)
+    assert len(expression) == 48
+    assert expression.average == eager.average
+
+    assert (-dbt.lazy() * dbt - dpt).values == (-dbt * dbt - dpt).values
+    assert (dbt - dbt.lazy() * 2).values == (dbt - dbt * 2).values
+    assert (2 - dbt.lazy()).values == tuple(2 - v for v in dbt.values)
+    assert (1 / rh.lazy()).header is rh.header
+
+
+def test_lazy_expression_reads_values_on_evaluate():
+    """Test that the values of the collections are read upon evaluation."""
+    dbt = _continuous(list(range(48)))
+    expression = dbt.lazy() + 1
+    dbt[0] = 10
+    assert expression[0] == 11
+    dbt[0] = 20
+    assert expression[0] == 11
+    assert expression.evaluate()[0] == 21
+
+
+def test_lazy_expression_discontinuous_and_immutable():
+    """Test lazy expressions with discontinuous and immutable collections."""
+    header = Header(GenericType('Test Type', 'test'), 'test', AnalysisPeriod())
+    dts = [DateTime(6, 21, 12), DateTime(6, 21, 13), DateTime(6, 21, 14)]
+    coll = HourlyDiscontinuousCollection(header, [1, 2, 3], dts)
+    result = (coll.lazy() * coll + 1).evaluate()
+    assert isinstance(result, HourlyDiscontinuousCollection)
+    assert result.values == (2, 5, 10)
+    assert result.datetimes == coll.datetimes
+
+    immut = HourlyContinuousCollectionImmutable(
+        Header(Temperature(), 'C', AnalysisPeriod(6, 21, 0, 6, 21, 23)), range(24))
+    result = (immut.lazy() / 2).evaluate()
+    assert isinstance(result, HourlyContinuousCollectionImmutable)
+    assert result.values == (immut / 2).values
+
+
+def test_lazy_expression_broadcast():
+    """Test lazy expressions that broadcast coarser collections."""
+    dbt = _continuous([x * 0.5 for x in range(48)])
+    d_header = Header(Temperature(), 'C', AnalysisPeriod(6, 21, 0, 6, 22, 23))
+    daily = DailyCollection(d_header, [10, 20], [172, 173])
+    expression = dbt.lazy() - daily * 2
+    assert expression.values == (dbt - daily * 2).values
+    expression = dbt.lazy() - (daily.lazy() + daily)
+    assert expression.values == (dbt - (daily + daily)).values
+
+    with pytest.raises(AssertionError):
+        daily.lazy() + dbt
+    with pytest.raises(AssertionError):
+        dbt.lazy() + _continuous(list(range(24)), AnalysisPeriod(6, 21, 0, 6, 21, 23))
+
+
+def test_inplace_with_expression():
+    """Test that in-place operators on collections evaluate lazy expressions."""
+    dbt = _continuous(list(range(48)))
+    dpt = _continuous([1] * 48)
+    dpt += dbt.lazy() * 2
+    assert isinstance(dpt, HourlyContinuousCollection)
+    assert dpt.values == tuple(1 + x * 2 for x in range(48))
@@ -0,0 +1,192 @@
+# coding=utf-8
+from ladybug.collectiontable import CollectionTable
+from ladybug.datacollection import HourlyContinuousCollection, \
+    HourlyDiscontinuousCollection, DailyCollection, MonthlyCollection, \
+    MonthlyPerHourCollection
+from ladybug.header import Header
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.datatype.temperature import Temperature
+from ladybug.datatype.fraction import RelativeHumidity
+from ladybug.epw import EPW
+
+import pytest
+
+
+def test_init_collection_table():
+    """Test the init methods and properties of the CollectionTable."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    temp = HourlyContinuousCollection(
+        Header(Temperature(), 'C', a_per), list(range(24)))
+    rh = HourlyContinuousCollection(
+        Header(RelativeHumidity(), '%', a_per), list(range(50, 74)))
+    table = CollectionTable([temp, rh])
+
+    assert table.names == ('Temperature', 'Relative Humidity')
+    assert table.columns[0] is temp
+    assert table['Relative Humidity'] is rh
+    assert table[0] is temp
+    assert 'Temperature' in table
+    assert len(table) == 24
+    assert table.analysis_period == a_per
+    assert table.is_continuous
+    assert list(table.rows())[1] == (1, 51)
+
+    named_table = CollectionTable([temp, rh], ['t', 'rh'])
+    assert named_table['rh'] is rh
+    assert named_table.select(['rh']).columns == (rh,)
+    with pytest.raises(KeyError):
+        named_table['Temperature']
+    with pytest.raises(AssertionError):
+        CollectionTable([temp, rh], ['t', 't'])
+
+    unaligned = HourlyContinuousCollection(
+        Header(Temperature(), 'C', AnalysisPeriod(6, 22, 0, 6, 22, 23)),
+        list(range(24)))
+    with pytest.raises(ValueError):
+        CollectionTable([temp, unaligned])
+
+
+def test_filter_by_pattern():
+    """Test that filtering by a pattern filters all columns."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    temp = HourlyContinuousCollection(
+        Header(Temperature(), 'C', a_per), list(range(24)))
+    rh = HourlyContinuousCollection(
+        Header(RelativeHumidity(), '%', a_per), list(range(50, 74)))
+    table = CollectionTable([temp, rh])
+
+    filt_table = table.filter_by_pattern([True, False])
+    assert len(filt_table) == 12
+    assert filt_table[0].values == temp.filter_by_pattern([True, False]).values
+    assert filt_table[1].values == rh.filter_by_pattern([True, False]).values
+    assert isinstance(filt_table[1], HourlyDiscontinuousCollection)
+    assert filt_table[0].datetimes is filt_table[1].datetimes
+    assert filt_table.names == table.names
+
+
+def test_filter_by_conditional_statement():
+    """Test that filtering by a statement evaluates the rows once for all columns."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    temp = HourlyContinuousCollection(
+        Header(Temperature(), 'C', a_per), list(range(24)))
+    rh = HourlyContinuousCollection(
+        Header(RelativeHumidity(), '%', a_per), list(range(74, 50, -1)))
+    table = CollectionTable([temp, rh])
+
+    filt_table = table.filter_by_conditional_statement('a > 5 and b > 60')
+    expected = HourlyContinuousCollection.filter_collections_by_statement(
+        [temp, rh], 'a > 5 and b > 60')
+    assert filt_table[0].values == expected[0].values
+    assert filt_table[1].values == expected[1].values
+    assert filt_table[0].datetimes == expected[0].datetimes
+
+    filt_table = table.filter_by_conditional_statement('a > 20', ['Temperature'])
+    assert filt_table[0].values == (21, 22, 23)
+    assert filt_table[1].values == (53, 52, 51)
+
+    with pytest.raises(ValueError):
+        table.filter_by_conditional_statement('a > 5 and c > 60')
+
+
+def test_filter_by_analysis_period():
+    """Test that filtering by an analysis period matches that of each collection."""
+    a_per = AnalysisPeriod(6, 1, 0, 6, 30, 23)
+    temp = HourlyContinuousCollection(
+        Header(Temperature(), 'C', a_per), list(range(720)))
+    rh = HourlyContinuousCollection(
+        Header(RelativeHumidity(), '%', a_per), [x / 10 for x in range(720)])
+    table = CollectionTable([temp, rh])
+
+    day_per = AnalysisPeriod(6, 5, 0, 6, 10, 23)
+    filt_table = table.filter_by_analysis_period(day_per)
+    assert isinstance(filt_table[0], HourlyContinuousCollection)
+    assert filt_table[1].values == rh.filter_by_analysis_period(day_per).values
+    assert filt_table[0].header.analysis_period == day_per
+
+    annual = HourlyContinuousCollection(
+        Header(Temperature(), 'C', AnalysisPeriod()), list(range(8760)))
+    winter = AnalysisPeriod(12, 1, 0, 2, 28, 23)
+    filt_table = CollectionTable([annual, annual.duplicate()], ['a', 'b']) \
+        .filter_by_analysis_period(winter)
+    assert filt_table[1].values == annual.filter_by_analysis_period(winter).values
+
+    hour_per = AnalysisPeriod(6, 5, 9, 6, 10, 17)
+    filt_table = table.filter_by_analysis_period(hour_per)
+    expected = temp.filter_by_analysis_period(hour_per)
+    assert isinstance(filt_table[0], HourlyDiscontinuousCollection)
+    assert filt_table[0].values == expected.values
+    assert filt_table[1].values == rh.filter_by_analysis_period(hour_per).values
+    assert filt_table[0].datetimes == expected.datetimes
+    assert filt_table[0].header.analysis_period == hour_per
+    assert filt_table[0].datetimes is filt_table[1].datetimes
+
+    disc_table = filt_table.filter_by_analysis_period(AnalysisPeriod(6, 6, 12, 6, 6, 13))
+    assert disc_table[0].values == (132, 133)
+
+
+def test_daily_collection_table():
+    """Test a CollectionTable with daily collections."""
+    a_per = AnalysisPeriod(1, 1, 0, 1, 10, 23)
+    temp = DailyCollection(Header(Temperature(), 'C', a_per),
+                           list(range(10)), list(range(1, 11)))
+    rh = DailyCollection(Header(RelativeHumidity(), '%', a_per),
+                         list(range(10, 20)), list(range(1, 11)))
+    table = CollectionTable([temp, rh])
+
+    filt_table = table.filter_by_conditional_statement('a % 2 == 0')
+    assert isinstance(filt_table[0], DailyCollection)
+    assert filt_table[1].values == (10, 12, 14, 16, 18)
+    assert filt_table[1].datetimes == (1, 3, 5, 7, 9)
+
+    filt_table = table.filter_by_analysis_period(AnalysisPeriod(1, 3, 0, 1, 4, 23))
+    assert filt_table[0].values == (2, 3)
+    assert filt_table[1].datetimes == (3, 4)
+
+
+def test_monthly_collection_table_filter():
+    """Test filtering a CollectionTable of monthly collections by analysis period."""
+    a_per = AnalysisPeriod()
+    temp = MonthlyCollection(Header(Temperature(), 'C', a_per),
+                             list(range(12)), list(range(1, 13)))
+    rh = MonthlyCollection(Header(RelativeHumidity(), '%', a_per),
+                           list(range(20, 32)), list(range(1, 13)))
+    sum_per = AnalysisPeriod(6, 1, 0, 8, 31, 23)
+    filt_table = CollectionTable([temp, rh]).filter_by_analysis_period(sum_per)
+    assert isinstance(filt_table[0], MonthlyCollection)
+    assert filt_table[1].values == rh.filter_by_analysis_period(sum_per).values
+    assert filt_table[0].datetimes == (6, 7, 8)
+
+    m_per_h = [(m, h) for m in range(1, 13) for h in range(24)]
+    temp = MonthlyPerHourCollection(Header(Temperature(), 'C', a_per),
+                                    list(range(288)), m_per_h)
+    rh = MonthlyPerHourCollection(Header(RelativeHumidity(), '%', a_per),
+                                  list(range(288, 576)), m_per_h)
+    day_per = AnalysisPeriod(6, 1, 9, 6, 30, 17)
+    filt_table = CollectionTable([temp, rh]).filter_by_analysis_period(day_per)
+    expected = rh.filter_by_analysis_period(day_per)
+    assert filt_table[1].values == expected.values
+    assert tuple(tuple(d) for d in filt_table[1].datetimes) == \
+        tuple(tuple(d) for d in expected.datetimes)
+
+
+def test_epw_collection_table():
+    """Test getting a CollectionTable from an EPW without copying the data."""
+    epw = EPW('./tests/fixtures/epw/chicago.epw')
+    table = epw.to_collection_table()
+    assert len(table.columns) == 35
+    assert table['Dry Bulb Temperature'] is epw.dry_bulb_temperature
+    hot = table.filter_by_conditional_statement('g > 30')  # column 6 is dry bulb
+    assert len(hot.columns) == 35
+    assert hot['Relative Humidity'].values == \
+        epw.relative_humidity.filter_by_pattern(
+            [v > 30 for v in epw.dry_bulb_temperature]).values
+    with pytest.raises(ValueError):
+        table.filter_by_conditional_statement('a > 0', list(range(27)))
+
+    table = epw.to_collection_table([6, 8])
+    assert table.names == ('Dry Bulb Temperature', 'Relative Humidity')
+    assert len(table) == 8760
+    hot = table.filter_by_conditional_statement('a > 30')
+    assert hot[1].values == \
+        epw.relative_humidity.filter_by_pattern(
+            [v > 30 for v in epw.dry_bulb_temperature]).values
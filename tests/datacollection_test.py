@@ -9,13 +9,14 @@ from ladybug.header import Header
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.dt import DateTime
 from ladybug.datatype.generic import GenericType
-from ladybug.datatype.temperature import Temperature
+from ladybug.datatype.temperature import Temperature, PrevailingOutdoorTemperature
 from ladybug.datatype.fraction import RelativeHumidity, HumidityRatio
 
 from ladybug.epw import EPW
 from ladybug.psychrometrics import humid_ratio_from_db_rh
 
 import pytest
+import pickle
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
@@ -241,6 +242,72 @@ def test_operators_hourly_continuous():
     assert neg[0] == -v1
 
 
+def test_operators_broadcast():
+    """Test the operators between hourly collections and coarser collections."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    values = [i % 24 + (i // 744) for i in xrange(8760)]
+    dc1 = HourlyContinuousCollection(header, values)
+
+    monthly = dc1.average_monthly()
+    anomaly = dc1 - monthly
+    assert isinstance(anomaly, HourlyContinuousCollection)
+    assert len(anomaly) == 8760
+    assert anomaly[0] == values[0] - monthly[0]
+    assert anomaly[8759] == values[8759] - monthly[11]
+    assert anomaly[743] == values[743] - monthly[0]
+    assert anomaly[744] == values[744] - monthly[1]
+
+    profile = dc1.get_aligned_collection(1).average_monthly_per_hour() * 2
+    scaled = dc1 * profile
+    assert isinstance(scaled, HourlyContinuousCollection)
+    assert scaled.values == tuple(v * 2 for v in values)
+
+    daily = dc1.average_daily()
+    daily_anomaly = dc1 - daily
+    assert daily_anomaly[0] == values[0] - daily[0]
+    assert daily_anomaly[8759] == values[8759] - daily[364]
+    assert (dc1 + daily)[25] == values[25] + daily[1]
+    assert (dc1 / monthly)[800] == values[800] / monthly[1]
+
+    dc2 = dc1.filter_by_analysis_period(AnalysisPeriod(2, 1, 9, 2, 28, 17))
+    dc2_anomaly = dc2 - monthly
+    assert isinstance(dc2_anomaly, HourlyDiscontinuousCollection)
+    assert dc2_anomaly[0] == dc2[0] - monthly[1]
+
+    with pytest.raises(AssertionError):
+        dc1 - monthly.filter_by_months([1, 2])
+
+
+def test_inplace_operators():
+    """Test the in-place operators for mutable collections."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    dc1 = HourlyContinuousCollection(Header(Temperature(), 'C', a_per), [20] * 24)
+    dc2 = HourlyContinuousCollection(Header(Temperature(), 'C', a_per), [4] * 24)
+    dc1_original = dc1
+
+    dc1 += dc2
+    assert dc1 is dc1_original
+    assert dc1[0] == 24
+    dc1 -= 2
+    assert dc1 is dc1_original
+    assert dc1[0] == 22
+    dc1 *= dc2
+    assert dc1[0] == 88
+    dc1 /= 8
+    assert dc1 is dc1_original
+    assert dc1[0] == 11
+    assert isinstance(dc1, HourlyContinuousCollection)
+    assert dc2[0] == 4
+
+    dc3 = HourlyDiscontinuousCollection(
+        Header(Temperature(), 'C', a_per), [20, 25], a_per.datetimes[:2])
+    with pytest.raises(AssertionError):
+        dc3 += dc1
+    with pytest.raises(AssertionError):
+        dc1 -= dc3
+    assert dc1[0] == 11
+
+
 def test_setting_values():
     """Test the methods for setting values on the data collection"""
     header = Header(Temperature(), 'C', AnalysisPeriod())
@@ -337,6 +404,19 @@ def test_validate_a_period_hourly():
     assert dc1_new.validated_a_period
     assert dc1.header.analysis_period.timestep == 1
     assert dc1_new.header.analysis_period.timestep == 2
+    dt6 = DateTime(6, 21, 13, 20)
+    dc1 = HourlyDiscontinuousCollection(Header(Temperature(), 'C', a_per),
+                                        [v1, v2, v2], [dt6, dt3, dt2])
+    dc1_new = dc1.validate_analysis_period()
+    assert dc1_new.header.analysis_period.timestep == 6
+    assert dc1_new.datetimes == (dt3, dt2, dt6)
+
+    # Test that the validate method works with a single datetime.
+    dc1 = HourlyDiscontinuousCollection(Header(Temperature(), 'C', a_per),
+                                        [v1], [dt1])
+    dc1_new = dc1.validate_analysis_period()
+    assert dc1_new.validated_a_period
+    assert dc1_new.header.analysis_period == a_per
 
     # Test that the validate method correctly identifies leap years.
     dt4 = DateTime(2, 29, 12, leap_year=True)
@@ -825,6 +905,29 @@ def test_filter_by_hoys():
     assert filt_dc.datetimes[-1] == DateTime(3, 31, 17)
 
 
+def test_filter_by_moys_unordered():
+    """Test filter_by_moys method with unordered moys and other iterables."""
+    a_per = AnalysisPeriod(st_month=3, end_month=3)
+    header = Header(Temperature(), 'C', a_per)
+    values = list(xrange(24 * 31))
+    dc = HourlyDiscontinuousCollection(header, values, a_per.datetimes)
+    moys = list(reversed(AnalysisPeriod(3, 2, 9, 3, 3, 17).moys))
+    filt_dc = dc.filter_by_moys(moys)
+    assert len(filt_dc) == 2 * 9
+    assert filt_dc.datetimes[0] == DateTime(3, 2, 9)
+    assert filt_dc.datetimes[-1] == DateTime(3, 3, 17)
+    assert filt_dc.values == dc.filter_by_moys(set(moys)).values
+    assert filt_dc.values == dc.filter_by_moys(m for m in moys).values
+
+    daily_dc = dc.average_daily()
+    filt_daily = daily_dc.filter_by_doys(set([61, 62, 400]))
+    assert filt_daily.datetimes == (61, 62)
+
+    mph_dc = dc.average_monthly_per_hour()
+    filt_mph = mph_dc.filter_by_months_per_hour([[3, 1], (3, 2), (4, 2)])
+    assert filt_mph.datetimes == ((3, 1), (3, 2))
+
+
 def test_filter_by_hoys_continuous():
     """Test filter_by_hoys method."""
     header = Header(Temperature(), 'C', AnalysisPeriod(st_month=3, end_month=3))
@@ -1065,6 +1168,44 @@ def test_interpolate_holes():
     assert len(interp_coll2.values) == 24
 
 
+def test_interpolate_holes_max_gap():
+    """Test the interoplate holes method with a maximum gap."""
+    a_per = AnalysisPeriod(12, 31, 0, 1, 1, 23, timestep=2)
+    dts = [DateTime(12, 31, 1), DateTime(12, 31, 2), DateTime(12, 31, 22),
+           DateTime(1, 1, 0, 30), DateTime(1, 1, 22)]
+    vals = [0, 10, 20, 23, 40]
+    dc1 = HourlyDiscontinuousCollection(Header(Temperature(), 'C', a_per), vals, dts)
+    dc1 = dc1.validate_analysis_period()
+    assert dc1.header.analysis_period == a_per
+
+    interp_coll1 = dc1.interpolate_holes()
+    assert len(interp_coll1) == 96
+    assert interp_coll1.values[:3] == (0, 0, 0)
+    assert interp_coll1[3] == 5
+    assert interp_coll1[4] == 10
+    assert interp_coll1[44] == 20
+    assert interp_coll1[45] == pytest.approx(20.6, rel=1e-3)
+    assert interp_coll1[49] == 23
+    assert interp_coll1[92] == 40
+    assert interp_coll1.values[93:] == (40, 40, 40)
+
+    interp_coll2 = dc1.interpolate_holes(max_gap=2, gap_value=-999)
+    assert interp_coll2.values[:3] == (0, 0, 0)
+    assert interp_coll2[3] == 5
+    assert interp_coll2.values[5:44] == (-999,) * 39
+    assert interp_coll2[45] == pytest.approx(20.6, rel=1e-3)
+    assert interp_coll2.values[50:92] == (-999,) * 42
+    assert interp_coll2.values[93:] == (40, 40, 40)
+
+    interp_coll3 = dc1.interpolate_holes(max_gap=0.5, gap_value=-1)
+    assert interp_coll3.values[:2] == (-1, -1)
+    assert interp_coll3[3] == 5
+    assert interp_coll3[45] == -1
+    assert interp_coll3.bounds == (-1, 40)
+    with pytest.raises(AssertionError):
+        dc1.interpolate_holes(max_gap=0.5)
+
+
 def test_cull_to_timestep():
     """Test the test_cull_to_timestep method on the discontinuous collection."""
     a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
@@ -1099,6 +1240,127 @@ def test_interpolate_to_timestep():
     assert 'Minute' in interp_coll1.timestep_text
 
 
+def test_interpolate_to_timestep_shift():
+    """Test the interoplation method with data that is averaged over each hour."""
+    values = list(xrange(24))
+    test_header = Header(GenericType('Test Type', 'test', point_in_time=False),
+                         'test', AnalysisPeriod(end_month=1, end_day=1))
+    dc1 = HourlyContinuousCollection(test_header, values)
+
+    interp_coll = dc1.interpolate_to_timestep(4)
+    assert len(interp_coll) == 96
+    assert interp_coll.header.analysis_period.timestep == 4
+    assert interp_coll[2] == 0
+    assert interp_coll[3] == 0.25
+    assert interp_coll[6] == 1
+    assert interp_coll[0] == 11.5
+    assert interp_coll[1] == 5.75
+    assert interp_coll[94] == 23
+    assert interp_coll[95] == 17.25
+
+    interp_coll2 = interp_coll.interpolate_to_timestep(12)
+    assert len(interp_coll2) == 288
+    assert interp_coll2.header.analysis_period.timestep == 12
+
+
+def test_aggregate_to_timestep():
+    """Test the aggregation method on the continuous collection."""
+    values = list(xrange(96))
+    a_per = AnalysisPeriod(end_month=1, end_day=1, timestep=4)
+    dc1 = HourlyContinuousCollection(
+        Header(GenericType('Test Type', 'test'), 'test', a_per), values)
+
+    agg_coll1 = dc1.aggregate_to_timestep()
+    agg_coll2 = dc1.aggregate_to_timestep(2, True)
+    assert isinstance(agg_coll1, HourlyContinuousCollection)
+    assert len(agg_coll1) == 24
+    assert agg_coll1.header.analysis_period.timestep == 1
+    assert agg_coll1[0] == 1.5
+    assert agg_coll1[23] == 93.5
+    assert len(agg_coll2) == 48
+    assert agg_coll2.header.analysis_period.timestep == 2
+    assert agg_coll2[0] == 1
+    assert agg_coll2[1] == 5
+
+    with pytest.raises(AssertionError):
+        dc1.aggregate_to_timestep(3)
+
+    # check that aggregation reverses interpolation of cumulative data
+    dc2 = HourlyContinuousCollection(
+        Header(GenericType('Test Type', 'test'), 'test',
+               AnalysisPeriod(end_month=1, end_day=1)), list(xrange(24)))
+    interp_coll = dc2.interpolate_to_timestep(4, True)
+    agg_coll3 = interp_coll.aggregate_to_timestep(1, True)
+    assert agg_coll3[0] == pytest.approx(0.375, rel=1e-3)
+    assert agg_coll3.total == pytest.approx(dc2.total, rel=1e-3)
+
+
+def test_rolling():
+    """Test the rolling method on the continuous collection."""
+    values = [(i * 37) % 101 for i in xrange(8760)]
+    header = Header(Temperature(), 'C', AnalysisPeriod(), {'city': 'Boston'})
+    dc1 = HourlyContinuousCollection(header, values)
+
+    avg = dc1.rolling(24)
+    assert isinstance(avg, HourlyContinuousCollection)
+    assert avg.header.metadata['operation'] == '24 hour rolling average'
+    assert 'operation' not in dc1.header.metadata
+    assert avg[100] == pytest.approx(sum(values[77:101]) / 24, rel=1e-9)
+    assert avg[0] == pytest.approx(sum(values[-23:] + values[:1]) / 24, rel=1e-9)
+    total = dc1.rolling(3, 'total')
+    assert total[5] == sum(values[3:6])
+    assert total[1] == values[-1] + values[0] + values[1]
+
+    for stat, funct in (('max', max), ('min', min)):
+        roll = dc1.rolling(7, stat)
+        assert roll[0] == funct(values[-6:] + values[:1])
+        for i in (6, 500, 8759):
+            assert roll[i] == funct(values[i - 6:i + 1])
+
+    # test a collection that is not annual
+    dc2 = dc1.filter_by_analysis_period(AnalysisPeriod(3, 1, 0, 3, 31, 23))
+    avg2 = dc2.rolling(24)
+    assert avg2[0] == dc2[0]
+    assert avg2[1] == (dc2[0] + dc2[1]) / 2
+    assert avg2[30] == pytest.approx(sum(dc2.values[7:31]) / 24, rel=1e-9)
+    max2 = dc2.rolling(24, 'max')
+    assert max2[2] == max(dc2.values[:3])
+
+    with pytest.raises(ValueError):
+        dc1.rolling(24, 'median')
+    with pytest.raises(AssertionError):
+        dc2.rolling(10000)
+
+
+def test_exponential_running_mean():
+    """Test the exponential_running_mean method on the continuous collection."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(3, 1, 0, 3, 31, 23))
+    values = [20] * 24 + [10] * (24 * 30)
+    dc1 = HourlyContinuousCollection(header, values)
+    run_mean = dc1.exponential_running_mean(0.5)  # alpha is applied per day
+    assert run_mean[0] == 20
+    assert run_mean[23] == pytest.approx(20, rel=1e-9)
+    assert run_mean[47] == pytest.approx(15, rel=1e-9)
+    assert run_mean[71] == pytest.approx(12.5, rel=1e-9)
+    assert run_mean[-1] == pytest.approx(10, rel=1e-6)
+
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    dc2 = HourlyContinuousCollection(header, [10] * 8759 + [30])
+    run_mean = dc2.exponential_running_mean(0.5 ** 24)
+    assert run_mean[0] == pytest.approx(15, rel=1e-6)
+    assert run_mean.header.metadata['operation'] == 'exponential running mean'
+
+    # the time constant does not depend on the timestep of the collection
+    header = Header(Temperature(), 'C', AnalysisPeriod(3, 1, 0, 3, 31, 23, 4))
+    dc3 = HourlyContinuousCollection(header, [20] * 96 + [10] * (96 * 30))
+    assert dc3.exponential_running_mean(0.5)[191] == pytest.approx(15, rel=1e-9)
+
+    daily_temp = dc2.rolling(24).exponential_running_mean(
+        data_type=PrevailingOutdoorTemperature())
+    assert isinstance(daily_temp.header.data_type, PrevailingOutdoorTemperature)
+    assert daily_temp.header.unit == 'C'
+
+
 def test_is_collection_aligned():
     """Test the test_is_collection_aligned method for discontinuous collections."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -1266,6 +1528,50 @@ def test_dict_methods_continuous():
     assert dc_dict == reconstruced_dc.to_dict()
 
 
+def test_dict_methods_compact():
+    """Test the to/from dict methods with the compact encoding."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(2, 28, 0, 3, 1, 23, 4, True))
+    values = [x / 3 for x in xrange(len(header.analysis_period))]
+    dc = HourlyContinuousCollection(header, values)
+    dc_dict = dc.to_dict(compact=True)
+    assert dc_dict['values_format'] == 'float64'
+    reconstruced_dc = HourlyContinuousCollection.from_dict(dc_dict)
+    assert reconstruced_dc.values == dc.values
+    assert reconstruced_dc.header.analysis_period == header.analysis_period
+
+    dc_int = HourlyContinuousCollection(header, list(xrange(len(values))))
+    dc_dict = dc_int.to_dict(compact=True)
+    assert dc_dict['values_format'] == 'int32'
+    assert HourlyContinuousCollection.from_dict(dc_dict).values == dc_int.values
+
+    mixed = [x if x % 2 else x / 2 for x in xrange(len(values))]
+    mixed[3] = -2147483648
+    dc_mixed = HourlyContinuousCollection(header, mixed)
+    dc_dict = dc_mixed.to_dict(compact=True)
+    assert dc_dict['values_format'] == 'mixed64'
+    new_values = HourlyContinuousCollection.from_dict(dc_dict).values
+    assert new_values == dc_mixed.values
+    assert [type(v) for v in new_values] == [type(v) for v in mixed]
+    big_int = HourlyContinuousCollection(header, [2 ** 40] + mixed[1:])
+    assert big_int.to_dict(compact=True) == big_int.to_dict()
+
+    disc = dc.filter_by_pattern([True, False, False])
+    dc_dict = disc.to_dict(compact=True)
+    assert dc_dict['datetimes_format'] == 'moy'
+    reconstruced_dc = HourlyDiscontinuousCollection.from_dict(dc_dict)
+    assert reconstruced_dc.values == disc.values
+    assert reconstruced_dc.datetimes == disc.datetimes
+    assert reconstruced_dc.datetimes[-1].leap_year
+    assert reconstruced_dc.to_dict() == disc.to_dict()
+
+    daily = DailyCollection(header, [1.5, 2.5, 3.5], [59, 60, 61])
+    dc_dict = daily.to_dict(compact=True)
+    assert DailyCollection.from_dict(dc_dict).values == daily.values
+
+    text_coll = HourlyContinuousCollection(header, ['flag'] * len(values))
+    assert text_coll.to_dict(compact=True) == text_coll.to_dict()
+
+
 def test_filter_collections_by_statement():
     """Test the method to filter collections by conditional statement."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -1303,3 +1609,53 @@ def test_is_in_range_data_type():
     assert not dc2.is_in_data_type_range(raise_exception=False)
     assert dc3.is_in_data_type_range(raise_exception=False)
     assert not dc4.is_in_data_type_range(raise_exception=False)
+
+
+def test_pickle():
+    """Test that collections are pickled with compact state."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(2, 28, 0, 3, 1, 23, 2, True),
+                    {'city': 'Chicago'})
+    dc = HourlyContinuousCollection(header, [x / 3 for x in xrange(144)])
+    dc.datetimes
+    new_dc = pickle.loads(pickle.dumps(dc, 2))
+    assert isinstance(new_dc, HourlyContinuousCollection)
+    assert new_dc.values == dc.values
+    assert new_dc.header.analysis_period == header.analysis_period
+    assert new_dc.header.metadata == header.metadata
+    assert new_dc._datetimes is None
+    assert new_dc.datetimes == dc.datetimes
+
+    disc = dc.filter_by_pattern([True, False, False])
+    new_disc = pickle.loads(pickle.dumps(disc))
+    assert new_disc.values == disc.values
+    assert new_disc.datetimes == disc.datetimes
+    assert new_disc.validated_a_period == disc.validated_a_period
+
+    mixed = HourlyContinuousCollection(
+        header, [x if x % 3 else 0.5 for x in xrange(144)])
+    new_mixed = pickle.loads(pickle.dumps(mixed))
+    assert new_mixed.values == mixed.values
+    assert [type(v) for v in new_mixed] == [type(v) for v in mixed]
+
+    flags = HourlyContinuousCollection(header, ['?9'] * 144)
+    assert pickle.loads(pickle.dumps(flags)).values == flags.values
+    monthly = MonthlyCollection(header, [1, 2], [2, 3])
+    new_monthly = pickle.loads(pickle.dumps(monthly))
+    assert new_monthly.values == (1, 2)
+    assert new_monthly.datetimes == (2, 3)
+
+
+def test_slots():
+    """Test that collections do not have a __dict__ and still copy and pickle."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    colls = [HourlyContinuousCollection(header, list(xrange(24))),
+             DailyCollection(header, [1], [1]),
+             MonthlyCollection(header, [1], [1]),
+             MonthlyPerHourCollection(header, [1], [(1, 0)])]
+    colls.append(colls[0].filter_by_pattern([True, False]))
+    colls.extend([coll.to_immutable() for coll in colls])
+    for coll in colls:
+        assert not hasattr(coll, '__dict__')
+        assert coll.duplicate().values == coll.values
+        assert pickle.loads(pickle.dumps(coll)).values == coll.values
+        assert coll.__class__.from_dict(coll.to_dict()).values == coll.values
@@ -14,6 +14,7 @@ from ladybug.datatype.temperature import Temperature
 from ladybug.datatype.fraction import RelativeHumidity
 
 import pytest
+import pickle
 import sys
 if (sys.version_info >= (3, 0)):
     xrange = range
@@ -200,6 +201,25 @@ def test_monthly_per_hour():
     assert not dc4.is_mutable
 
 
+def test_inplace_operators():
+    """Test that in-place operators on immutable collections return new collections."""
+    a_per = AnalysisPeriod(6, 21, 0, 6, 21, 23)
+    dc1 = HourlyContinuousCollectionImmutable(
+        Header(Temperature(), 'C', a_per), [20] * 24)
+    dc1_original = dc1
+
+    dc1 += 2
+    assert dc1 is not dc1_original
+    assert isinstance(dc1, HourlyContinuousCollectionImmutable)
+    assert dc1[0] == 22
+    assert dc1_original[0] == 20
+    dc1 *= 2
+    dc1 -= 4
+    dc1 /= 2
+    assert dc1[0] == 20
+    assert not dc1.is_mutable
+
+
 def test_get_aligned_collection():
     """Test the method for getting an aligned discontinuous collection."""
     header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
@@ -247,3 +267,14 @@ def test_get_aligned_collection_continuous():
     assert dc4.header.unit == '%'
     assert isinstance(dc4, HourlyContinuousCollection)
     assert dc4.is_mutable
+
+
+def test_pickle():
+    """Test that immutable collections stay immutable when pickled."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    dc = HourlyContinuousCollectionImmutable(header, list(xrange(24)))
+    new_dc = pickle.loads(pickle.dumps(dc))
+    assert isinstance(new_dc, HourlyContinuousCollectionImmutable)
+    assert new_dc.values == dc.values
+    with pytest.raises(AttributeError):
+        new_dc[0] = 10
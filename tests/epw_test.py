@@ -308,6 +308,26 @@ def test_save_epw():
     os.remove(modified_path)
 
 
+def test_save_epw_unchanged():
+    """Test that saving an epw does not change its data collections."""
+    path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(path)
+    epw.convert_to_ip()
+    dbt_values = epw.dry_bulb_temperature.values
+    modified_path = './tests/fixtures/epw/chicago_modified.epw'
+    epw.save(modified_path)
+    assert epw.dry_bulb_temperature.values == dbt_values
+    assert epw.is_ip
+
+    EPW(path).save(modified_path)
+    with open(path) as orig_f, open(modified_path) as new_f:
+        orig_rows, new_rows = orig_f.readlines()[8:], new_f.readlines()[8:]
+    assert len(new_rows) == 8760
+    assert new_rows[0].split(',')[6] == orig_rows[0].split(',')[6]
+    assert new_rows[-1].split(',')[6] == orig_rows[-1].split(',')[6]
+    os.remove(modified_path)
+
+
 def test_save_epw_from_missing_values():
     """Test import custom epw with wrong types."""
     epw = EPW.from_missing_values()
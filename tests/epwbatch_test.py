@@ -0,0 +1,77 @@
+# coding=utf-8
+from ladybug.epwbatch import load_epws, epw_file_paths, EPWLoadResult, \
+    _load_bounded
+from ladybug.epw import EPW
+
+import os
+
+
+def _average_temperature(epw):
+    return epw.dry_bulb_temperature.average
+
+
+def test_epw_file_paths():
+    """Test getting EPW file paths from a folder and a glob pattern."""
+    folder = './tests/fixtures/epw'
+    paths = epw_file_paths(folder)
+    assert [os.path.basename(path) for path in paths] == ['chicago.epw', 'tokyo.epw']
+    assert epw_file_paths('./tests/fixtures/epw/tok*.epw') == paths[1:]
+    assert epw_file_paths(u'./tests/fixtures/epw') == paths  # unicode on python 2
+    assert epw_file_paths(['./tests/fixtures/epw/tokyo.epw']) == paths[1:]
+
+
+def test_load_epws():
+    """Test loading EPW files in parallel with a reduce function."""
+    paths = ['./tests/fixtures/epw/chicago.epw', './tests/fixtures/epw/tokyo.epw',
+             './tests/fixtures/epw/does_not_exist.epw']
+    progress = []
+
+    def callback(count, total, result):
+        progress.append((count, total))
+
+    results = list(load_epws(paths, _average_temperature, processes=2,
+                             progress_callback=callback))
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert all(isinstance(res, EPWLoadResult) for res in results)
+    results = {os.path.basename(res.file_path): res for res in results}
+    assert results['chicago.epw'].success
+    assert results['chicago.epw'].result == \
+        EPW(paths[0]).dry_bulb_temperature.average
+    assert results['tokyo.epw'].result == EPW(paths[1]).dry_bulb_temperature.average
+    assert not results['does_not_exist.epw'].success
+    assert results['does_not_exist.epw'].result is None
+    assert 'Cannot find an epw file' in results['does_not_exist.epw'].error
+
+
+def test_load_epws_serial():
+    """Test loading EPW objects in this process."""
+    results = list(load_epws('./tests/fixtures/epw', processes=1))
+    assert [os.path.basename(res.file_path) for res in results] == \
+        ['chicago.epw', 'tokyo.epw']
+    assert isinstance(results[0].result, EPW)
+    assert results[0].result.is_data_loaded
+    assert results[0].result.location.city == EPW(results[0].file_path).location.city
+
+
+class _SerialPool(object):
+    """A stand-in for a process pool that runs each task once it is submitted."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def apply_async(self, func, args, callback=None, error_callback=None):
+        self.submitted += 1
+        callback(func(*args))
+
+
+def test_load_bounded():
+    """Test that new chunks of files are only submitted as results are consumed."""
+    tasks = [('./tests/fixtures/epw/missing_{}.epw'.format(i), None)
+             for i in range(10)]
+    pool = _SerialPool()
+    results = _load_bounded(pool, tasks, 2, 3)
+    assert pool.submitted == 0
+    assert not next(results).success
+    assert pool.submitted == 4  # the window of 3 chunks and 1 to replace the first
+    assert len(list(results)) == 9
+    assert pool.submitted == 5
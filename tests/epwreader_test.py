@@ -0,0 +1,77 @@
+# coding=utf-8
+from ladybug.epwreader import EPWReader, EPWDataBlock
+from ladybug.epw import EPW
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.datacollection import HourlyContinuousCollection, \
+    HourlyDiscontinuousCollection
+
+import pytest
+
+
+def test_iter_chunks():
+    """Test that the chunks of the reader match the data of the EPW."""
+    path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(path)
+    reader = EPWReader(path)
+    assert reader.location.city == epw.location.city
+    assert reader.is_leap_year is False
+    assert reader.field_numbers == tuple(range(35))
+
+    blocks = list(reader.iter_chunks(1000))
+    assert len(blocks) == 9
+    assert all(isinstance(block, EPWDataBlock) for block in blocks)
+    assert [block.start for block in blocks] == list(range(0, 9000, 1000))
+    assert len(blocks[-1]) == 760
+    for field in range(35):
+        values = []
+        for block in blocks:
+            values.extend(block[field])
+        assert values == list(epw.import_data_by_field(field).values)
+
+
+def test_iter_chunks_fields():
+    """Test the reader with a subset of the fields."""
+    path = './tests/fixtures/epw/tokyo.epw'
+    epw = EPW(path)
+    reader = EPWReader(path, field_numbers=(8, 6, 5))
+    block = next(reader.iter_chunks())
+    assert len(block) == 168
+    assert block.columns[0].typecode == 'i'
+    assert block.columns[1].typecode == 'd'
+    assert list(block[6]) == list(epw.dry_bulb_temperature.values[:168])
+    assert block[5] == list(epw.import_data_by_field(5).values[:168])
+    with pytest.raises(ValueError):
+        block[7]
+    with pytest.raises(AssertionError):
+        EPWReader(path, field_numbers=(35,))
+
+    coll = block.to_collection(6)
+    assert isinstance(coll, HourlyDiscontinuousCollection)
+    assert coll.values == epw.dry_bulb_temperature.values[:168]
+    assert coll.datetimes == epw.dry_bulb_temperature.datetimes[:168]
+
+
+def test_iter_windows():
+    """Test that the windows of the reader match filtered EPW data."""
+    path = './tests/fixtures/epw/chicago.epw'
+    epw = EPW(path)
+    reader = EPWReader(path, field_numbers=(6, 21))
+    a_pers = (AnalysisPeriod(12, 1, 0, 2, 28, 23), AnalysisPeriod(6, 21, 9, 6, 30, 17),
+              AnalysisPeriod(1, 1, 0, 1, 1, 0))
+    windows = list(reader.iter_windows(a_pers, chunk_size=500))
+    assert [win.analysis_period for win in windows] == \
+        [a_pers[2], a_pers[1], a_pers[0]]
+    for window in windows:
+        a_per = window.analysis_period
+        assert len(window) == len(a_per)
+        for field in (6, 21):
+            expected = epw.import_data_by_field(field).filter_by_analysis_period(a_per)
+            coll = window.to_collection(field)
+            assert isinstance(coll, expected.__class__)
+            assert coll.values == expected.values
+            assert coll.header.analysis_period == a_per
+    assert isinstance(windows[0].to_collection(6), HourlyDiscontinuousCollection)
+    assert isinstance(windows[2].to_collection(6), HourlyContinuousCollection)
+
+    with pytest.raises(AssertionError):
+        list(reader.iter_windows([AnalysisPeriod(timestep=2)]))
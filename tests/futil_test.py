@@ -27,6 +27,24 @@ def test_unzip_file():
     futil.nukedir(folder)
 
 
+def test_zip_member_path():
+    """Test splitting paths inside of zip archives."""
+    wf_path = os.path.normpath("./tests/fixtures/zip/test.zip")
+    member_path = os.path.join(wf_path, "AUS_NSW.Sydney.947670_IWEC.epw")
+    assert futil.zip_member_path(member_path) == \
+        (wf_path, "AUS_NSW.Sydney.947670_IWEC.epw")
+    assert futil.zip_member_path(wf_path) == (None, None)
+    assert futil.zip_member_path("./tests/fixtures/epw/chicago.epw") == (None, None)
+    assert futil.is_compressed_path(member_path)
+    assert futil.is_compressed_path("./tests/fixtures/epw/chicago.epw.gz")
+    assert not futil.is_compressed_path("./tests/fixtures/epw/chicago.epw")
+    assert futil.compressed_file_exists(member_path)
+    assert not futil.compressed_file_exists(os.path.join(wf_path, "missing.epw"))
+
+    with futil.open_compressed_file(member_path) as epw_file:
+        assert epw_file.readline().startswith("LOCATION,SYDNEY")
+
+
 def test_copy_files_to_folder():
     """Test the copy file to folder capability"""
     existing_file = "./tests/fixtures/ddy/chicago.ddy"
@@ -3,9 +3,18 @@ from ladybug.psychrometrics import humid_ratio_from_db_rh, enthalpy_from_db_hr,
     wet_bulb_from_db_rh, dew_point_from_db_rh, rel_humid_from_db_hr, \
     rel_humid_from_db_enth, rel_humid_from_db_dpt, rel_humid_from_db_wb, \
     dew_point_from_db_hr, dew_point_from_db_enth, dew_point_from_db_wb, \
-    db_temp_from_enth_hr, dew_point_from_db_rh_fast, wet_bulb_from_db_rh_fast
+    db_temp_from_enth_hr, dew_point_from_db_rh_fast, wet_bulb_from_db_rh_fast, \
+    humid_ratio_from_db_wb, saturated_vapor_pressure, saturated_vapor_pressure_array, \
+    humid_ratio_from_db_rh_array, enthalpy_from_db_hr_array, \
+    dew_point_from_db_rh_array, wet_bulb_from_db_rh_array, \
+    rel_humid_from_db_hr_array, rel_humid_from_db_enth_array, \
+    rel_humid_from_db_dpt_array, rel_humid_from_db_wb_array, \
+    dew_point_from_db_hr_array, dew_point_from_db_enth_array, \
+    dew_point_from_db_wb_array, humid_ratio_from_db_wb_array, \
+    db_temp_from_enth_hr_array, LN_P_WS_TABLE_ERROR
 
 import pytest
+import math
 
 
 def test_humid_ratio_from_db_rh():
@@ -172,3 +181,74 @@ def test_wet_bulb_from_db_rh_fast():
     assert wet_bulb_from_db_rh_fast(-20, 0) == pytest.approx(-21.69, rel=1e-3)
     assert wet_bulb_from_db_rh_fast(-20, 50) == pytest.approx(-20.84, rel=1e-3)
     assert wet_bulb_from_db_rh_fast(-20, 100) == pytest.approx(-20, rel=1e-3)
+
+
+def test_array_functions():
+    """Test that the array functions match the functions for single values."""
+    db_temps = [-80, -20, -20, 0, 0.05, 20, 20, 30, 30, 180]
+    rel_humids = [10, 0, 50, 100, 75, 50, 100, 0, 50, 50]
+    b_press = [101325, 101325, 90000, 101325, 85000, 101325, 101325, 101325,
+               95000, 101325]
+
+    pws = saturated_vapor_pressure_array([t + 273.15 for t in db_temps])
+    for t, val in zip(db_temps, pws):
+        assert val == pytest.approx(saturated_vapor_pressure(t + 273.15), rel=1e-9)
+    dew_pts = dew_point_from_db_rh_array(db_temps, rel_humids)
+    for t, rh, val in zip(db_temps, rel_humids, dew_pts):
+        assert val == pytest.approx(dew_point_from_db_rh(t, rh), abs=0.1)
+    wet_bulbs = wet_bulb_from_db_rh_array(db_temps[1:-1], rel_humids[1:-1],
+                                          b_press[1:-1])
+    for t, rh, bp, val in zip(db_temps[1:], rel_humids[1:], b_press[1:], wet_bulbs):
+        assert val == pytest.approx(wet_bulb_from_db_rh(t, rh, bp), abs=0.1)
+
+    hrs = humid_ratio_from_db_rh_array(db_temps, rel_humids, b_press)
+    enths = enthalpy_from_db_hr_array(db_temps, hrs, -17.78)
+    for t, rh, bp, hr, enth in zip(db_temps, rel_humids, b_press, hrs, enths):
+        assert hr == pytest.approx(humid_ratio_from_db_rh(t, rh, bp), rel=1e-9)
+        assert enth == pytest.approx(enthalpy_from_db_hr(t, hr, -17.78), rel=1e-9)
+    assert rel_humid_from_db_hr_array(db_temps, hrs, b_press) == pytest.approx(
+        [rel_humid_from_db_hr(t, hr, bp) for t, hr, bp in zip(db_temps, hrs, b_press)])
+    assert rel_humid_from_db_enth_array(db_temps, enths, 90000, -17.78) == \
+        pytest.approx([rel_humid_from_db_enth(t, enth, 90000, -17.78)
+                       for t, enth in zip(db_temps, enths)])
+    assert db_temp_from_enth_hr_array(enths, hrs, -17.78) == pytest.approx(
+        [db_temp_from_enth_hr(enth, hr, -17.78) for enth, hr in zip(enths, hrs)])
+
+    assert rel_humid_from_db_dpt_array([30, -20], [18.4466, -27.0217]) == \
+        pytest.approx([50, 50], rel=1e-3)
+    assert rel_humid_from_db_wb_array([30, 20], [22.32, 13.7], 101325) == \
+        pytest.approx([rel_humid_from_db_wb(30, 22.32), rel_humid_from_db_wb(20, 13.7)])
+    assert humid_ratio_from_db_wb_array([30, -10], [22.32, -12]) == \
+        pytest.approx([humid_ratio_from_db_wb(30, 22.32),
+                       humid_ratio_from_db_wb(-10, -12)])
+    assert dew_point_from_db_hr_array([30], [0.01331]) == \
+        pytest.approx([dew_point_from_db_hr(30, 0.01331)], abs=0.1)
+    assert dew_point_from_db_enth_array([30], [64.18544]) == \
+        pytest.approx([dew_point_from_db_enth(30, 64.18544)], abs=0.1)
+    assert dew_point_from_db_wb_array([30], [22.32]) == \
+        pytest.approx([dew_point_from_db_wb(30, 22.32)], abs=0.1)
+
+
+def test_tabulated():
+    """Test the tabulated mode of the dew point and wet bulb functions."""
+    from ladybug.psychrometrics import _ln_p_ws_tabulated
+    for i in range(3001):
+        db_temp = -100 + i * 0.1
+        exact = math.log(saturated_vapor_pressure(db_temp + 273.15))
+        assert abs(_ln_p_ws_tabulated(db_temp) - exact) <= LN_P_WS_TABLE_ERROR + 1e-12
+
+    for db_temp in (-100, -80, -20, -0.05, 0, 0.05, 20, 30, 180, 200):
+        for rel_humid in (1, 10, 50, 99.9, 100):
+            assert dew_point_from_db_rh(db_temp, rel_humid, True) == \
+                pytest.approx(dew_point_from_db_rh(db_temp, rel_humid), abs=0.1)
+            if db_temp <= 60:
+                assert wet_bulb_from_db_rh(db_temp, rel_humid, 101325, True) == \
+                    pytest.approx(wet_bulb_from_db_rh(db_temp, rel_humid), abs=0.1)
+    assert dew_point_from_db_rh(30, 0, True) == -273.15
+    assert dew_point_from_db_rh(-150, 50, True) == dew_point_from_db_rh(-150, 50)
+    assert dew_point_from_db_rh(250, 50, True) == dew_point_from_db_rh(250, 50)
+    assert dew_point_from_db_rh_array([30, 20], [50, 50], True) == \
+        pytest.approx([18.4466, 9.27239], abs=0.1)
+    assert wet_bulb_from_db_rh_array([30, 20], [50, 50], 101325, True) == \
+        pytest.approx([wet_bulb_from_db_rh(30, 50), wet_bulb_from_db_rh(20, 50)],
+                      abs=0.1)
@@ -0,0 +1,72 @@
+# coding=utf-8
+from ladybug.sharedcollection import SharedCollection, shared_memory
+from ladybug.datacollection import HourlyContinuousCollection, \
+    HourlyDiscontinuousCollection
+from ladybug.header import Header
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.datatype.temperature import Temperature
+
+import pytest
+import pickle
+
+
+@pytest.mark.skipif(shared_memory is None, reason='requires shared_memory')
+def test_shared_collection():
+    """Test the SharedCollection values and pickling."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=2))
+    dc = HourlyContinuousCollection(header, [x / 4 for x in range(48)])
+    shared_dc = SharedCollection(dc)
+    try:
+        assert len(shared_dc) == 48
+        assert shared_dc.header is header
+        view = shared_dc.values
+        assert view[5] == 1.25
+        assert view.tolist() == list(dc.values)
+        view.release()
+
+        sent_dc = pickle.loads(pickle.dumps(shared_dc))
+        assert sent_dc.name == shared_dc.name
+        assert len(pickle.dumps(shared_dc)) < len(pickle.dumps(dc))
+        new_dc = sent_dc.to_collection()
+        assert isinstance(new_dc, HourlyContinuousCollection)
+        assert new_dc.values == dc.values
+        sent_dc.close()
+    finally:
+        shared_dc.close()
+        shared_dc.unlink()
+
+
+@pytest.mark.skipif(shared_memory is None, reason='requires shared_memory')
+def test_shared_collection_discontinuous():
+    """Test the SharedCollection with a discontinuous collection of integers."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=2))
+    dc = HourlyContinuousCollection(header, list(range(48)))
+    disc = dc.filter_by_pattern([True, False])
+    shared_dc = SharedCollection(disc)
+    try:
+        new_dc = shared_dc.to_collection()
+        assert isinstance(new_dc, HourlyDiscontinuousCollection)
+        assert new_dc.values == disc.values
+        assert new_dc.datetimes == disc.datetimes
+    finally:
+        shared_dc.close()
+        shared_dc.unlink()
+
+    with pytest.raises(AssertionError):
+        SharedCollection(HourlyContinuousCollection(header, ['?'] * 48))
+
+
+@pytest.mark.skipif(shared_memory is None, reason='requires shared_memory')
+def test_shared_collection_mixed():
+    """Test a SharedCollection of a mix of integers and floats."""
+    header = Header(Temperature(), 'C', AnalysisPeriod(end_month=1, end_day=1))
+    dc = HourlyContinuousCollection(header, [1, 2.5] * 12)
+    shared_dc = SharedCollection(dc)
+    try:
+        view = shared_dc.values
+        assert view.tolist() == list(dc.values)
+        view.release()
+        assert shared_dc.to_collection().values == dc.values
+    finally:
+        shared_dc.close()
+        shared_dc.unlink()
@@ -0,0 +1,70 @@
+# coding=utf-8
+from ladybug.skymatrix import sky_patch_rows, sky_patch_count, sky_patch_vectors, \
+    sky_patch_solid_angles, sky_patch_index, cumulative_sky_matrix
+
+import pytest
+import math
+
+
+def test_sky_patches():
+    """Test the Tregenza and Reinhart sky patches."""
+    for subdivisions, count in ((1, 145), (2, 577), (4, 2305)):
+        assert sky_patch_count(subdivisions) == count
+        rows = sky_patch_rows(subdivisions)
+        assert sum(row[2] for row in rows) == count
+        assert rows[0][0] == 0 and rows[-1] == (rows[-2][1], 90, 1)
+        vectors = sky_patch_vectors(subdivisions)
+        solid_angles = sky_patch_solid_angles(subdivisions)
+        assert len(vectors) == len(solid_angles) == count
+        assert sum(solid_angles) == pytest.approx(2 * math.pi, rel=1e-9)
+        for vec in vectors:
+            assert sum(v * v for v in vec) == pytest.approx(1, rel=1e-9)
+    assert sky_patch_rows(1)[0] == pytest.approx((0, 12, 30))
+    assert sky_patch_vectors(1)[0] == pytest.approx((0, math.cos(math.radians(6)),
+                                                     math.sin(math.radians(6))))
+    with pytest.raises(AssertionError):
+        sky_patch_count(0)
+
+
+def test_sky_patch_index():
+    """Test the index of the sky patch that contains a direction."""
+    assert sky_patch_index(5, 0) == 0
+    assert sky_patch_index(5, 359) == 0
+    assert sky_patch_index(5, 84) == 7
+    assert sky_patch_index(20, 180) == 45
+    assert sky_patch_index(89, 0) == 144
+    assert sky_patch_index(90, 0, 2) == 576
+    assert sky_patch_index(-5, 0) == 145
+    vectors = sky_patch_vectors(2)
+    for i in (0, 100, 300, 575):
+        x, y, z = vectors[i]
+        alt, azi = math.degrees(math.asin(z)), math.degrees(math.atan2(x, y))
+        assert sky_patch_index(alt, azi, 2) == i
+
+
+def test_cumulative_sky_matrix():
+    """Test that the cumulative sky matrix conserves the input radiation."""
+    altitudes = [-10, 30, 60, 10]
+    azimuths = [0, 120, 180, 250]
+    doys = [1, 100, 180, 300]
+    dni = [0, 800, 100, 300]
+    dhi = [20, 100, 300, 50]
+    direct, diffuse = cumulative_sky_matrix(
+        altitudes, azimuths, doys, dni, dhi, ground_reflectance=0.5)
+    assert len(direct) == len(diffuse) == 146
+    assert direct[-1] == 0
+    assert sum(direct) == pytest.approx(1.2, rel=1e-9)
+    assert direct[sky_patch_index(30, 120)] == pytest.approx(0.8, rel=1e-9)
+    vectors = sky_patch_vectors()
+    horiz_diffuse = sum(rad * vec[2] for rad, vec in zip(diffuse, vectors))
+    assert horiz_diffuse == pytest.approx(0.47, rel=1e-9)
+    ghi = sum(dh + dn * math.sin(math.radians(max(alt, 0)))
+              for alt, dn, dh in zip(altitudes, dni, dhi))
+    assert diffuse[-1] == pytest.approx(0.5 * ghi / 1000, rel=1e-9)
+
+    # the patches around the sun should be brighter than the opposite ones
+    sun_patch, opp_patch = sky_patch_index(60, 180), sky_patch_index(60, 0)
+    direct, diffuse = cumulative_sky_matrix(
+        altitudes, azimuths, doys, dni, dhi, indices=[2], timestep=2)
+    assert diffuse[sun_patch] > diffuse[opp_patch]
+    assert sum(direct) == pytest.approx(0.05, rel=1e-9)
@@ -1,6 +1,10 @@
 # coding=utf-8
 from ladybug.skymodel import estimate_illuminance_from_irradiance, \
-    dirint, disc, _get_dirint_coeffs
+    dirint, disc, _get_dirint_coeffs, disc_array, clearness_index_array, \
+    get_relative_airmass, get_relative_airmass_array, get_absolute_airmass_array, \
+    get_extra_radiation, get_extra_radiation_array, \
+    estimate_illuminance_from_irradiance_array, _dirint_coeff_indices, \
+    _DIRINT_COEFFS, perez_sky_coefficients
 
 import pytest
 import math
@@ -61,6 +65,16 @@ def test_dirint_coeffs():
     assert coeffs[3][2][6][3] == 1.032260
 
 
+def test_dirint_coeff_indices():
+    """Test the binning of values into the flat table of dirint coefficients."""
+    assert len(_DIRINT_COEFFS) == 6 * 6 * 7 * 5
+    coeffs = _get_dirint_coeffs()
+    indices = _dirint_coeff_indices(
+        [0, 0.3, 0.8, 1.5], [95, 55, 10, 20.5], [0.5, -1, 3, 2], [0, 0.2, -1, 0.3])
+    assert [_DIRINT_COEFFS[i] for i in indices] == [
+        coeffs[0][5][0][0], coeffs[1][1][4][4], coeffs[5][5][6][3], coeffs[5][3][5][2]]
+
+
 def test_disc():
     """Test the accuracy of the disc model against pvlib results."""
     disc_result = disc(1000, 80, 1)
@@ -81,3 +95,88 @@ def test_disc_overirradiance():
     assert disc_result[0] == pytest.approx(872.544, rel=1e-2)
     assert disc_result[1] == pytest.approx(1.000, rel=1e-3)
     assert disc_result[2] == pytest.approx(0.999493933, rel=1e-3)
+
+
+def test_array_functions():
+    """Test the array functions against values of the original scalar functions."""
+    altitudes = [-10, -0.5, 0, 0.5, 2, 3, 3.5, 10, 25.3, 45, 60, 89.9, 90]
+    doys = [1, 1, 45, 100, 172, 172, 200, 250, 300, 330, 355, 365, 365]
+    ghi = [0, 5, 10, 20, 35, 60, 100, 300, 500, 700, 900, 1100, 3000]
+    dni = [0, 0, 0, 5, 10, 30, 100, 400, 0, 500, 800, 950, 1000]
+    dhi = [0, 5, 10, 15, 25, 30, 0, 100, 500, 200, 100, 150, 200]
+    dew_point = [-20, -10, -5, 0, 3, 5, 10, 12, 15, 18, 20, 22, 25]
+    pressures = [101325, 90000, None, 95000, 101325, 100000, 98000, 101325,
+                 101325, 85000, 101325, 101325, 101325]
+
+    extra_ref = [1413.9818, 1413.9818, 1401.58, 1360.7898, 1321.6236, 1321.6236,
+        1321.7686, 1344.77, 1383.6362, 1403.5109, 1412.7086, 1413.9406, 1413.9406]
+    kt_ref = [0, 0.0544, 0.1098, 0.2261, 0.4074, 0.6984, 1.1639, 1.2847, 0.8456, 0.7053,
+        0.7356, 0.778, 2]
+    airmass_ref = {
+        'kastenyoung1989': [31.349, 19.4332, 15.1477, 13.5906, 5.586, 2.3302, 1.4126,
+            1.154, 0.9997, 0.9997],
+        'kasten1966': [30.9972, 19.5399, 15.2188, 13.6433, 5.5803, 2.328, 1.4119, 1.1536,
+            0.9995, 0.9995],
+        'pickering2002': [31.7423, 19.6427, 15.2618, 13.6727, 5.5807, 2.3284, 1.4124,
+            1.1541, 1, 1],
+        'youngirvine1967': [-1691.0113, 0.4573, 10.7592, 11.1259, 5.5365, 2.3274, 1.4125,
+            1.1542, 1, 1],
+        'young1994': [27.144, 18.0629, 14.433, 13.0579, 5.5407, 2.3259, 1.4121, 1.1541,
+            1, 1],
+        'gueymard1993': [31.4595, 19.5069, 15.1772, 13.6073, 5.5808, 2.3298, 1.4128,
+            1.1543, 1, 1],
+    }
+    abs_am_ref = [None, None, 33.6814, 27.8452, 17.2612, 13.4547, 12.0716, 4.9617,
+        2.0697, 1.2547, 1.025, 0.888, 0.888]
+    disc_dni_ref = [0, 0, 0, 0, 0, 0, 277.4625, 492.3734, 889.4205, 660.1589, 765.4393,
+        848.2804, 933.2577]
+    disc_kt_ref = [0, 0, 0, 0, 0, 0, 1, 1, 0.8432, 0.7033, 0.7335, 0.7758, 1]
+    disc_am_ref = [None, None, None, None, None, None, 12, 5.5803, 2.328, 1.1844, 1.1536,
+        0.9995, 0.9995]
+    ill_gh_ref = [0, 0, 0, 2191.0465, 3841.5703, 6601.892, 12497.9726, 30021.5513,
+        50756.9679, 78946.0077, 100894.5424, 123381.9118, 346307.2613]
+    ill_dn_ref = [0, 0, 0, 185.8865, 452.0829, 1480.9593, 6208.4883, 23616.0789, 0,
+        44236.5769, 86070.3992, 103339.5849, 105956.7275]
+    ill_dh_ref = [0, 0, 0, 1687.3047, 2816.5735, 3395.1741, 20.5318, 13227.5881,
+        51164.8714, 29037.9966, 13431.8732, 18966.3694, 25712.6496]
+    ill_z_ref = [0, 0, 0, 298.5031, 502.1525, 625.9469, 4.296, 1976.3872, 6053.8701,
+        5588.1619, 3918.6653, 20297.2631, 32019.7054]
+
+    extra = get_extra_radiation_array(doys)
+    assert extra == pytest.approx(extra_ref, abs=1e-4)
+    assert clearness_index_array(ghi, altitudes, extra) == \
+        pytest.approx(kt_ref, abs=1e-4)
+    for model, model_ref in airmass_ref.items():
+        assert get_relative_airmass_array(altitudes[3:], model) == \
+            pytest.approx(model_ref, abs=1e-4)
+    rel_am = get_relative_airmass_array(altitudes)
+    assert get_absolute_airmass_array(rel_am, 90000) == \
+        pytest.approx(abs_am_ref, abs=1e-4)
+
+    disc_dni, disc_kt, disc_am = disc_array(ghi, altitudes, doys, pressures)
+    assert disc_dni == pytest.approx(disc_dni_ref, abs=1e-4)
+    assert disc_kt == pytest.approx(disc_kt_ref, abs=1e-4)
+    assert disc_am == pytest.approx(disc_am_ref, abs=1e-4)
+    gh_ill, dn_ill, dh_ill, z_lum = estimate_illuminance_from_irradiance_array(
+        altitudes, ghi, dni, dhi, dew_point)
+    assert gh_ill == pytest.approx(ill_gh_ref, abs=1e-4)
+    assert dn_ill == pytest.approx(ill_dn_ref, abs=1e-4)
+    assert dh_ill == pytest.approx(ill_dh_ref, abs=1e-4)
+    assert z_lum == pytest.approx(ill_z_ref, abs=1e-4)
+
+    with pytest.raises(ValueError):
+        get_relative_airmass_array(altitudes, 'not_a_model')
+
+
+def test_perez_sky_coefficients():
+    """Test the coefficients of the Perez all-weather sky model."""
+    extra = get_extra_radiation(172)
+    # an overcast sky is brighter at the zenith than at the horizon
+    a, b, c, d, e = perez_sky_coefficients(40, 0, 200, extra)
+    assert 1 + a * math.exp(b) > 1 + a * math.exp(b / 0.1)
+    assert perez_sky_coefficients(40, 0, 200, extra, get_relative_airmass(40)) == \
+        (a, b, c, d, e)
+    # a clear sky is brighter at the horizon and around the sun
+    a, b, c, d, e = perez_sky_coefficients(60, 900, 80, extra)
+    assert 1 + a * math.exp(b) < 1 + a * math.exp(b / 0.1)
+    assert c > 10 and d < 0
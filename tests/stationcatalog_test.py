@@ -0,0 +1,75 @@
+# coding=utf-8
+from ladybug.stationcatalog import StationCatalog
+from ladybug.location import Location
+
+import os
+import shutil
+import pytest
+
+
+def _station_folder():
+    folder = './tests/fixtures/epw/stations'
+    if os.path.isdir(folder):
+        shutil.rmtree(folder)
+    os.makedirs(os.path.join(folder, 'japan'))
+    shutil.copy('./tests/fixtures/epw/chicago.epw', folder)
+    shutil.copy('./tests/fixtures/epw/tokyo.epw', os.path.join(folder, 'japan'))
+    return folder
+
+
+def test_station_catalog():
+    """Test nearest and radius queries of a station catalog."""
+    folder = _station_folder()
+    try:
+        catalog = StationCatalog(folder)
+        assert len(catalog) == 2
+        assert all(isinstance(loc, Location) for loc in catalog.locations)
+
+        nearest = catalog.nearest(41.88, -87.63)  # downtown chicago
+        assert len(nearest) == 1
+        assert nearest[0].city.startswith('Chicago')
+        assert catalog.file_path(nearest[0]).endswith('chicago.epw')
+        assert catalog.file_path(nearest[0].duplicate()).endswith('chicago.epw')
+        assert catalog.file_paths[0] == catalog.file_path(catalog.locations[0])
+        nearest = catalog.nearest(35.68, 139.69, count=5)  # tokyo
+        assert [loc.city for loc in nearest] == \
+            [catalog.locations[1].city, catalog.locations[0].city]
+
+        assert len(catalog.within_radius(41.88, -87.63, 50)) == 1
+        assert len(catalog.within_radius(41.88, -87.63, 20000)) == 2
+        assert catalog.within_radius(0, 0, 100) == []
+        with pytest.raises(ValueError):
+            catalog.file_path(Location())
+
+        dist = StationCatalog.distance(41.98, -87.92, 35.68, 139.77)
+        assert dist == pytest.approx(10130, rel=1e-2)
+    finally:
+        shutil.rmtree(folder)
+
+
+def test_station_catalog_update():
+    """Test that a saved station catalog is updated incrementally."""
+    folder = _station_folder()
+    catalog_file = os.path.join(folder, 'stations.json')
+    try:
+        catalog = StationCatalog(folder, catalog_file)
+        assert os.path.isfile(catalog_file)
+        assert len(catalog) == 2
+
+        new_catalog = StationCatalog(folder, catalog_file)
+        assert len(new_catalog) == 2
+        assert new_catalog.update() == 0
+
+        new_path = os.path.join(folder, 'chicago_copy.epw')
+        shutil.copy('./tests/fixtures/epw/chicago.epw', new_path)
+        old_location = new_catalog.nearest(41.88, -87.63)[0]
+        assert new_catalog.update() == 1
+        assert len(new_catalog) == 3
+        assert len(set(new_catalog.file_paths)) == 3
+        assert new_catalog.file_path(old_location).endswith('chicago.epw')
+        os.remove(new_path)
+        assert new_catalog.update() == 0
+        assert len(new_catalog) == 2
+        assert len(StationCatalog(folder, catalog_file)) == 2
+    finally:
+        shutil.rmtree(folder)
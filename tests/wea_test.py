@@ -2,6 +2,10 @@
 from ladybug.wea import Wea
 from ladybug.location import Location
 from ladybug.epw import EPW
+from ladybug.sunpath import Sunpath
+from ladybug.skymodel import estimate_illuminance_from_irradiance
+from ladybug.skymatrix import sky_patch_vectors
+from ladybug.analysisperiod import AnalysisPeriod
 
 import pytest
 import os
@@ -247,6 +251,83 @@ def test_directional_irradiance():
     assert srf_reflect.values == pytest.approx([0] * 8760, rel=1e-3)
 
 
+def test_directional_irradiance_chunks():
+    """Test the directional irradiance of many normals in chunks."""
+    stat_path = './tests/fixtures/stat/chicago.stat'
+    wea_from_stat = Wea.from_stat_file(stat_path)
+    normals = [(0, 0, 1), (0, -1, 0), (2, 0, 0), (0, 1, -1), (0, 0, -1)]
+
+    chunks = list(wea_from_stat.directional_irradiance_chunks(normals, chunk_size=2))
+    assert len(chunks) == 3
+    assert [len(chunk[0]) for chunk in chunks] == [2, 2, 1]
+    total, direct, diffuse, reflected = (sum((chunk[i] for chunk in chunks), [])
+                                         for i in range(4))
+    assert len(total) == 5 and len(total[0]) == 8760
+    for i, (alt, azi) in enumerate(((90, 180), (0, 180), (0, 90), (-45, 0), (-90, 0))):
+        srf_total, srf_direct, srf_diffuse, srf_reflect = \
+            wea_from_stat.directional_irradiance(alt, azi)
+        assert total[i] == pytest.approx(srf_total.values, abs=1e-6)
+        assert direct[i] == pytest.approx(srf_direct.values, abs=1e-6)
+        assert diffuse[i] == pytest.approx(srf_diffuse.values, abs=1e-6)
+        assert reflected[i] == pytest.approx(srf_reflect.values, abs=1e-6)
+    assert max(direct[4]) == 0
+
+    chunk = next(wea_from_stat.directional_irradiance_chunks(
+        normals[1:2], isotrophic=False, output_collections=True))
+    srf_total, srf_direct, srf_diffuse, srf_reflect = (comp[0] for comp in chunk)
+    assert srf_total.values == pytest.approx(
+        [d + df + r for d, df, r in zip(srf_direct, srf_diffuse, srf_reflect)])
+    assert srf_diffuse.max > 0
+
+
+def test_cumulative_sky_matrix():
+    """Test the cumulative sky matrix of a Wea."""
+    wea = Wea.from_epw_file('./tests/fixtures/epw/chicago.epw')
+    direct, diffuse = wea.cumulative_sky_matrix()
+    assert len(direct) == len(diffuse) == 146
+    assert wea.cumulative_sky_matrix() is wea.cumulative_sky_matrix()
+    altitudes, _ = wea._sun_positions()
+    assert sum(direct) == pytest.approx(sum(
+        dnr for dnr, alt in zip(wea.direct_normal_irradiance, altitudes)
+        if alt > 0) / 1000, rel=1e-9)
+    horiz_diffuse = sum(rad * vec[2] for rad, vec in zip(diffuse, sky_patch_vectors()))
+    assert horiz_diffuse == pytest.approx(
+        wea.diffuse_horizontal_irradiance.total / 1000, rel=1e-9)
+
+    summer = AnalysisPeriod(6, 1, 0, 8, 31, 23)
+    winter = AnalysisPeriod(12, 1, 0, 2, 28, 23)
+    s_direct, s_diffuse = wea.cumulative_sky_matrix(analysis_period=summer)
+    w_direct, w_diffuse = wea.cumulative_sky_matrix(analysis_period=winter)
+    assert 0 < sum(s_direct) < sum(direct)
+    assert sum(w_direct) < sum(s_direct)
+    assert wea.cumulative_sky_matrix(analysis_period=summer) is \
+        wea.cumulative_sky_matrix(analysis_period=summer)
+    with pytest.raises(AssertionError):
+        wea.cumulative_sky_matrix(analysis_period=AnalysisPeriod(timestep=2))
+
+    # the matrix is recomputed when the irradiance is edited in place
+    wea.direct_normal_irradiance.values = [0] * 8760
+    assert sum(wea.cumulative_sky_matrix()[0]) == 0
+    wea.direct_normal_irradiance[4000] = 500  # a daytime hour in June
+    assert sum(wea.cumulative_sky_matrix()[0]) == pytest.approx(0.5, rel=1e-9)
+    assert len(wea._sky_matrix_cache[1]) == 1  # old matrices are dropped
+    wea.diffuse_horizontal_irradiance[4000] = -1.0
+    ground = wea.cumulative_sky_matrix()[1][-1]
+    wea.diffuse_horizontal_irradiance[4000] = -2.0  # same hash as the -1.0 values
+    assert wea.cumulative_sky_matrix()[1][-1] == pytest.approx(ground - 0.0002)
+
+    # the cache is cleared when the irradiance is set
+    matrix = wea.cumulative_sky_matrix(2)
+    assert len(matrix[0]) == 578
+    wea.diffuse_horizontal_irradiance = wea.diffuse_horizontal_irradiance * 2
+    assert wea.cumulative_sky_matrix(2) is not matrix
+    vectors = sky_patch_vectors(2)
+    horiz_diffuse = sum(rad * vec[2] for rad, vec in
+                        zip(wea.cumulative_sky_matrix(2)[1], vectors))
+    assert horiz_diffuse == pytest.approx(
+        2 * sum(rad * vec[2] for rad, vec in zip(matrix[1], vectors)), rel=1e-9)
+
+
 def test_estimate_illuminance():
     """Test the directinal irradiance method."""
     epw_path = './tests/fixtures/epw/chicago.epw'
@@ -265,6 +346,22 @@ def test_estimate_illuminance():
     assert zen_lum.bounds[0] == pytest.approx(0, rel=1e-3)
     assert zen_lum.bounds[1] < 35000
 
+    # check that night hours are zero and day hours match the single-value function
+    sp = Sunpath.from_location(wea.location)
+    assert glob_ill[0] == dir_ill[0] == diff_ill[0] == zen_lum[0] == 0
+    noon = 12 * 24 + 12
+    altitude = sp.calculate_sun_from_date_time(wea.datetimes[noon]).altitude
+    expected = estimate_illuminance_from_irradiance(
+        altitude, wea.global_horizontal_irradiance[noon],
+        wea.direct_normal_irradiance[noon], wea.diffuse_horizontal_irradiance[noon],
+        epw.dew_point_temperature[noon])
+    assert (glob_ill[noon], dir_ill[noon], diff_ill[noon], zen_lum[noon]) == \
+        pytest.approx(expected, rel=1e-9)
+
+    # a plain list of dew point temperatures is also accepted
+    list_ill = wea.estimate_illuminance_components(list(epw.dew_point_temperature))
+    assert list_ill[0].values == glob_ill.values
+
 
 def test_leap_year():
     """Test clear sky with leap year."""
@@ -0,0 +1,60 @@
+# coding=utf-8
+from ladybug.weatherbundle import load_weather_bundle
+from ladybug.epw import EPW
+from ladybug.stat import STAT
+from ladybug.ddy import DDY
+
+import os
+import gzip
+import shutil
+import pytest
+
+
+def test_load_weather_bundle():
+    """Test loading all of the files of a zipped weather bundle."""
+    wf_path = './tests/fixtures/zip/test.zip'
+    epw, stat, ddy = load_weather_bundle(wf_path)
+    assert isinstance(epw, EPW)
+    assert epw.is_data_loaded
+    assert len(epw.dry_bulb_temperature) == 8760
+    assert epw.location.city == 'SYDNEY'
+    assert isinstance(stat, STAT)
+    assert stat.location.city == 'SYDNEY'
+    assert isinstance(ddy, DDY)
+    assert len(ddy.design_days) > 0
+    assert ddy.location.city.upper().startswith('SYDNEY')
+
+    # check that each file path inside the archive can be loaded again
+    new_epw = EPW(epw.file_path)
+    assert new_epw.dry_bulb_temperature.values == epw.dry_bulb_temperature.values
+    assert new_epw.location.latitude == epw.location.latitude
+    assert STAT(stat.file_path).ashrae_climate_zone == stat.ashrae_climate_zone
+    assert len(DDY.from_ddy_file(ddy.file_path).design_days) == len(ddy.design_days)
+
+    with pytest.raises(AssertionError):
+        EPW(os.path.join(wf_path, 'missing.epw')).location
+
+
+def test_read_gzipped_files():
+    """Test reading gzipped epw, stat and ddy files."""
+    gz_paths = []
+    paths = ('./tests/fixtures/epw/chicago.epw', './tests/fixtures/stat/chicago.stat',
+             './tests/fixtures/ddy/chicago.ddy')
+    for path in paths:
+        gz_path = path + '.gz'
+        with open(path, 'rb') as f_in, gzip.open(gz_path, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        gz_paths.append(gz_path)
+    try:
+        epw = EPW(gz_paths[0])
+        orig_epw = EPW('./tests/fixtures/epw/chicago.epw')
+        assert epw.dry_bulb_temperature.values == orig_epw.dry_bulb_temperature.values
+        assert epw.location.city == orig_epw.location.city
+        stat = STAT(gz_paths[1])
+        assert stat.location.city == STAT(paths[1]).location.city
+        ddy = DDY.from_ddy_file(gz_paths[2])
+        assert len(ddy.design_days) == \
+            len(DDY.from_ddy_file(paths[2]).design_days)
+    finally:
+        for gz_path in gz_paths:
+            os.remove(gz_path)